@@ -1,112 +1,63 @@
-import torch
 import numpy as np
 import pickle, json, time, re, sys, os
-from DG import Graph, Node
+from DG import Graph, Node, CSRGraph, NODE_TYPES, TYPE_ID, OP_NAMES, OP_ID, get_op
 import networkx as nx
 
 
-def get_node_pwr(name, node:Node, g:nx.DiGraph, node_dict):
-        fanout = g.in_degree(name)
-        if not node.tr:
-            node.tr = 0.2
-
-        if node.type in ['Reg']:
-            type_weight = 1
-        elif node.type in ['Pointer', 'Partselect']:
-            if g.node_dict[node.father].type in ['Reg']:
-                type_weight = 1
-        elif node.type in ['Operator', 'Mux', 'UnaryOperator']:
-            op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', name)
-            op = op_temp[0][0]
-            if op in ['Mux', 'Cond']:
-                type_weight = 0.84
-            elif op in ['And']:
-                type_weight = 1
-            elif op in ['Or']:
-                type_weight = 1
-            elif op in ['Ulnot', 'Unot']:
-                type_weight = 0.58
-            elif op in ['Xor']:
-                type_weight = 0.79
-        else:
-             print(node.type)
+OP_WEIGHT = {'Mux': 0.84, 'Cond': 0.84, 'And': 1, 'Or': 1, 'Ulnot': 0.58, 'Unot': 0.58, 'Xor': 0.79}
+
+def node_sum(a, mask):
+        ### summed one node after the other in node order, like the original loop,
+        ### so the floats come out bit for bit the same
+        a = a[mask]
+        return float(np.cumsum(a)[-1]) if len(a) else 0
+
+def cal_oper_pwr(g):
+        ### the node by node power features, on the column arrays; Pointer and
+        ### Partselect nodes only count towards tr_io_sum, as in the original loop
+        if not isinstance(g, CSRGraph):
+            g = CSRGraph.from_graph(g)
+        in_g = g.in_graph & (g.type >= 0)
+        width = g.width.astype(np.int64)
+        tr = np.where(np.isnan(g.tr) | (g.tr == 0), 0.2, g.tr)
+        fanout = np.clip(g.in_degree(), 1, 20)
+        io_type = g.type_mask('Output', 'Input', 'Inout')
+
+        seq_num = int(width[in_g & g.type_mask('Reg')].sum())
+        io_num = int(width[in_g & io_type].sum())
+        comb = in_g & g.type_mask('Operator', 'UnaryOperator', 'Concat', 'Repeat') & (g.op >= 0)
+        op_num = np.bincount(g.op[comb], minlength=len(OP_NAMES))
+        and_num = int(op_num[OP_ID['And']])
+        or_num = int(op_num[OP_ID['Or']])
+        not_num = int(op_num[OP_ID['Ulnot']] + op_num[OP_ID['Unot']])
+        xor_num = int(op_num[OP_ID['Xor']])
+        mux_num = int(op_num[OP_ID['Cond']] + op_num[OP_ID['Mux']])
+        comb_num = and_num + or_num + not_num + xor_num + mux_num
+
+        father_type = np.where(g.father >= 0, g.type[g.father], -1)
+        sel = in_g & g.type_mask('Pointer', 'Partselect')
+        io_node = (in_g & io_type) | (sel & np.isin(father_type, [TYPE_ID[t] for t in ('Input', 'Output', 'Inout')]))
+        tr_io_sum = node_sum(tr, io_node)
+
+        node = in_g & ~g.type_mask('Wire', 'Constant', 'Concat', 'Input', 'Output', 'Inout', 'Pointer', 'Partselect')
+        op_weight = np.full(len(OP_NAMES) + 1, np.nan)
+        for op, w in OP_WEIGHT.items():
+            op_weight[OP_ID[op]] = w
+        type_weight = np.full(len(g), np.nan)
+        type_weight[g.type_mask('Reg')] = 1
+        oper = g.type_mask('Operator', 'Mux', 'UnaryOperator')
+        type_weight[oper] = op_weight[g.op[oper]]
+        bad = node & np.isnan(type_weight)
+        if bad.any():
+             i = np.flatnonzero(bad)[0]
+             print(NODE_TYPES[g.type[i]], OP_NAMES[g.op[i]] if g.op[i] >= 0 else None)
              assert False
-        
-        if fanout > 20:
-            fanout = 20
-        elif fanout == 0:
-            fanout = 1
-        
-        pred_dyn_pwr = node.tr*fanout*type_weight
+        num_node = int(node.sum())
+        tr_sum = node_sum(tr, node)
+        pred_pwr1 = node_sum(tr*fanout*type_weight, node)
+        pred_pwr2 = node_sum(tr*fanout, node)
+        fanout_sum = int(fanout[node].sum())
 
-        pred_dyn_pwr2 = node.tr*fanout
-        
-        return pred_dyn_pwr, pred_dyn_pwr2, fanout
-
-def cal_oper_pwr(g:Graph):
-        num_node = 0
-        tr_sum = 0
-        tr_io_sum = 0
-        g_nx = nx.DiGraph(g.graph)
-        pred_pwr1, pred_pwr2, fanout_sum = 0, 0, 0
-        seq_num = 0
-        comb_num = 0
-        io_num = 0
-        and_num, or_num, not_num, xor_num, mux_num= 0, 0, 0, 0, 0
-        for name, node in g.node_dict.items():
-            node_type = node.type
-            width = node.width
-            if not g_nx.has_node(name):
-                continue
-            if node_type in ['Reg']:
-                seq_num += width
-            elif node_type in ['Operator', 'UnaryOperator', 'Concat', 'Repeat']:
-                op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', name)
-                op = op_temp[0][0]
-                if op in ['And']:
-                      and_num += 1
-                      comb_num += 1
-                elif op in ['Or']:
-                      or_num += 1
-                      comb_num += 1
-                elif op in ['Ulnot', 'Unot']:
-                      not_num += 1
-                      comb_num += 1
-                elif op in ['Xor']:
-                      xor_num += 1
-                      comb_num += 1
-                elif op in ['Cond', 'Mux']:
-                      mux_num += 1
-                      comb_num += 1
-            elif node_type in ['Output', 'Input', 'Inout']:
-                  io_num += width
-        for name, node in g.node_dict.items():
-            if not g_nx.has_node(name):
-                continue
-            elif node.type in ['Wire', 'Constant', 'Concat']:
-                continue
-            elif node.type in ['Input', 'Output', 'Inout']:
-                if not node.tr:
-                    node.tr = 0.2
-                tr_io_sum += node.tr
-            elif node.type in ['Pointer', 'Partselect']:
-                if node.father not in g.node_dict:
-                    continue
-                elif g.node_dict[node.father].type in ['Wire']:
-                    continue
-                elif g.node_dict[node.father].type in ['Input', 'Output', 'Inout']:
-                    if not node.tr:
-                        node.tr = 0.2
-                    tr_io_sum += node.tr
-            else:
-                num_node += 1
-                if not node.tr:
-                    node.tr = 0.2
-                tr_sum += node.tr
-                pred_node_pwr, pred_node_pwr2, fanout = get_node_pwr(name, node, g_nx, g.node_dict)
-                pred_pwr1 += pred_node_pwr
-                pred_pwr2 += pred_node_pwr2
-                fanout_sum += fanout
         total_cell_num = seq_num + comb_num + io_num
         if total_cell_num == 0:
             total_cell_num = 1 
@@ -123,15 +74,19 @@ def cal_oper_pwr(g:Graph):
 def run_one_design(design_name, module_name, out_path):
         cmd = 'sog'
 
-        folder_dir = f'../../example/module/{design_name}/'
-        with open(f'{folder_dir}/{module_name}_{cmd}.pkl', 'rb') as f:
-                graph = pickle.load(f)
-        folder_dir = f'../../example/power_dag/'
-        with open(f'{folder_dir}/{module_name}_{cmd}_node_dict_propagated.pkl', 'rb') as f:
-                node_dict = pickle.load(f)
+        csr_dir = f'../../example/power_dag/{module_name}_{cmd}_propagated.csr'
+        if os.path.isdir(csr_dir):
+                g = CSRGraph.load(csr_dir)
+        else:
+                folder_dir = f'../../example/module/{design_name}/'
+                with open(f'{folder_dir}/{module_name}_{cmd}.pkl', 'rb') as f:
+                        graph = pickle.load(f)
+                folder_dir = f'../../example/power_dag/'
+                with open(f'{folder_dir}/{module_name}_{cmd}_node_dict_propagated.pkl', 'rb') as f:
+                        node_dict = pickle.load(f)
 
-        g = Graph()
-        g.init_graph(graph, node_dict)
+                g = Graph()
+                g.init_graph(graph, node_dict)
         feat_vec = cal_oper_pwr(g)
         vec_name = out_path + f'/{design_name}_{cmd}_vec_module_pwr.json'
         with open(vec_name, 'w') as f:
@@ -0,0 +1,118 @@
+import glob, os, pickle
+import networkx as nx
+import pytest
+from DG import Graph, get_op, OP_ID
+from feature_extra_module_pwr import cal_oper_pwr, OP_WEIGHT
+
+
+def scalar_pwr(g:Graph):
+    ### the networkx loop cal_oper_pwr replaced: Pointer/Partselect nodes only
+    ### add to tr_io_sum, register bits are skipped
+    g_nx = nx.DiGraph(g.graph)
+    io_type = ['Input', 'Output', 'Inout']
+    seq_num, io_num = 0, 0
+    op_num = {op: 0 for op in OP_WEIGHT}
+    tr_io_sum, tr_sum, num_node = 0, 0, 0
+    pred_pwr1, pred_pwr2, fanout_sum = 0, 0, 0
+    for name, node in g.node_dict.items():
+        if not g_nx.has_node(name):
+            continue
+        if node.type == 'Reg':
+            seq_num += node.width
+        elif node.type in ['Operator', 'UnaryOperator', 'Concat', 'Repeat']:
+            if get_op(node) in op_num:
+                op_num[get_op(node)] += 1
+        elif node.type in io_type:
+            io_num += node.width
+    for name, node in g.node_dict.items():
+        if not g_nx.has_node(name):
+            continue
+        tr = node.tr if node.tr else 0.2
+        if node.type in ['Wire', 'Constant', 'Concat']:
+            continue
+        elif node.type in io_type:
+            tr_io_sum += tr
+        elif node.type in ['Pointer', 'Partselect']:
+            if node.father not in g.node_dict:
+                continue
+            elif g.node_dict[node.father].type in io_type:
+                tr_io_sum += tr
+        else:
+            type_weight = 1 if node.type == 'Reg' else OP_WEIGHT[get_op(node)]
+            fanout = min(max(g_nx.in_degree(name), 1), 20)
+            num_node += 1
+            tr_sum += tr
+            pred_pwr1 += tr * fanout * type_weight
+            pred_pwr2 += tr * fanout
+            fanout_sum += fanout
+
+    and_num, or_num, xor_num = op_num['And'], op_num['Or'], op_num['Xor']
+    not_num = op_num['Ulnot'] + op_num['Unot']
+    mux_num = op_num['Cond'] + op_num['Mux']
+    comb_num = and_num + or_num + not_num + xor_num + mux_num
+    total_cell_num = max(seq_num + comb_num + io_num, 1)
+    num_node = max(num_node, 1)
+    return [pred_pwr1, pred_pwr2, fanout_sum,
+            io_num, seq_num, comb_num, total_cell_num, io_num/total_cell_num,
+            and_num, or_num, not_num, xor_num, mux_num,
+            tr_io_sum, tr_sum, tr_sum/num_node]
+
+
+def small_graph():
+    g = Graph()
+    g.add_decl_node('a', 'Input', 4)
+    g.add_decl_node('a.PTR0', 'Pointer', 1, 'a')
+    g.add_decl_node('y', 'Output', 1)
+    g.add_decl_node('r', 'Reg', 4)
+    g.add_decl_node('r.PTR1', 'Pointer', 1, 'r')
+    g.add_decl_node('r.PS3_2', 'Partselect', 2, 'r')
+    g.add_decl_node('w', 'Wire', 1)
+    g.add_decl_node('Constant0', 'Constant', 1)
+    for i, op in enumerate(['And', 'Or', 'Xor', 'Cond', 'Mux']):
+        g.add_decl_node(op + str(i), 'Operator', 1, op=OP_ID[op])
+    g.add_decl_node('Unot5', 'UnaryOperator', 1, op=OP_ID['Unot'])
+    g.add_decl_node('Concat6', 'Concat', 0, op=OP_ID['Concat'])
+    g.node_dict['r.PTR1'].tr = 0.5
+    g.node_dict['And0'].tr = 0.1
+    edges = [('y', 'And0'), ('And0', 'a.PTR0'), ('And0', 'r.PTR1'), ('Or1', 'r.PS3_2'), ('Or1', 'w'),
+             ('Xor2', 'Or1'), ('Xor2', 'Constant0'), ('Cond3', 'Xor2'), ('Cond3', 'r.PTR1'),
+             ('Mux4', 'Cond3'), ('Unot5', 'Mux4'), ('Concat6', 'Unot5'), ('Concat6', 'r.PTR1'),
+             ('r', 'Concat6'), ('w', 'a'), ('r', 'r.PTR1'), ('r', 'r.PS3_2')]
+    for u, v in edges:
+        g.add_edge(u, v)
+    return g
+
+
+def test_small_graph():
+    g = small_graph()
+    assert cal_oper_pwr(g) == scalar_pwr(g)
+
+
+def test_register_bits():
+    ### r.PTR1 and r.PS3_2 are bits of the register r and must not change the features
+    g = small_graph()
+    feat = cal_oper_pwr(g)
+    g.node_dict['r.PTR1'].tr = 0.9
+    g.add_decl_node('r.PTR0', 'Pointer', 1, 'r')
+    g.add_edge('Or1', 'r.PTR0')
+    g.add_edge('r', 'r.PTR0')
+    feat2 = cal_oper_pwr(g)
+    assert feat2 == scalar_pwr(g)
+    assert feat2[:3] + feat2[13:] == feat[:3] + feat[13:]
+
+
+module_dir = os.path.join(os.path.dirname(__file__), '../../example/module/TinyRocket')
+power_dir = os.path.join(os.path.dirname(__file__), '../../example/power_dag')
+modules = sorted(os.path.basename(p)[:-len('_sog_node_dict_propagated.pkl')]
+                 for p in glob.glob(f'{power_dir}/*_sog_node_dict_propagated.pkl'))
+
+
+@pytest.mark.parametrize('module_name', modules)
+def test_example_modules(module_name):
+    with open(f'{module_dir}/{module_name}_sog.pkl', 'rb') as f:
+        graph = pickle.load(f)
+    with open(f'{power_dir}/{module_name}_sog_node_dict_propagated.pkl', 'rb') as f:
+        node_dict = pickle.load(f)
+    g = Graph()
+    g.init_graph(graph, node_dict)
+    assert cal_oper_pwr(g) == scalar_pwr(g)
@@ -1,23 +1,39 @@
 from train_path_rfr import train_rfr
 from logicGraph import *
 import pickle, json, time, os, sys
-from DG import Node
+from DG import Node, CSRGraph
 from graph_stat import cal_timing
 
 
 
 
  
-def run_one_design(design_name, cmd, out_path):
+def run_one_design(design_name, cmd, out_path, delay_model=None, exact=False):
         folder_dir = '../../example/timing_dag'
-        with open(f'{folder_dir}/{design_name}_{cmd}.pkl', 'rb') as f:
-                graph = pickle.load(f)
-        with open(f'{folder_dir}/{design_name}_{cmd}_node_dict_init.pkl', 'rb') as f:
-                node_dict = pickle.load(f)
-        graph = nx.to_dict_of_lists(graph)
-
-        g = Graph()
-        g.init_graph(graph, node_dict)
+        csr_dir = f'{folder_dir}/{design_name}_{cmd}_init.csr'
+        if os.path.isdir(csr_dir):
+                g = CSRGraph.load(csr_dir)
+        else:
+                with open(f'{folder_dir}/{design_name}_{cmd}.pkl', 'rb') as f:
+                        graph = pickle.load(f)
+                with open(f'{folder_dir}/{design_name}_{cmd}_node_dict_init.pkl', 'rb') as f:
+                        node_dict = pickle.load(f)
+                if not isinstance(graph, dict):
+                        graph = nx.to_dict_of_lists(graph)
+
+                g = Graph()
+                g.init_graph(graph, node_dict)
+        if delay_model:
+                ### node delays of another model saved by delay_propagation
+                if not isinstance(g, CSRGraph):
+                        g = CSRGraph.from_graph(g)
+                delay = np.load(f'{folder_dir}/{design_name}_{cmd}_delay/{delay_model}.npy', allow_pickle=False)
+                if delay.shape != (g.num_nodes,):
+                        raise ValueError(f'delays of model {delay_model} do not match the graph')
+                g.delay[:] = delay
+        suffix = f'_{delay_model}' if delay_model else ''
+        ### exact paths do not match the shipped models, keep them apart
+        suffix += '_exact' if exact else ''
         graphProc = ProcessGraph(g)
         start_time = time.perf_counter()
 
@@ -27,7 +43,7 @@ def run_one_design(design_name, cmd, out_path):
         rfr = train_rfr()
         ######################################################################
 
-        delay_list_all, wns_list = graphProc.Graph_STA(rfr, design_name)
+        delay_list_all, wns_list = graphProc.Graph_STA(rfr, design_name, exact, suffix)
         end_time = time.perf_counter()
         runtime = round((end_time-start_time), 2)
         
@@ -35,7 +51,7 @@ def run_one_design(design_name, cmd, out_path):
         wns_pred = feat_timing[0]
         tns_pred = feat_timing[1]
 
-        with open(f'{out_path}/{design_name}_{cmd}_vec_timing.json', 'w') as f:
+        with open(f'{out_path}/{design_name}_{cmd}_vec_timing{suffix}.json', 'w') as f:
                 json.dump(feat_timing, f)
 
 
@@ -1,11 +1,11 @@
 
 from logicGraph import *
 import pickle, json, time
-from DG import Node
+from DG import Node, CSRGraph, get_op, graph_handle
 import copy
 import networkx as nx
 
-def propagate_node_tr(name, node:Node, g:nx.DiGraph, node_dict):
+def propagate_node_tr(name, node:Node, g:CSRGraph, node_dict):
         if not g.has_node(name):
             t1 = 0.5
             tc = 0.2
@@ -15,14 +15,13 @@ def propagate_node_tr(name, node:Node, g:nx.DiGraph, node_dict):
             return tc, t1, node_dict
         # tc = node.tr
         if node.type in ['Operator', 'UnaryOperator']:
-                fanin_lst = list(g.successors(name))
+                fanin_lst = [g.names[i] for i in g.successors(g.name2id[name]).tolist()]
 
                 switch_prop_lst = []
                 for fanin_node in fanin_lst:
                     fanin_node = re.sub(r'_CK_$|_Q_$', '', fanin_node)
                     switch_prop_lst.append(node_dict[fanin_node].tr)
-                op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', name)
-                op = op_temp[0][0]
+                op = get_op(node)
                 if op == 'Concat':
                     t1 = 0
                     tc = 0
@@ -72,16 +71,17 @@ def propagate_node_tr(name, node:Node, g:nx.DiGraph, node_dict):
         node_dict[name] = node
         return tc, t1, node_dict
 
-def update_node_dict(g:Graph):
-    node_dict_ret =  copy.copy(g.node_dict)
-    g_nx = nx.DiGraph(g.graph)
-    topo_sort = list(nx.topological_sort(g_nx))
-    topo_sort.reverse()
-    for n in topo_sort:
-        n = re.sub(r'_CK_$|_Q_$', '', n)
-        node = g.node_dict[n]
+def update_node_dict(g, node_dict=None):
+    g, node_dict = graph_handle(g, node_dict)
+    node_dict_ret =  copy.copy(node_dict)
+    for i in g.topological_order()[::-1].tolist():
+        n = re.sub(r'_CK_$|_Q_$', '', g.names[i])
+        node = node_dict[n]
         if not node.tr:
-            tr, t1, node_dict_ret = propagate_node_tr(n, node, g_nx, node_dict_ret)
+            tr, t1, node_dict_ret = propagate_node_tr(n, node, g, node_dict_ret)
+            i = g.name2id[n]
+            g.tr[i] = tr
+            g.t1[i] = t1
 
     return node_dict_ret
 
@@ -96,12 +96,9 @@ def run_one_design(design_name, module_name, out_path):
         folder_dir = f'../../example/module/{design_name}_init_tr/'
         with open(f'{folder_dir}/{module_name}_{cmd}_node_dict_tr.pkl', 'rb') as f:
                 node_dict = pickle.load(f)
-        graph = nx.to_dict_of_lists(graph)
-
-        g = Graph()
-        g.init_graph(graph, node_dict)
+        g = CSRGraph.from_graph(graph, node_dict)
         start_time = time.perf_counter()
-        node_dict_new = update_node_dict(g)
+        node_dict_new = update_node_dict(g, node_dict)
         end_time = time.perf_counter()
         rt = round((end_time-start_time), 2)
         global runtime
@@ -113,6 +110,7 @@ def run_one_design(design_name, module_name, out_path):
         dir_name = f'{out_path}/{module_name}_{cmd}_node_dict_{suffix}.pkl'
         with open(dir_name, 'wb') as f:
                 pickle.dump(node_dict_new, f)
+        g.save(f'{out_path}/{module_name}_{cmd}_{suffix}.csr')
         
 
 
@@ -0,0 +1,153 @@
+import json, os
+import numpy as np
+from DG import CSRGraph, NODE_TYPES, TYPE_ID, OP_NAMES
+
+### Node delay models for the timing DAG, named entries of "delay_models" in
+### std_PPA.json. The kind of a node is its operator kind, or "DFF" for a
+### register bit; nodes of any other type, or not in the graph, get delay 0.
+###   fanout_linear  delay = fanout * weight[kind]
+###                  "weight": a table, or the name of a std_PPA.json table
+###   fanout_lut     delay = delay[kind][bucket], bucket is the first bound in
+###                  "fanout" that is >= fanout (the last one above it)
+###                  "fanout": [bounds], "delay": {kind: [one delay per bound]}
+###   library        delay = table[kind] + load * fanout
+###                  "table": a std_PPA.json cell delay table (default "timing"),
+###                  "load": delay per user (default 0)
+### The graph terms are computed once and every model is one array expression
+### over all nodes, so several models (e.g. technology corners) cost one pass.
+
+KINDS = OP_NAMES + ('DFF',)
+KIND_ID = {k: i for i, k in enumerate(KINDS)}
+DELAY_KERNELS = {}
+
+
+def delay_kernel(kind):
+    def register(f):
+        DELAY_KERNELS[kind] = f
+        return f
+    return register
+
+
+def load_delay_models(names=None, ppa_dict="../../std_PPA.json"):
+    with open(ppa_dict, 'r') as f:
+        std_data = json.load(f)
+    models = std_data['delay_models']
+    if names is None:
+        names = list(models)
+    for name in names:
+        if name not in models:
+            raise ValueError('unknown delay model %s' % name)
+        if models[name]['kind'] not in DELAY_KERNELS:
+            raise ValueError('delay model %s: unknown kind %s' % (name, models[name]['kind']))
+    return {name: models[name] for name in names}, std_data
+
+
+def delay_terms(g:CSRGraph):
+    zero = g.type_mask('Input', 'Output', 'Wire', 'Constant', 'Concat', 'Inout')
+    oper = g.type_mask('Operator', 'UnaryOperator')
+    reg = g.type_mask('Reg')
+    bits = g.type_mask('Pointer', 'Partselect')
+    other = (g.type >= 0) & ~(zero | oper | reg | bits)
+    if other.any():
+        print(NODE_TYPES[g.type[np.flatnonzero(other)[0]]])
+        assert False
+
+    father = np.where(g.father >= 0, g.father, 0)
+    reg_bits = bits & (g.father >= 0) & (g.type[father] == TYPE_ID['Reg'])
+    kind = np.full(g.num_nodes, -1, dtype=np.int64)
+    kind[oper] = g.op[oper]
+    kind[reg | reg_bits] = KIND_ID['DFF']
+    timed = (oper | reg | reg_bits) & g.in_graph
+    fanout = np.where(timed, g.in_degree(), 0)
+    return {'kind': kind, 'timed': timed, 'fanout': fanout}
+
+
+def kind_table(table):
+    ### a lookup table over kind ids, nan for kinds the model does not define
+    lut = np.full(len(KINDS), np.nan)
+    for k, v in table.items():
+        if k in KIND_ID:
+            lut[KIND_ID[k]] = v
+    return lut
+
+
+def check_kinds(terms, defined, name):
+    kind = terms['kind'][terms['timed']]
+    missing = (kind < 0) | ~defined[np.maximum(kind, 0)]
+    if missing.any():
+        kinds = sorted({KINDS[k] if k >= 0 else str(k) for k in kind[missing].tolist()})
+        raise ValueError('delay model %s: no delay for %s' % (name, ', '.join(kinds)))
+
+
+def get_table(table, std_data):
+    return std_data[table] if isinstance(table, str) else table
+
+
+@delay_kernel('fanout_linear')
+def fanout_linear(terms, model, std_data, name):
+    weight = kind_table(get_table(model['weight'], std_data))
+    check_kinds(terms, ~np.isnan(weight), name)
+    timed = terms['timed']
+    delay = np.zeros(len(timed))
+    delay[timed] = terms['fanout'][timed] * weight[terms['kind'][timed]]
+    return delay
+
+
+@delay_kernel('fanout_lut')
+def fanout_lut(terms, model, std_data, name):
+    bounds = np.asarray(model['fanout'])
+    lut = np.full((len(KINDS), len(bounds)), np.nan)
+    for k, row in model['delay'].items():
+        if k in KIND_ID:
+            if len(row) != len(bounds):
+                raise ValueError('delay model %s: %s needs %d delays' % (name, k, len(bounds)))
+            lut[KIND_ID[k]] = row
+    check_kinds(terms, ~np.isnan(lut).any(axis=1), name)
+    timed = terms['timed']
+    bucket = np.minimum(np.searchsorted(bounds, terms['fanout'][timed]), len(bounds) - 1)
+    delay = np.zeros(len(timed))
+    delay[timed] = lut[terms['kind'][timed], bucket]
+    return delay
+
+
+@delay_kernel('library')
+def library(terms, model, std_data, name):
+    cell = kind_table(get_table(model.get('table', 'timing'), std_data))
+    check_kinds(terms, ~np.isnan(cell), name)
+    timed = terms['timed']
+    delay = np.zeros(len(timed))
+    delay[timed] = cell[terms['kind'][timed]] + model.get('load', 0) * terms['fanout'][timed]
+    return delay
+
+
+def compute_delays(g:CSRGraph, models, std_data):
+    ### {model name: delay per node id} and the fanout per node id
+    terms = delay_terms(g)
+    delays = {}
+    for name, model in models.items():
+        delays[name] = DELAY_KERNELS[model['kind']](terms, model, std_data, name)
+    return delays, terms['fanout']
+
+
+def save_delays(delays, folder_dir):
+    ### one <model>.npy per model, indexed by the node ids of the .csr graph
+    os.makedirs(folder_dir, exist_ok=True)
+    for name, delay in delays.items():
+        np.save(os.path.join(folder_dir, name + '.npy'), delay, allow_pickle=False)
+
+
+def sweep_one_design(design_name, cmd, folder_dir, names=None):
+    ### evaluate delay models on the saved timing DAG without running graph_update again
+    g = CSRGraph.load(f'{folder_dir}/{design_name}_{cmd}_init.csr')
+    models, std_data = load_delay_models(names)
+    delays, fanout = compute_delays(g, models, std_data)
+    save_delays(delays, f'{folder_dir}/{design_name}_{cmd}_delay')
+    print(f'{design_name}: {", ".join(delays)}')
+    return delays
+
+
+if __name__ == '__main__':
+    design_name = 'TinyRocket'
+    cmd = 'sog'
+    folder_dir = '../../example/timing_dag'
+    sweep_one_design(design_name, cmd, folder_dir)
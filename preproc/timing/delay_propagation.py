@@ -1,40 +1,29 @@
 from logicGraph import *
 import pickle, json, time, os, sys
-from DG import Node
-import time, copy
+from DG import Node, CSRGraph, graph_handle
+from delay_model import load_delay_models, compute_delays, save_delays
+import time
+import numpy as np
 import concurrent.futures
 
-
-def node_split(name, g_nx:nx.DiGraph):
-    pred_nodes = g_nx.predecessors(name)
-    add_pred_lst = []
-    for n in pred_nodes:
-        add_pred_lst.append((n, name + '_Q_'))
-    g_nx.add_edges_from(add_pred_lst)
-    succ_nodes_lst = list(g_nx.successors(name))
-    add_succ_lst = []
-    for n in succ_nodes_lst:
-        add_succ_lst.append((name + '_CK_', n))
-    g_nx.add_edges_from(add_succ_lst)
-    g_nx.remove_node(name)
-    return g_nx
+DEFAULT_DELAY_MODEL = 'fanout_linear'
 
 
 def graph_update(g:Graph):
-        g_nx_tmp = nx.DiGraph(g.graph)
-        g_nx = nx.DiGraph(g.graph)
+        ### every register/IO bit s is split in one pass over the edge arrays: users
+        ### of s read s_Q_, drivers of s are driven from s_CK_
         node_dict = g.node_dict
-        ret_node_dict = copy.deepcopy(node_dict)
-        
+        ret_node_dict = dict(node_dict)
+        csr = CSRGraph.from_graph(g.graph)
 
         split_node_dict = {}
         for name, node in node_dict.items():
             if node.type in ['Reg', 'Input', 'Output']:
-                if g_nx_tmp.has_node(name):
+                if csr.has_node(name):
                     split_node_dict[name] = node
             elif node.type in ['Pointer', 'Partselect']:
                 if node_dict[node.father].type in ['Reg', 'Input', 'Output']:
-                    if g_nx_tmp.has_node(name):
+                    if csr.has_node(name):
                         split_node_dict[name] = node
 
         for name, node in split_node_dict.items():
@@ -46,91 +35,70 @@ def graph_update(g:Graph):
                 f_q = node.father
             ret_node_dict[name + '_CK_'] = Node(name + '_CK_', node.type, node.width, f_ck)
             ret_node_dict[name + '_Q_'] = Node(name + '_Q_', node.type, node.width, f_q)
-            g_nx = node_split(name, g_nx)
-        
-        print(nx.is_directed_acyclic_graph(g_nx))
-        assert nx.is_directed_acyclic_graph(g_nx)
-        return g_nx, ret_node_dict
 
-def get_node_delay_init(name, node:Node, g:nx.DiGraph, node_dict):
-        
-        if node.type in ['Input', 'Output', 'Wire', 'Constant', 'Concat', 'Inout']:
-            ret_delay = 0
-            fanout = 0
-        # elif node.type in ['Reg', 'Operator', 'UnaryOperator', 'Pointer', 'Partselect']:
-        elif node.type in ['Operator', 'UnaryOperator']:
-            if not g.has_node(name):
-                fanout = 0
-            else:
-                fanout = g.in_degree(name)
-
-            op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', name)
-            op = op_temp[0][0]
-            if op == 'Concat':
-                ret_delay = 0
-            elif op in ['Mux', 'Cond']:
-                type_weight = 0.42
-                ret_delay = fanout*type_weight
-            elif op in ['And']:
-                type_weight = 0.42
-                ret_delay = fanout*type_weight
-            elif op in ['Or']:
-                type_weight = 0.27
-                ret_delay = fanout*type_weight
-            elif op in ['Ulnot', 'Unot']:
-                type_weight = 0.27
-                ret_delay = fanout*type_weight
-            elif op in ['Xor']:
-                type_weight = 0.74
-                ret_delay = fanout*type_weight
-        elif node.type == 'Reg':
-            if not g.has_node(name):
-                ret_delay = 0
-                fanout = 0
-            else:
-                fanout = g.in_degree(name)
-
-                type_weight = 1
-                ret_delay = fanout*type_weight
-        elif node.type in ['Pointer', 'Partselect']:
-            if node.father not in node_dict:
-                ret_delay = 0
-                fanout = 0
-            else:
-                if node_dict[node.father].type in ['Reg']:
-                    if not g.has_node(name):
-                        ret_delay = 0
-                        fanout = 0
-                    else:
-                        fanout = g.in_degree(name)
-                        type_weight = 1
-                        ret_delay = fanout*type_weight
-                else:
-                    ret_delay = 0
-                    fanout = 0
-        else:
-             print(node.type)
-             assert False
-        # if ret_delay !=0:
-        #     print(name, ret_delay)
-        #     input()
-        # print(fanout)
-        return ret_delay, fanout
-            
-def init_node_dict(g:Graph):
-    
-    g_nx = nx.DiGraph(g.graph)
+        num = csr.num_nodes
+        split = np.array([csr.name2id[name] for name in split_node_dict], dtype=np.int64)
+        rank = np.full(num, -1, dtype=np.int64)
+        rank[split] = np.arange(len(split))
+        is_split = rank >= 0
+
+        ### kept nodes first, then s_Q_ (if s has users) and s_CK_ (if s has drivers)
+        ### in split order
+        keep = np.flatnonzero(~is_split)
+        new_id = np.full(num, -1, dtype=np.int64)
+        new_id[keep] = np.arange(len(keep))
+        has_new = np.stack([csr.in_degree()[split] > 0, csr.out_degree()[split] > 0], axis=1).ravel()
+        new_pos = len(keep) + np.cumsum(has_new) - 1
+        q_id = np.full(num, -1, dtype=np.int64)
+        ck_id = np.full(num, -1, dtype=np.int64)
+        q_id[split] = np.where(has_new[0::2], new_pos[0::2], -1)
+        ck_id[split] = np.where(has_new[1::2], new_pos[1::2], -1)
+        names = csr.names
+        new_names = [names[i] for i in keep.tolist()]
+        for name, has in zip([n + s for n in split_node_dict for s in ('_Q_', '_CK_')], has_new.tolist()):
+            if has:
+                new_names.append(name)
+
+        src = np.repeat(np.arange(num), csr.out_degree())
+        dst = csr.succ_idx
+        src = np.where(is_split[src], ck_id[src], new_id[src])
+        dst = np.where(is_split[dst], q_id[dst], new_id[dst])
+        ### per user: unsplit drivers in their old order, then the _Q_ of split drivers
+        ### in split order, the order node-by-node splitting appended them in
+        order = np.lexsort((np.arange(len(dst)), rank[csr.succ_idx], src))
+        succ_ptr = np.zeros(len(new_names) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(new_names)), out=succ_ptr[1:])
+        succ_idx = dst[order].astype(np.int32)
+
+        g_new = CSRGraph.from_arrays(new_names, succ_ptr, succ_idx, ret_node_dict)
+        ### raises GraphLoopError, listing the loops, if any is left after splitting the registers
+        g_new.topological_order()
+        return g_new, ret_node_dict
+
+def set_node_delay(g:CSRGraph, node_dict, delay, fanout):
+    has = g.type >= 0
+    g.delay[has] = delay[has]
+    g.fanout[has] = fanout[has]
+    delay = delay.tolist()
+    fanout = fanout.tolist()
+    name2id = g.name2id
     node_dict_ret = {}
-    for name, node in g.node_dict.items():
-        node_delay, node_fanout= get_node_delay_init(name, node, g_nx, g.node_dict)
-        node.update_delay(node_delay)
-        node.update_fanout(node_fanout)
+    for name, node in node_dict.items():
+        i = name2id[name]
+        node.update_delay(delay[i])
+        node.update_fanout(fanout[i])
         node_dict_ret[name] = node
     return node_dict_ret
 
+def init_node_dict(g, node_dict=None, delay_model=DEFAULT_DELAY_MODEL):
+    g, node_dict = graph_handle(g, node_dict)
+    models, std_data = load_delay_models([delay_model])
+    delays, fanout = compute_delays(g, models, std_data)
+    return set_node_delay(g, node_dict, delays[delay_model], fanout)
+
 
  
-def run_one_design(design_name, cmd, out_path):
+def run_one_design(design_name, cmd, out_path, delay_models=()):
         with open(f'../../example/{cmd}/{design_name}_{cmd}.pkl', 'rb') as f:
                 graph = pickle.load(f)
         with open(f'../../example/{cmd}/{design_name}_{cmd}_node_dict.pkl', 'rb') as f:
@@ -141,17 +109,22 @@ def run_one_design(design_name, cmd, out_path):
         g_new, node_dict_new = graph_update(g)
 
         with open(out_path + f"{design_name}_{cmd}.pkl", 'wb') as f:
-            pickle.dump(g_new, f)
+            pickle.dump(g_new.to_dict_of_lists(), f)
         with open(out_path + f"{design_name}_{cmd}_node_dict.pkl", 'wb') as f:
             pickle.dump(node_dict_new, f)
 
-
-        g = Graph()
-        g.init_graph(g_new, node_dict_new)
-        node_dict_new = init_node_dict(g)
+        ### the default model initialises the nodes; any further models are
+        ### evaluated in the same pass and saved per model for a corner sweep
+        names = [DEFAULT_DELAY_MODEL] + [m for m in delay_models if m != DEFAULT_DELAY_MODEL]
+        models, std_data = load_delay_models(names)
+        delays, fanout = compute_delays(g_new, models, std_data)
+        node_dict_new = set_node_delay(g_new, node_dict_new, delays[DEFAULT_DELAY_MODEL], fanout)
+        if delay_models:
+            save_delays({m: delays[m] for m in delay_models}, out_path + f"{design_name}_{cmd}_delay")
 
         with open(out_path + f"{design_name}_{cmd}_node_dict_init.pkl", 'wb') as f:
             pickle.dump(node_dict_new, f)
+        g_new.save(out_path + f"{design_name}_{cmd}_init.csr")
         
         print(f'{design_name} Finish!')
 
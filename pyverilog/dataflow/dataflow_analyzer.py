@@ -16,7 +16,13 @@ from pyverilog.dataflow.modulevisitor import ModuleVisitor
 from pyverilog.dataflow.signalvisitor import SignalVisitor
 from pyverilog.dataflow.bindvisitor import BindVisitor
 
-# Increasing the maximum recursion size for deeper traversal
+# Increasing the maximum recursion size for deeper traversal.
+# The Verilog-to-graph flow (vlg2ir) walks the AST with explicit stacks and
+# never imports this module, so the limit does not hide recursion there. The
+# dataflow passes still recurse once per tree level: ModuleVisitor,
+# SignalVisitor and BindVisitor over the AST, and the optimizer, walker and
+# graphgen over the resulting dataflow trees. The limit has to stay until
+# those are rewritten without recursion.
 sys.setrecursionlimit(16 * 1024)
 
 
@@ -31,6 +31,9 @@ def ischild(node, attr):
     attr_names = getattr(node, 'attr_names')
     if attr in attr_names:
         return False
+    # slots that were never assigned are listed by dir() but not set
+    if not hasattr(node, attr):
+        return False
     attr_test = getattr(node, attr)
     if hasattr(attr_test, '__call__'):
         return False
@@ -70,6 +73,7 @@ class IdentifierReplace(object):
             else:
                 ret = self.visit(child)
             setattr(node, name, ret)
+        node.reset_hash()
         return node
 
     def visit_Identifier(self, node):
@@ -18,59 +18,86 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import re
+import zlib
+
+
+def _attr_hash(value):
+    if isinstance(value, str):
+        return zlib.crc32(value.encode('utf-8', 'surrogatepass'))
+    if value is None:
+        return 0
+    if isinstance(value, (tuple, list)):
+        return hash(tuple([_attr_hash(v) for v in value]))
+    return hash(value)
 
 
 class Node(object):
     """ Abstact class for every element in parser """
+    __slots__ = ('lineno', '_hash')
 
     def children(self):
         pass
 
     def show(self, buf=sys.stdout, offset=0, attrnames=False, showlineno=True):
-        file = "test.txt"
-        with open(file, 'a') as f:
-            f.write(str(offset) + "\n")
-
-
         indent = 2
-        lead = ' ' * offset
-
-        buf.write(lead + self.__class__.__name__ + ': ')
-
-        if self.attr_names:
-            if attrnames:
-                nvlist = [(n, getattr(self, n)) for n in self.attr_names]
-                attrstr = ', '.join('%s=%s' % (n, v) for (n, v) in nvlist)
-            else:
-                vlist = [getattr(self, n) for n in self.attr_names]
-                attrstr = ', '.join('%s' % v for v in vlist)
-            buf.write(attrstr)
-
-        if showlineno:
-            buf.write(' (at %s)' % self.lineno)
-
-        buf.write('\n')
+        lines = []
+        stack = [(self, offset)]
+        while stack:
+            node, offset = stack.pop()
+            line = ' ' * offset + node.__class__.__name__ + ': '
+
+            if node.attr_names:
+                if attrnames:
+                    nvlist = [(n, getattr(node, n)) for n in node.attr_names]
+                    line += ', '.join('%s=%s' % (n, v) for (n, v) in nvlist)
+                else:
+                    vlist = [getattr(node, n) for n in node.attr_names]
+                    line += ', '.join('%s' % v for v in vlist)
+
+            if showlineno:
+                line += ' (at %s)' % node.lineno
+
+            lines.append(line + '\n')
+            if len(lines) >= 4096:
+                buf.write(''.join(lines))
+                lines = []
+
+            stack.extend((c, offset + indent) for c in reversed(node.children()))
+        buf.write(''.join(lines))
 
-        for c in self.children():
-            c.show(buf, offset + indent, attrnames, showlineno)
     def get_type(self):
         return str(self.__class__.__name__)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if type(self) != type(other):
             return False
+        # cached structural hashes reject almost every unequal pair at once
+        if hash(self) != hash(other):
+            return False
 
-        self_attrs = tuple([getattr(self, a) for a in self.attr_names])
-        other_attrs = tuple([getattr(other, a) for a in other.attr_names])
+        stack = [(self, other)]
+        while stack:
+            a, b = stack.pop()
+            if a is b:
+                continue
+            if type(a) != type(b):
+                return False
+            if a._hash != b._hash:
+                return False
 
-        if self_attrs != other_attrs:
-            return False
+            a_attrs = tuple([getattr(a, n) for n in a.attr_names])
+            b_attrs = tuple([getattr(b, n) for n in b.attr_names])
 
-        other_children = other.children()
+            if a_attrs != b_attrs:
+                return False
 
-        for i, c in enumerate(self.children()):
-            if c != other_children[i]:
+            a_children = a.children()
+            b_children = b.children()
+            if len(a_children) != len(b_children):
                 return False
+            stack.extend(zip(a_children, b_children))
 
         return True
 
@@ -78,13 +105,31 @@ class Node(object):
         return not self.__eq__(other)
 
     def __hash__(self):
-        s = hash(tuple([getattr(self, a) for a in self.attr_names]))
-        c = hash(self.children())
-        return hash((s, c))
-
+        # computed once bottom-up and cached; call reset_hash() on a node and
+        # its ancestors after changing it in place. Independent of the string
+        # hash seed, so the cached value survives pickling to another process
+        h = getattr(self, '_hash', None)
+        if h is not None:
+            return h
+        stack = [self]
+        while stack:
+            node = stack[-1]
+            pending = [c for c in node.children() if getattr(c, '_hash', None) is None]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            s = hash(tuple([_attr_hash(getattr(node, a)) for a in node.attr_names]))
+            c = hash(tuple([child._hash for child in node.children()]))
+            node._hash = hash((s, c))
+        return self._hash
+
+    def reset_hash(self):
+        self._hash = None
 
 # ------------------------------------------------------------------------------
 class Source(Node):
+    __slots__ = ('name', 'description')
     attr_names = ('name',)
 
     def __init__(self, name, description, lineno=0):
@@ -100,6 +145,7 @@ class Source(Node):
 
 
 class Description(Node):
+    __slots__ = ('definitions',)
     attr_names = ()
 
     def __init__(self, definitions, lineno=0):
@@ -114,6 +160,7 @@ class Description(Node):
 
 
 class ModuleDef(Node):
+    __slots__ = ('name', 'paramlist', 'portlist', 'items', 'default_nettype', 'end_lineno')
     attr_names = ('name',)
 
     def __init__(self, name, paramlist, portlist, items, default_nettype='wire', lineno=0):
@@ -136,6 +183,7 @@ class ModuleDef(Node):
 
 
 class Paramlist(Node):
+    __slots__ = ('params',)
     attr_names = ()
 
     def __init__(self, params, lineno=0):
@@ -150,6 +198,7 @@ class Paramlist(Node):
 
 
 class Portlist(Node):
+    __slots__ = ('ports',)
     attr_names = ()
 
     def __init__(self, ports, lineno=0):
@@ -164,6 +213,7 @@ class Portlist(Node):
 
 
 class Port(Node):
+    __slots__ = ('name', 'width', 'dimensions', 'type')
     attr_names = ('name', 'type',)
 
     def __init__(self, name, width, dimensions, type, lineno=0):
@@ -181,6 +231,7 @@ class Port(Node):
 
 
 class Width(Node):
+    __slots__ = ('msb', 'lsb')
     attr_names = ()
 
     def __init__(self, msb, lsb, lineno=0):
@@ -198,10 +249,11 @@ class Width(Node):
 
 
 class Length(Width):
-    pass
+    __slots__ = ()
 
 
 class Dimensions(Node):
+    __slots__ = ('lengths',)
     attr_names = ()
 
     def __init__(self, lengths, lineno=0):
@@ -216,6 +268,7 @@ class Dimensions(Node):
 
 
 class Identifier(Node):
+    __slots__ = ('name', 'scope')
     attr_names = ('name',)
 
     def __init__(self, name, scope=None, lineno=0):
@@ -239,6 +292,7 @@ class Identifier(Node):
 
 
 class Value(Node):
+    __slots__ = ('value',)
     attr_names = ()
 
     def __init__(self, value, lineno=0):
@@ -253,6 +307,7 @@ class Value(Node):
 
 
 class Constant(Value):
+    __slots__ = ()
     attr_names = ('value',)
 
     def __init__(self, value, lineno=0):
@@ -271,18 +326,19 @@ class Constant(Value):
 
 
 class IntConst(Constant):
-    pass
+    __slots__ = ()
 
 
 class FloatConst(Constant):
-    pass
+    __slots__ = ()
 
 
 class StringConst(Constant):
-    pass
+    __slots__ = ()
 
 
 class Variable(Value):
+    __slots__ = ('name', 'width', 'signed', 'dimensions')
     attr_names = ('name', 'signed')
 
     def __init__(self, name, width=None, signed=False, dimensions=None, value=None, lineno=0):
@@ -307,42 +363,43 @@ class Variable(Value):
         return 'Variable'
 
 class Input(Variable):
-    pass
+    __slots__ = ()
 
 
 class Output(Variable):
-    pass
+    __slots__ = ()
 
 
 class Inout(Variable):
-    pass
+    __slots__ = ()
 
 
 class Tri(Variable):
-    pass
+    __slots__ = ()
 
 
 class Wire(Variable):
-    pass
+    __slots__ = ()
 
 
 class Reg(Variable):
-    pass
+    __slots__ = ()
 
 
 class Integer(Variable):
-    pass
+    __slots__ = ()
 
 
 class Real(Variable):
-    pass
+    __slots__ = ()
 
 
 class Genvar(Variable):
-    pass
+    __slots__ = ()
 
 
 class Ioport(Node):
+    __slots__ = ('first', 'second')
     attr_names = ()
 
     def __init__(self, first, second=None, lineno=0):
@@ -360,6 +417,7 @@ class Ioport(Node):
 
 
 class Parameter(Node):
+    __slots__ = ('name', 'value', 'width', 'signed', 'dimensions')
     attr_names = ('name', 'signed')
 
     def __init__(self, name, value, width=None, signed=False, lineno=0):
@@ -380,14 +438,15 @@ class Parameter(Node):
 
 
 class Localparam(Parameter):
-    pass
+    __slots__ = ()
 
 
 class Supply(Parameter):
-    pass
+    __slots__ = ()
 
 
 class Decl(Node):
+    __slots__ = ('list',)
     attr_names = ()
 
     def __init__(self, list, lineno=0):
@@ -402,6 +461,7 @@ class Decl(Node):
 
 
 class Concat(Node):
+    __slots__ = ('list',)
     attr_names = ()
 
     def __init__(self, list, lineno=0):
@@ -419,10 +479,11 @@ class Concat(Node):
 
 
 class LConcat(Concat):
-    pass
+    __slots__ = ()
 
 
 class Repeat(Node):
+    __slots__ = ('value', 'times')
     attr_names = ()
 
     def __init__(self, value, times, lineno=0):
@@ -443,6 +504,7 @@ class Repeat(Node):
 
 
 class Partselect(Node):
+    __slots__ = ('var', 'msb', 'lsb')
     attr_names = ()
 
     def __init__(self, var, msb, lsb, lineno=0):
@@ -466,6 +528,7 @@ class Partselect(Node):
 
 
 class Pointer(Node):
+    __slots__ = ('var', 'ptr')
     attr_names = ()
 
     def __init__(self, var, ptr, lineno=0):
@@ -484,6 +547,7 @@ class Pointer(Node):
         return 'Pointer'
 
 class Lvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
 
     def __init__(self, var, lineno=0):
@@ -498,6 +562,7 @@ class Lvalue(Node):
 
 
 class Rvalue(Node):
+    __slots__ = ('var',)
     attr_names = ()
 
     def __init__(self, var, lineno=0):
@@ -513,6 +578,7 @@ class Rvalue(Node):
 
 # ------------------------------------------------------------------------------
 class Operator(Node):
+    __slots__ = ('left', 'right')
     attr_names = ()
 
     def __init__(self, left, right, lineno=0):
@@ -540,6 +606,7 @@ class Operator(Node):
 
 
 class UnaryOperator(Operator):
+    __slots__ = ()
     attr_names = ()
 
     def __init__(self, right, lineno=0):
@@ -558,152 +625,155 @@ class UnaryOperator(Operator):
 
 # Level 1 (Highest Priority)
 class Uplus(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Uminus(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Ulnot(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Unot(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Uand(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Unand(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Uor(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Unor(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Uxor(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 class Uxnor(UnaryOperator):
-    pass
+    __slots__ = ()
 
 
 # Level 2
 class Power(Operator):
-    pass
+    __slots__ = ()
 
 
 class Times(Operator):
-    pass
+    __slots__ = ()
 
 
 class Divide(Operator):
-    pass
+    __slots__ = ()
 
 
 class Mod(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 3
 class Plus(Operator):
-    pass
+    __slots__ = ()
 
 
 class Minus(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 4
 class Sll(Operator):
-    pass
+    __slots__ = ()
 
 
 class Srl(Operator):
-    pass
+    __slots__ = ()
 
 
 class Sla(Operator):
-    pass
+    __slots__ = ()
 
 
 class Sra(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 5
 class LessThan(Operator):
-    pass
+    __slots__ = ()
 
 
 class GreaterThan(Operator):
-    pass
+    __slots__ = ()
 
 
 class LessEq(Operator):
-    pass
+    __slots__ = ()
 
 
 class GreaterEq(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 6
 class Eq(Operator):
-    pass
+    __slots__ = ()
 
 
 class NotEq(Operator):
-    pass
+    __slots__ = ()
 
 
 class Eql(Operator):
+    __slots__ = ()
     pass  # ===
 
 
 class NotEql(Operator):
+    __slots__ = ()
     pass  # !==
 
 
 # Level 7
 class And(Operator):
-    pass
+    __slots__ = ()
 
 
 class Xor(Operator):
-    pass
+    __slots__ = ()
 
 
 class Xnor(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 8
 class Or(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 9
 class Land(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 10
 class Lor(Operator):
-    pass
+    __slots__ = ()
 
 
 # Level 11
 class Cond(Operator):
+    __slots__ = ('cond', 'true_value', 'false_value')
     attr_names = ()
 
     def __init__(self, cond, true_value, false_value, lineno=0):
@@ -724,6 +794,7 @@ class Cond(Operator):
 
 
 class Assign(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay')
     attr_names = ()
 
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
@@ -747,6 +818,7 @@ class Assign(Node):
 
 
 class Always(Node):
+    __slots__ = ('sens_list', 'statement')
     attr_names = ()
 
     def __init__(self, sens_list, statement, lineno=0):
@@ -764,18 +836,19 @@ class Always(Node):
 
 
 class AlwaysFF(Always):
-    pass
+    __slots__ = ()
 
 
 class AlwaysComb(Always):
-    pass
+    __slots__ = ()
 
 
 class AlwaysLatch(Always):
-    pass
+    __slots__ = ()
 
 
 class SensList(Node):
+    __slots__ = ('list',)
     attr_names = ()
 
     def __init__(self, list, lineno=0):
@@ -790,6 +863,7 @@ class SensList(Node):
 
 
 class Sens(Node):
+    __slots__ = ('sig', 'type')
     attr_names = ('type',)
 
     def __init__(self, sig, type='posedge', lineno=0):
@@ -805,6 +879,7 @@ class Sens(Node):
 
 
 class Substitution(Node):
+    __slots__ = ('left', 'right', 'ldelay', 'rdelay')
     attr_names = ()
 
     def __init__(self, left, right, ldelay=None, rdelay=None, lineno=0):
@@ -828,14 +903,15 @@ class Substitution(Node):
 
 
 class BlockingSubstitution(Substitution):
-    pass
+    __slots__ = ()
 
 
 class NonblockingSubstitution(Substitution):
-    pass
+    __slots__ = ()
 
 
 class IfStatement(Node):
+    __slots__ = ('cond', 'true_statement', 'false_statement')
     attr_names = ()
 
     def __init__(self, cond, true_statement, false_statement, lineno=0):
@@ -856,6 +932,7 @@ class IfStatement(Node):
 
 
 class ForStatement(Node):
+    __slots__ = ('pre', 'cond', 'post', 'statement')
     attr_names = ()
 
     def __init__(self, pre, cond, post, statement, lineno=0):
@@ -879,6 +956,7 @@ class ForStatement(Node):
 
 
 class WhileStatement(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
 
     def __init__(self, cond, statement, lineno=0):
@@ -896,6 +974,7 @@ class WhileStatement(Node):
 
 
 class CaseStatement(Node):
+    __slots__ = ('comp', 'caselist')
     attr_names = ()
 
     def __init__(self, comp, caselist, lineno=0):
@@ -913,18 +992,19 @@ class CaseStatement(Node):
 
 
 class CasexStatement(CaseStatement):
-    pass
+    __slots__ = ()
 
 
 class CasezStatement(CaseStatement):
-    pass
+    __slots__ = ()
 
 
 class UniqueCaseStatement(CaseStatement):
-    pass
+    __slots__ = ()
 
 
 class Case(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
 
     def __init__(self, cond, statement, lineno=0):
@@ -942,6 +1022,7 @@ class Case(Node):
 
 
 class Block(Node):
+    __slots__ = ('statements', 'scope')
     attr_names = ('scope',)
 
     def __init__(self, statements, scope=None, lineno=0):
@@ -957,6 +1038,7 @@ class Block(Node):
 
 
 class Initial(Node):
+    __slots__ = ('statement',)
     attr_names = ()
 
     def __init__(self, statement, lineno=0):
@@ -971,6 +1053,7 @@ class Initial(Node):
 
 
 class EventStatement(Node):
+    __slots__ = ('senslist',)
     attr_names = ()
 
     def __init__(self, senslist, lineno=0):
@@ -985,6 +1068,7 @@ class EventStatement(Node):
 
 
 class WaitStatement(Node):
+    __slots__ = ('cond', 'statement')
     attr_names = ()
 
     def __init__(self, cond, statement, lineno=0):
@@ -1002,6 +1086,7 @@ class WaitStatement(Node):
 
 
 class ForeverStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
 
     def __init__(self, statement, lineno=0):
@@ -1016,6 +1101,7 @@ class ForeverStatement(Node):
 
 
 class DelayStatement(Node):
+    __slots__ = ('delay',)
     attr_names = ()
 
     def __init__(self, delay, lineno=0):
@@ -1030,6 +1116,7 @@ class DelayStatement(Node):
 
 
 class InstanceList(Node):
+    __slots__ = ('module', 'parameterlist', 'instances')
     attr_names = ('module',)
 
     def __init__(self, module, parameterlist, instances, lineno=0):
@@ -1048,6 +1135,7 @@ class InstanceList(Node):
 
 
 class Instance(Node):
+    __slots__ = ('module', 'name', 'portlist', 'parameterlist', 'array')
     attr_names = ('name', 'module')
 
     def __init__(self, module, name, portlist, parameterlist, array=None, lineno=0):
@@ -1070,6 +1158,7 @@ class Instance(Node):
 
 
 class ParamArg(Node):
+    __slots__ = ('paramname', 'argname')
     attr_names = ('paramname',)
 
     def __init__(self, paramname, argname, lineno=0):
@@ -1085,6 +1174,7 @@ class ParamArg(Node):
 
 
 class PortArg(Node):
+    __slots__ = ('portname', 'argname')
     attr_names = ('portname',)
 
     def __init__(self, portname, argname, lineno=0):
@@ -1100,6 +1190,7 @@ class PortArg(Node):
 
 
 class Function(Node):
+    __slots__ = ('name', 'retwidth', 'statement')
     attr_names = ('name',)
 
     def __init__(self, name, retwidth, statement, lineno=0):
@@ -1121,6 +1212,7 @@ class Function(Node):
 
 
 class FunctionCall(Node):
+    __slots__ = ('name', 'args')
     attr_names = ()
 
     def __init__(self, name, args, lineno=0):
@@ -1144,6 +1236,7 @@ class FunctionCall(Node):
 
 
 class Task(Node):
+    __slots__ = ('name', 'statement')
     attr_names = ('name',)
 
     def __init__(self, name, statement, lineno=0):
@@ -1159,6 +1252,7 @@ class Task(Node):
 
 
 class TaskCall(Node):
+    __slots__ = ('name', 'args')
     attr_names = ()
 
     def __init__(self, name, args, lineno=0):
@@ -1176,6 +1270,7 @@ class TaskCall(Node):
 
 
 class GenerateStatement(Node):
+    __slots__ = ('items',)
     attr_names = ()
 
     def __init__(self, items, lineno=0):
@@ -1190,6 +1285,7 @@ class GenerateStatement(Node):
 
 
 class SystemCall(Node):
+    __slots__ = ('syscall', 'args')
     attr_names = ('syscall',)
 
     def __init__(self, syscall, args, lineno=0):
@@ -1219,6 +1315,7 @@ class SystemCall(Node):
 
 
 class IdentifierScopeLabel(Node):
+    __slots__ = ('name', 'loop')
     attr_names = ('name', 'loop')
 
     def __init__(self, name, loop=None, lineno=0):
@@ -1232,6 +1329,7 @@ class IdentifierScopeLabel(Node):
 
 
 class IdentifierScope(Node):
+    __slots__ = ('labellist',)
     attr_names = ()
 
     def __init__(self, labellist, lineno=0):
@@ -1246,6 +1344,7 @@ class IdentifierScope(Node):
 
 
 class Pragma(Node):
+    __slots__ = ('entry',)
     attr_names = ()
 
     def __init__(self, entry, lineno=0):
@@ -1260,6 +1359,7 @@ class Pragma(Node):
 
 
 class PragmaEntry(Node):
+    __slots__ = ('name', 'value')
     attr_names = ('name', )
 
     def __init__(self, name, value=None, lineno=0):
@@ -1275,6 +1375,7 @@ class PragmaEntry(Node):
 
 
 class Disable(Node):
+    __slots__ = ('dest',)
     attr_names = ('dest',)
 
     def __init__(self, dest, lineno=0):
@@ -1287,6 +1388,7 @@ class Disable(Node):
 
 
 class ParallelBlock(Node):
+    __slots__ = ('statements', 'scope')
     attr_names = ('scope',)
 
     def __init__(self, statements, scope=None, lineno=0):
@@ -1302,6 +1404,7 @@ class ParallelBlock(Node):
 
 
 class SingleStatement(Node):
+    __slots__ = ('statement',)
     attr_names = ()
 
     def __init__(self, statement, lineno=0):
@@ -1316,6 +1419,7 @@ class SingleStatement(Node):
 
 
 class EmbeddedCode(Node):
+    __slots__ = ('code',)
     attr_names = ('code',)
 
     def __init__(self, code, lineno=0):
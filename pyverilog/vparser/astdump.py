@@ -0,0 +1,120 @@
+"""
+   Copyright 2013, Shinya Takamaeda-Yamazaki and Contributors
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+   ----
+   Compact binary AST dump
+
+   The tree is flattened in postorder into a marshal-able table:
+   (version, class names, records), one record per node holding its class
+   index and the value of every slot. A node reference is a 1-tuple with
+   the index of an earlier record, a sequence is a list whose first item
+   tells tuple from list, and an unset slot is Ellipsis. No recursion is
+   used on either side, so arbitrarily deep expressions can be dumped.
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+import marshal
+
+from pyverilog.vparser import ast as vast
+
+version = 1
+
+_slot_names = {}
+
+
+def slot_names(cls):
+    names = _slot_names.get(cls)
+    if names is None:
+        names = []
+        for c in reversed(cls.__mro__):
+            names.extend(n for n in c.__dict__.get('__slots__', ()) if n != '_hash')
+        names = _slot_names[cls] = tuple(names)
+    return names
+
+
+def _nodes(value, out):
+    for v in value:
+        if isinstance(v, vast.Node):
+            out.append(v)
+        elif isinstance(v, (tuple, list)):
+            _nodes(v, out)
+
+
+def _encode(value, index):
+    if isinstance(value, vast.Node):
+        return (index[id(value)],)
+    if isinstance(value, (tuple, list)):
+        return [isinstance(value, tuple)] + [_encode(v, index) for v in value]
+    return value
+
+
+def _decode(value, nodes):
+    if isinstance(value, tuple):
+        return nodes[value[0]]
+    if isinstance(value, list):
+        seq = [_decode(v, nodes) for v in value[1:]]
+        return tuple(seq) if value[0] else seq
+    return value
+
+
+def dumps(node):
+    classes = []
+    class_index = {}
+    records = []
+    index = {}
+    stack = [(node, None)]
+    while stack:
+        n, values = stack.pop()
+        if id(n) in index:
+            continue
+        cls = type(n)
+        if values is None:
+            values = [getattr(n, name, Ellipsis) for name in slot_names(cls)]
+            stack.append((n, values))
+            refs = []
+            _nodes(values, refs)
+            stack.extend((r, None) for r in reversed(refs))
+            continue
+        if cls not in class_index:
+            class_index[cls] = len(classes)
+            classes.append(cls.__name__)
+        index[id(n)] = len(records)
+        records.append((class_index[cls], tuple(_encode(v, index) for v in values)))
+    return marshal.dumps((version, tuple(classes), records))
+
+
+def loads(data):
+    dump_version, classes, records = marshal.loads(data)
+    if dump_version != version:
+        raise ValueError('unsupported AST dump version %s' % dump_version)
+    classes = [getattr(vast, name) for name in classes]
+    nodes = []
+    for cls_id, values in records:
+        cls = classes[cls_id]
+        n = cls.__new__(cls)
+        for name, value in zip(slot_names(cls), values):
+            if value is not Ellipsis:
+                setattr(n, name, _decode(value, nodes))
+        nodes.append(n)
+    return nodes[-1]
+
+
+def dump(node, f):
+    f.write(dumps(node))
+
+
+def load(f):
+    return loads(f.read())
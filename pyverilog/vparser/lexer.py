@@ -214,38 +214,48 @@ class VerilogLexer(object):
 
     @TOKEN(signed_bin_number)
     def t_SIGNED_INTNUMBER_BIN(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(bin_number)
     def t_INTNUMBER_BIN(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(signed_octal_number)
     def t_SIGNED_INTNUMBER_OCT(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(octal_number)
     def t_INTNUMBER_OCT(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(signed_hex_number)
     def t_SIGNED_INTNUMBER_HEX(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(hex_number)
     def t_INTNUMBER_HEX(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(signed_decimal_number)
     def t_SIGNED_INTNUMBER_DEC(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(decimal_number)
     def t_INTNUMBER_DEC(self, t):
+        t.value = sys.intern(t.value)
         return t
 
     @TOKEN(identifier)
     def t_ID(self, t):
+        # names and constants repeat heavily in netlists, share one string each
+        t.value = sys.intern(t.value)
         t.type = self.reserved.get(t.value, 'ID')
         return t
 
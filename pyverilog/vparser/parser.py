@@ -18,9 +18,17 @@ from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
+import io
+import re
 import pathlib
+import hashlib
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from ply.yacc import yacc
 
+import pyverilog
+
 from pyverilog.vparser.preprocessor import VerilogPreprocessor
 from pyverilog.vparser.lexer import VerilogLexer
 from pyverilog.vparser.ast import *
@@ -49,15 +57,19 @@ class VerilogParser(object):
         # -> Strong
     )
 
-    def __init__(self, outputdir=".", debug=True):
+    def __init__(self, outputdir=None, debug=False):
         self.lexer = VerilogLexer(error_func=self._lexer_error_func)
         self.lexer.build()
 
         self.tokens = self.lexer.tokens
-        pathlib.Path(outputdir).mkdir(parents=True, exist_ok=True)
+        # LALR tables ship as pyverilog/vparser/parsetab.py and are only
+        # regenerated when the grammar signature no longer matches
+        if outputdir is not None:
+            pathlib.Path(outputdir).mkdir(parents=True, exist_ok=True)
         self.parser = yacc(
             module=self,
             method="LALR",
+            tabmodule="pyverilog.vparser.parsetab",
             outputdir=outputdir,
             debug=debug
         )
@@ -76,6 +88,14 @@ class VerilogParser(object):
     def parse(self, text, debug=0):
         return self.parser.parse(text, lexer=self.lexer, debug=debug)
 
+    # Yields top-level definitions (ModuleDef/Pragma) one at a time
+    def parse_modules(self, lines, debug=0):
+        for lineno, text in split_modules(lines):
+            self.lexer.lexer.lineno = lineno
+            ast = self.parser.parse(text, lexer=self.lexer, debug=debug)
+            for definition in ast.description.definitions:
+                yield definition
+
     # --------------------------------------------------------------------------
     # Parse Rule Definition
     # --------------------------------------------------------------------------
@@ -86,17 +106,18 @@ class VerilogParser(object):
 
     def p_description(self, p):
         'description : definitions'
-        p[0] = Description(definitions=p[1], lineno=p.lineno(1))
+        p[0] = Description(definitions=tuple(p[1]), lineno=p.lineno(1))
         p.set_lineno(0, p.lineno(1))
 
     def p_definitions(self, p):
         'definitions : definitions definition'
-        p[0] = p[1] + (p[2],)
+        p[1].append(p[2])
+        p[0] = p[1]
         p.set_lineno(0, p.lineno(1))
 
     def p_definitions_one(self, p):
         'definitions : definition'
-        p[0] = (p[1],)
+        p[0] = [p[1]]
         p.set_lineno(0, p.lineno(1))
 
     def p_definition(self, p):
@@ -125,7 +146,7 @@ class VerilogParser(object):
     # --------------------------------------------------------------------------
     def p_moduledef(self, p):
         'moduledef : MODULE modulename paramlist portlist items ENDMODULE'
-        p[0] = ModuleDef(name=p[2], paramlist=p[3], portlist=p[4], items=p[5],
+        p[0] = ModuleDef(name=p[2], paramlist=p[3], portlist=p[4], items=tuple(p[5]),
                          default_nettype=self.get_default_nettype(), lineno=p.lineno(1))
         p.set_lineno(0, p.lineno(1))
         p[0].end_lineno = p.lineno(6)
@@ -473,17 +494,18 @@ class VerilogParser(object):
 
     def p_items(self, p):
         'items : items item'
-        p[0] = p[1] + (p[2],)
+        p[1].append(p[2])
+        p[0] = p[1]
         p.set_lineno(0, p.lineno(1))
 
     def p_items_one(self, p):
         'items : item'
-        p[0] = (p[1],)
+        p[0] = [p[1]]
         p.set_lineno(0, p.lineno(1))
 
     def p_items_empty(self, p):
         'items : empty'
-        p[0] = ()
+        p[0] = []
 
     def p_item(self, p):
         """item : standard_item
@@ -2290,33 +2312,212 @@ class ParseError(Exception):
     pass
 
 
+_split_token = re.compile(r'/\*|//|`|"(?:[^"\\\n]|\\.)*"|\bendmodule\b')
+_split_noise = re.compile(r'/\*.*?\*/|//[^\n]*|`[^\n]*', re.DOTALL)
+
+
+def split_modules(lines):
+    """ Split Verilog source lines into chunks that each end with 'endmodule'.
+    Yields (lineno, text) where lineno is the line the chunk starts on, so a
+    chunk parsed on its own keeps the line numbers of the whole source. """
+    chunk = []
+    start = 1
+    lineno = 1
+    in_comment = False
+    for line in lines:
+        pos = 0
+        while True:
+            if in_comment:
+                end = line.find('*/', pos)
+                if end < 0:
+                    break
+                in_comment = False
+                pos = end + 2
+                continue
+            m = _split_token.search(line, pos)
+            if m is None:
+                break
+            token = m.group()
+            if token == '/*':
+                in_comment = True
+                pos = m.end()
+            elif token in ('//', '`'):
+                break
+            elif token == 'endmodule':
+                chunk.append(line[:m.end()])
+                yield start, ''.join(chunk)
+                chunk = []
+                start = lineno
+                line = line[m.end():]
+                pos = 0
+            else:
+                pos = m.end()
+        chunk.append(line)
+        lineno += 1
+
+    rest = ''.join(chunk)
+    if _split_noise.sub('', rest).strip():
+        yield start, rest
+
+
+class ParseCache(object):
+    """ On-disk AST cache keyed by the preprocessed source text """
+
+    # bump whenever the pickled AST layout changes
+    version = 2
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def key(self, text, include=None, define=None):
+        h = hashlib.sha256()
+        h.update(('%s:%d\n' % (pyverilog.__version__, self.version)).encode())
+        for inc in (include or ()):
+            h.update(('-I%s\n' % inc).encode())
+        for dfn in (define or ()):
+            h.update(('-D%s\n' % dfn).encode())
+        h.update(text.encode('utf-8', 'surrogateescape'))
+        return h.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.pkl')
+
+    def load(self, key):
+        path = self.path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # a truncated or stale entry is just a miss
+            return None
+
+    def store(self, key, ast, directives):
+        path = self.path(key)
+        dirname = os.path.dirname(path)
+        pathlib.Path(dirname).mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.pyverilog_cache_', dir=dirname)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((ast, directives), f, protocol=pickle.HIGHEST_PROTOCOL)
+            # atomic, so concurrent jobs never see a partial entry
+            os.replace(tmp_path, path)
+        except (RecursionError, pickle.PicklingError, OSError):
+            os.remove(tmp_path)
+
+
+_worker_parser = None
+
+
+def _parse_chunk(chunk):
+    # runs in a pool worker; each worker builds its own parser once
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = VerilogParser()
+    lineno, text = chunk
+    _worker_parser.lexer.directives = []
+    _worker_parser.lexer.default_nettype = 'wire'
+    _worker_parser.lexer.lexer.lineno = lineno
+    ast = _worker_parser.parse(text)
+    return ast.description.definitions, _worker_parser.get_directives()
+
+
+def parse_parallel(text, jobs=None):
+    """ Parse each module of text in a process pool and merge the ModuleDefs
+    into one Source, in source order. Returns (ast, directives).
+    `default_nettype is lexer state that carries over into the modules after
+    it, which chunks parsed apart would not see, so such a source is parsed
+    serially. """
+    if '`default_nettype' in text:
+        parser = VerilogParser()
+        ast = parser.parse(text)
+        return ast, parser.get_directives()
+    chunks = list(split_modules(io.StringIO(text)))
+    definitions = []
+    directives = []
+    if len(chunks) > 1:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        results = executor.map(_parse_chunk, chunks)
+    else:
+        executor = None
+        results = map(_parse_chunk, chunks)
+    try:
+        for defs, dirs in results:
+            definitions.extend(defs)
+            directives.extend(dirs)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    lineno = definitions[0].lineno if definitions else 0
+    description = Description(definitions=tuple(definitions), lineno=lineno)
+    return Source(name='', description=description, lineno=lineno), tuple(directives)
+
+
 class VerilogCodeParser(object):
 
     def __init__(self, filelist, preprocess_output='preprocess.output',
                  preprocess_include=None,
                  preprocess_define=None,
-                 outputdir=".",
-                 debug=True
+                 outputdir=None,
+                 debug=False,
+                 cache_dir=None,
+                 jobs=1
                  ):
         self.preprocess_output = preprocess_output
+        self.preprocess_include = preprocess_include
+        self.preprocess_define = preprocess_define
         self.directives = ()
         self.preprocessor = VerilogPreprocessor(filelist, preprocess_output,
                                                 preprocess_include,
                                                 preprocess_define)
-        self.parser = VerilogParser(outputdir=outputdir, debug=debug)
+        self.outputdir = outputdir
+        self.debug = debug
+        self.jobs = jobs
+        self._parser = None
+
+        if cache_dir is None:
+            cache_dir = os.environ.get('PYVERILOG_PARSE_CACHE')
+        self.cache = ParseCache(cache_dir) if cache_dir else None
+
+    @property
+    def parser(self):
+        # built on first use, so a cache hit never pays for the LALR tables
+        if self._parser is None:
+            self._parser = VerilogParser(outputdir=self.outputdir, debug=self.debug)
+        return self._parser
 
     def preprocess(self):
-        self.preprocessor.preprocess()
-        text = open(self.preprocess_output).read()
-        os.remove(self.preprocess_output)
-        return text
+        return self.preprocessor.preprocess_text()
 
     def parse(self, preprocess_output='preprocess.output', debug=0):
         text = self.preprocess()
-        ast = self.parser.parse(text, debug=debug)
-        self.directives = self.parser.get_directives()
+
+        if self.cache is not None:
+            key = self.cache.key(text, self.preprocess_include, self.preprocess_define)
+            cached = self.cache.load(key)
+            if cached is not None:
+                ast, self.directives = cached
+                return ast
+
+        if self.jobs != 1 and not debug:
+            ast, self.directives = parse_parallel(text, self.jobs)
+        else:
+            ast = self.parser.parse(text, debug=debug)
+            self.directives = self.parser.get_directives()
+
+        if self.cache is not None:
+            self.cache.store(key, ast, self.directives)
         return ast
 
+    def parse_modules(self, debug=0):
+        try:
+            lines = self.preprocessor.preprocess_lines()
+            for definition in self.parser.parse_modules(lines, debug=debug):
+                yield definition
+        finally:
+            self.directives = self.parser.get_directives()
+
     def get_directives(self):
         return self.directives
 
@@ -2325,16 +2526,37 @@ def parse(
     filelist,
     preprocess_include=None,
     preprocess_define=None,
-    outputdir=".",
-    debug=True
+    outputdir=None,
+    debug=False,
+    cache_dir=None,
+    jobs=1
 ):
     codeparser = VerilogCodeParser(
         filelist,
         preprocess_include=preprocess_include,
         preprocess_define=preprocess_define,
         outputdir=outputdir,
-        debug=debug
+        debug=debug,
+        cache_dir=cache_dir,
+        jobs=jobs
     )
     ast = codeparser.parse()
     directives = codeparser.get_directives()
     return ast, directives
+
+
+def parse_modules(
+    filelist,
+    preprocess_include=None,
+    preprocess_define=None,
+    outputdir=None,
+    debug=False
+):
+    codeparser = VerilogCodeParser(
+        filelist,
+        preprocess_include=preprocess_include,
+        preprocess_define=preprocess_define,
+        outputdir=outputdir,
+        debug=debug
+    )
+    return codeparser.parse_modules()
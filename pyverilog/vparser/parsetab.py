@@ -27,417 +27,417 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> source_text","S'",1,None,None,None),
-  ('source_text -> description','source_text',1,'p_source_text','parser.py',83),
-  ('description -> definitions','description',1,'p_description','parser.py',88),
-  ('definitions -> definitions definition','definitions',2,'p_definitions','parser.py',93),
-  ('definitions -> definition','definitions',1,'p_definitions_one','parser.py',98),
-  ('definition -> moduledef','definition',1,'p_definition','parser.py',103),
-  ('definition -> pragma','definition',1,'p_definition_pragma','parser.py',108),
-  ('pragma -> LPAREN TIMES ID EQUALS expression TIMES RPAREN','pragma',7,'p_pragma_assign','parser.py',114),
-  ('pragma -> LPAREN TIMES ID TIMES RPAREN','pragma',5,'p_pragma','parser.py',120),
-  ('moduledef -> MODULE modulename paramlist portlist items ENDMODULE','moduledef',6,'p_moduledef','parser.py',127),
-  ('modulename -> ID','modulename',1,'p_modulename','parser.py',134),
-  ('modulename -> SENS_OR','modulename',1,'p_modulename_or','parser.py',139),
-  ('paramlist -> DELAY LPAREN params RPAREN','paramlist',4,'p_paramlist','parser.py',144),
-  ('paramlist -> empty','paramlist',1,'p_paramlist_empty','parser.py',149),
-  ('params -> params_begin param_end','params',2,'p_params','parser.py',153),
-  ('params_begin -> params_begin param','params_begin',2,'p_params_begin','parser.py',158),
-  ('params_begin -> param','params_begin',1,'p_params_begin_one','parser.py',163),
-  ('params -> param_end','params',1,'p_params_one','parser.py',168),
-  ('param -> PARAMETER param_substitution_list COMMA','param',3,'p_param','parser.py',173),
-  ('param -> PARAMETER SIGNED param_substitution_list COMMA','param',4,'p_param_signed','parser.py',180),
-  ('param -> PARAMETER width param_substitution_list COMMA','param',4,'p_param_width','parser.py',187),
-  ('param -> PARAMETER SIGNED width param_substitution_list COMMA','param',5,'p_param_signed_width','parser.py',194),
-  ('param -> PARAMETER INTEGER param_substitution_list COMMA','param',4,'p_param_integer','parser.py',201),
-  ('param_end -> PARAMETER param_substitution_list','param_end',2,'p_param_end','parser.py',208),
-  ('param_end -> PARAMETER SIGNED param_substitution_list','param_end',3,'p_param_end_signed','parser.py',215),
-  ('param_end -> PARAMETER width param_substitution_list','param_end',3,'p_param_end_width','parser.py',222),
-  ('param_end -> PARAMETER SIGNED width param_substitution_list','param_end',4,'p_param_end_signed_width','parser.py',229),
-  ('param_end -> PARAMETER INTEGER param_substitution_list','param_end',3,'p_param_end_integer','parser.py',236),
-  ('portlist -> LPAREN ports RPAREN SEMICOLON','portlist',4,'p_portlist','parser.py',243),
-  ('portlist -> LPAREN ioports RPAREN SEMICOLON','portlist',4,'p_portlist_io','parser.py',248),
-  ('portlist -> LPAREN RPAREN SEMICOLON','portlist',3,'p_portlist_paren_empty','parser.py',253),
-  ('portlist -> SEMICOLON','portlist',1,'p_portlist_empty','parser.py',258),
-  ('ports -> ports COMMA portname','ports',3,'p_ports','parser.py',263),
-  ('ports -> portname','ports',1,'p_ports_one','parser.py',269),
-  ('portname -> ID','portname',1,'p_portname','parser.py',275),
-  ('sigtypes -> sigtypes sigtype','sigtypes',2,'p_sigtypes','parser.py',280),
-  ('sigtypes -> sigtype','sigtypes',1,'p_sigtypes_one','parser.py',285),
-  ('sigtype -> INPUT','sigtype',1,'p_sigtype_input','parser.py',290),
-  ('sigtype -> OUTPUT','sigtype',1,'p_sigtype_output','parser.py',295),
-  ('sigtype -> INOUT','sigtype',1,'p_sigtype_inout','parser.py',300),
-  ('sigtype -> TRI','sigtype',1,'p_sigtype_tri','parser.py',305),
-  ('sigtype -> REG','sigtype',1,'p_sigtype_reg','parser.py',310),
-  ('sigtype -> LOGIC','sigtype',1,'p_sigtype_logic','parser.py',315),
-  ('sigtype -> WIRE','sigtype',1,'p_sigtype_wire','parser.py',320),
-  ('sigtype -> SIGNED','sigtype',1,'p_sigtype_signed','parser.py',325),
-  ('sigtype -> SUPPLY0','sigtype',1,'p_sigtype_supply0','parser.py',330),
-  ('sigtype -> SUPPLY1','sigtype',1,'p_sigtype_supply1','parser.py',335),
-  ('ioports -> ioports COMMA ioport','ioports',3,'p_ioports','parser.py',340),
-  ('ioports -> ioport_head','ioports',1,'p_ioports_one','parser.py',368),
-  ('ioport -> sigtypes portname','ioport',2,'p_ioport','parser.py',418),
-  ('ioport -> sigtypes width portname','ioport',3,'p_ioport_width','parser.py',423),
-  ('ioport -> sigtypes width portname dimensions','ioport',4,'p_ioport_dimensions','parser.py',428),
-  ('ioport_head -> sigtypes portname','ioport_head',2,'p_ioport_head','parser.py',433),
-  ('ioport_head -> sigtypes width portname','ioport_head',3,'p_ioport_head_width','parser.py',438),
-  ('ioport_head -> sigtypes width portname dimensions','ioport_head',4,'p_ioport_head_dimensions','parser.py',443),
-  ('ioport -> portname','ioport',1,'p_ioport_portname','parser.py',448),
-  ('width -> LBRACKET expression COLON expression RBRACKET','width',5,'p_width','parser.py',453),
-  ('length -> LBRACKET expression COLON expression RBRACKET','length',5,'p_length','parser.py',458),
-  ('dimensions -> dimensions length','dimensions',2,'p_dimensions','parser.py',463),
-  ('dimensions -> length','dimensions',1,'p_dimensions_one','parser.py',469),
-  ('items -> items item','items',2,'p_items','parser.py',475),
-  ('items -> item','items',1,'p_items_one','parser.py',480),
-  ('items -> empty','items',1,'p_items_empty','parser.py',485),
-  ('item -> standard_item','item',1,'p_item','parser.py',489),
-  ('item -> generate','item',1,'p_item','parser.py',490),
-  ('standard_item -> decl','standard_item',1,'p_standard_item','parser.py',496),
-  ('standard_item -> integerdecl','standard_item',1,'p_standard_item','parser.py',497),
-  ('standard_item -> realdecl','standard_item',1,'p_standard_item','parser.py',498),
-  ('standard_item -> declassign','standard_item',1,'p_standard_item','parser.py',499),
-  ('standard_item -> parameterdecl','standard_item',1,'p_standard_item','parser.py',500),
-  ('standard_item -> localparamdecl','standard_item',1,'p_standard_item','parser.py',501),
-  ('standard_item -> genvardecl','standard_item',1,'p_standard_item','parser.py',502),
-  ('standard_item -> assignment','standard_item',1,'p_standard_item','parser.py',503),
-  ('standard_item -> always','standard_item',1,'p_standard_item','parser.py',504),
-  ('standard_item -> always_ff','standard_item',1,'p_standard_item','parser.py',505),
-  ('standard_item -> always_comb','standard_item',1,'p_standard_item','parser.py',506),
-  ('standard_item -> always_latch','standard_item',1,'p_standard_item','parser.py',507),
-  ('standard_item -> initial','standard_item',1,'p_standard_item','parser.py',508),
-  ('standard_item -> instance','standard_item',1,'p_standard_item','parser.py',509),
-  ('standard_item -> function','standard_item',1,'p_standard_item','parser.py',510),
-  ('standard_item -> task','standard_item',1,'p_standard_item','parser.py',511),
-  ('standard_item -> pragma','standard_item',1,'p_standard_item','parser.py',512),
-  ('decl -> sigtypes declnamelist SEMICOLON','decl',3,'p_decl','parser.py',572),
-  ('decl -> sigtypes width declnamelist SEMICOLON','decl',4,'p_decl_width','parser.py',581),
-  ('declnamelist -> declnamelist COMMA declname','declnamelist',3,'p_declnamelist','parser.py',590),
-  ('declnamelist -> declname','declnamelist',1,'p_declnamelist_one','parser.py',595),
-  ('declname -> ID','declname',1,'p_declname','parser.py',600),
-  ('declname -> ID dimensions','declname',2,'p_declarray','parser.py',605),
-  ('declassign -> sigtypes declassign_element SEMICOLON','declassign',3,'p_declassign','parser.py',655),
-  ('declassign -> sigtypes width declassign_element SEMICOLON','declassign',4,'p_declassign_width','parser.py',662),
-  ('declassign_element -> ID EQUALS rvalue','declassign_element',3,'p_declassign_element','parser.py',669),
-  ('declassign_element -> delays ID EQUALS delays rvalue','declassign_element',5,'p_declassign_element_delay','parser.py',676),
-  ('integerdecl -> INTEGER integernamelist SEMICOLON','integerdecl',3,'p_integerdecl','parser.py',684),
-  ('integerdecl -> INTEGER SIGNED integernamelist SEMICOLON','integerdecl',4,'p_integerdecl_signed','parser.py',696),
-  ('integernamelist -> integernamelist COMMA integername','integernamelist',3,'p_integernamelist','parser.py',708),
-  ('integernamelist -> integername','integernamelist',1,'p_integernamelist_one','parser.py',713),
-  ('integername -> ID EQUALS rvalue','integername',3,'p_integername_init','parser.py',718),
-  ('integername -> ID','integername',1,'p_integername','parser.py',723),
-  ('realdecl -> REAL realnamelist SEMICOLON','realdecl',3,'p_realdecl','parser.py',729),
-  ('realnamelist -> realnamelist COMMA realname','realnamelist',3,'p_realnamelist','parser.py',739),
-  ('realnamelist -> realname','realnamelist',1,'p_realnamelist_one','parser.py',744),
-  ('realname -> ID','realname',1,'p_realname','parser.py',749),
-  ('parameterdecl -> PARAMETER param_substitution_list SEMICOLON','parameterdecl',3,'p_parameterdecl','parser.py',755),
-  ('parameterdecl -> PARAMETER SIGNED param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_signed','parser.py',762),
-  ('parameterdecl -> PARAMETER width param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_width','parser.py',769),
-  ('parameterdecl -> PARAMETER SIGNED width param_substitution_list SEMICOLON','parameterdecl',5,'p_parameterdecl_signed_width','parser.py',776),
-  ('parameterdecl -> PARAMETER INTEGER param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_integer','parser.py',783),
-  ('localparamdecl -> LOCALPARAM param_substitution_list SEMICOLON','localparamdecl',3,'p_localparamdecl','parser.py',790),
-  ('localparamdecl -> LOCALPARAM SIGNED param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_signed','parser.py',797),
-  ('localparamdecl -> LOCALPARAM width param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_width','parser.py',804),
-  ('localparamdecl -> LOCALPARAM SIGNED width param_substitution_list SEMICOLON','localparamdecl',5,'p_localparamdecl_signed_width','parser.py',811),
-  ('localparamdecl -> LOCALPARAM INTEGER param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_integer','parser.py',818),
-  ('param_substitution_list -> param_substitution_list COMMA param_substitution','param_substitution_list',3,'p_param_substitution_list','parser.py',825),
-  ('param_substitution_list -> param_substitution','param_substitution_list',1,'p_param_substitution_list_one','parser.py',830),
-  ('param_substitution -> ID EQUALS rvalue','param_substitution',3,'p_param_substitution','parser.py',835),
-  ('assignment -> ASSIGN lvalue EQUALS rvalue SEMICOLON','assignment',5,'p_assignment','parser.py',840),
-  ('assignment -> ASSIGN delays lvalue EQUALS delays rvalue SEMICOLON','assignment',7,'p_assignment_delay','parser.py',845),
-  ('lpartselect -> pointer LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer','parser.py',851),
-  ('lpartselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_plus','parser.py',856),
-  ('lpartselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_minus','parser.py',861),
-  ('lpartselect -> identifier LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect','parser.py',866),
-  ('lpartselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_plus','parser.py',871),
-  ('lpartselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_minus','parser.py',876),
-  ('lpointer -> pointer','lpointer',1,'p_lpointer','parser.py',881),
-  ('lconcat -> LBRACE lconcatlist RBRACE','lconcat',3,'p_lconcat','parser.py',886),
-  ('lconcatlist -> lconcatlist COMMA lconcat_one','lconcatlist',3,'p_lconcatlist','parser.py',891),
-  ('lconcatlist -> lconcat_one','lconcatlist',1,'p_lconcatlist_one','parser.py',896),
-  ('lconcat_one -> identifier','lconcat_one',1,'p_lconcat_one_identifier','parser.py',901),
-  ('lconcat_one -> lpartselect','lconcat_one',1,'p_lconcat_one_lpartselect','parser.py',906),
-  ('lconcat_one -> lpointer','lconcat_one',1,'p_lconcat_one_lpointer','parser.py',911),
-  ('lconcat_one -> lconcat','lconcat_one',1,'p_lconcat_one_lconcat','parser.py',916),
-  ('lvalue -> lpartselect','lvalue',1,'p_lvalue_partselect','parser.py',921),
-  ('lvalue -> lpointer','lvalue',1,'p_lvalue_pointer','parser.py',926),
-  ('lvalue -> lconcat','lvalue',1,'p_lvalue_concat','parser.py',931),
-  ('lvalue -> identifier','lvalue',1,'p_lvalue_one','parser.py',936),
-  ('rvalue -> expression','rvalue',1,'p_rvalue','parser.py',941),
-  ('expression -> MINUS expression','expression',2,'p_expression_uminus','parser.py',948),
-  ('expression -> PLUS expression','expression',2,'p_expression_uplus','parser.py',953),
-  ('expression -> LNOT expression','expression',2,'p_expression_ulnot','parser.py',958),
-  ('expression -> NOT expression','expression',2,'p_expression_unot','parser.py',963),
-  ('expression -> AND expression','expression',2,'p_expression_uand','parser.py',968),
-  ('expression -> NAND expression','expression',2,'p_expression_unand','parser.py',973),
-  ('expression -> NOR expression','expression',2,'p_expression_unor','parser.py',978),
-  ('expression -> OR expression','expression',2,'p_expression_uor','parser.py',983),
-  ('expression -> XOR expression','expression',2,'p_expression_uxor','parser.py',988),
-  ('expression -> XNOR expression','expression',2,'p_expression_uxnor','parser.py',993),
-  ('expression -> expression POWER expression','expression',3,'p_expression_power','parser.py',1000),
-  ('expression -> expression TIMES expression','expression',3,'p_expression_times','parser.py',1007),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression_div','parser.py',1012),
-  ('expression -> expression MOD expression','expression',3,'p_expression_mod','parser.py',1017),
-  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','parser.py',1024),
-  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','parser.py',1029),
-  ('expression -> expression LSHIFT expression','expression',3,'p_expression_sll','parser.py',1036),
-  ('expression -> expression RSHIFT expression','expression',3,'p_expression_srl','parser.py',1041),
-  ('expression -> expression LSHIFTA expression','expression',3,'p_expression_sla','parser.py',1046),
-  ('expression -> expression RSHIFTA expression','expression',3,'p_expression_sra','parser.py',1051),
-  ('expression -> expression LT expression','expression',3,'p_expression_lessthan','parser.py',1058),
-  ('expression -> expression GT expression','expression',3,'p_expression_greaterthan','parser.py',1063),
-  ('expression -> expression LE expression','expression',3,'p_expression_lesseq','parser.py',1068),
-  ('expression -> expression GE expression','expression',3,'p_expression_greatereq','parser.py',1073),
-  ('expression -> expression EQ expression','expression',3,'p_expression_eq','parser.py',1080),
-  ('expression -> expression NE expression','expression',3,'p_expression_noteq','parser.py',1085),
-  ('expression -> expression EQL expression','expression',3,'p_expression_eql','parser.py',1090),
-  ('expression -> expression NEL expression','expression',3,'p_expression_noteql','parser.py',1095),
-  ('expression -> expression AND expression','expression',3,'p_expression_And','parser.py',1102),
-  ('expression -> expression XOR expression','expression',3,'p_expression_Xor','parser.py',1107),
-  ('expression -> expression XNOR expression','expression',3,'p_expression_Xnor','parser.py',1112),
-  ('expression -> expression OR expression','expression',3,'p_expression_Or','parser.py',1119),
-  ('expression -> expression LAND expression','expression',3,'p_expression_land','parser.py',1126),
-  ('expression -> expression LOR expression','expression',3,'p_expression_lor','parser.py',1133),
-  ('expression -> expression COND expression COLON expression','expression',5,'p_expression_cond','parser.py',1140),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_expr','parser.py',1146),
-  ('expression -> concat','expression',1,'p_expression_concat','parser.py',1152),
-  ('expression -> repeat','expression',1,'p_expression_repeat','parser.py',1157),
-  ('expression -> partselect','expression',1,'p_expression_partselect','parser.py',1162),
-  ('expression -> pointer','expression',1,'p_expression_pointer','parser.py',1167),
-  ('expression -> functioncall','expression',1,'p_expression_functioncall','parser.py',1172),
-  ('expression -> systemcall','expression',1,'p_expression_systemcall','parser.py',1177),
-  ('expression -> identifier','expression',1,'p_expression_id','parser.py',1182),
-  ('expression -> const_expression','expression',1,'p_expression_const','parser.py',1187),
-  ('concat -> LBRACE concatlist RBRACE','concat',3,'p_concat','parser.py',1192),
-  ('concatlist -> concatlist COMMA expression','concatlist',3,'p_concatlist','parser.py',1197),
-  ('concatlist -> expression','concatlist',1,'p_concatlist_one','parser.py',1202),
-  ('repeat -> LBRACE expression concat RBRACE','repeat',4,'p_repeat','parser.py',1207),
-  ('partselect -> identifier LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect','parser.py',1212),
-  ('partselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_plus','parser.py',1217),
-  ('partselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_minus','parser.py',1223),
-  ('partselect -> pointer LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect_pointer','parser.py',1229),
-  ('partselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_plus','parser.py',1234),
-  ('partselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_minus','parser.py',1240),
-  ('pointer -> identifier LBRACKET expression RBRACKET','pointer',4,'p_pointer','parser.py',1246),
-  ('pointer -> pointer LBRACKET expression RBRACKET','pointer',4,'p_pointer_pointer','parser.py',1251),
-  ('const_expression -> intnumber','const_expression',1,'p_const_expression_intnum','parser.py',1257),
-  ('const_expression -> floatnumber','const_expression',1,'p_const_expression_floatnum','parser.py',1262),
-  ('const_expression -> stringliteral','const_expression',1,'p_const_expression_stringliteral','parser.py',1267),
-  ('floatnumber -> FLOATNUMBER','floatnumber',1,'p_floatnumber','parser.py',1272),
-  ('intnumber -> INTNUMBER_DEC','intnumber',1,'p_intnumber','parser.py',1277),
-  ('intnumber -> SIGNED_INTNUMBER_DEC','intnumber',1,'p_intnumber','parser.py',1278),
-  ('intnumber -> INTNUMBER_BIN','intnumber',1,'p_intnumber','parser.py',1279),
-  ('intnumber -> SIGNED_INTNUMBER_BIN','intnumber',1,'p_intnumber','parser.py',1280),
-  ('intnumber -> INTNUMBER_OCT','intnumber',1,'p_intnumber','parser.py',1281),
-  ('intnumber -> SIGNED_INTNUMBER_OCT','intnumber',1,'p_intnumber','parser.py',1282),
-  ('intnumber -> INTNUMBER_HEX','intnumber',1,'p_intnumber','parser.py',1283),
-  ('intnumber -> SIGNED_INTNUMBER_HEX','intnumber',1,'p_intnumber','parser.py',1284),
-  ('stringliteral -> STRING_LITERAL','stringliteral',1,'p_stringliteral','parser.py',1292),
-  ('always -> ALWAYS senslist always_statement','always',3,'p_always','parser.py',1299),
-  ('always_ff -> ALWAYS_FF senslist always_statement','always_ff',3,'p_always_ff','parser.py',1304),
-  ('always_comb -> ALWAYS_COMB senslist always_statement','always_comb',3,'p_always_comb','parser.py',1309),
-  ('always_latch -> ALWAYS_LATCH senslist always_statement','always_latch',3,'p_always_latch','parser.py',1314),
-  ('senslist -> AT LPAREN edgesigs RPAREN','senslist',4,'p_sens_egde_paren','parser.py',1319),
-  ('edgesig -> POSEDGE edgesig_base','edgesig',2,'p_posedgesig','parser.py',1324),
-  ('edgesig -> NEGEDGE edgesig_base','edgesig',2,'p_negedgesig','parser.py',1329),
-  ('edgesig_base -> identifier','edgesig_base',1,'p_edgesig_base_identifier','parser.py',1334),
-  ('edgesig_base -> pointer','edgesig_base',1,'p_edgesig_base_pointer','parser.py',1339),
-  ('edgesigs -> edgesigs SENS_OR edgesig','edgesigs',3,'p_edgesigs','parser.py',1344),
-  ('edgesigs -> edgesigs COMMA edgesig','edgesigs',3,'p_edgesigs_comma','parser.py',1349),
-  ('edgesigs -> edgesig','edgesigs',1,'p_edgesigs_one','parser.py',1354),
-  ('senslist -> empty','senslist',1,'p_sens_empty','parser.py',1359),
-  ('senslist -> AT levelsig','senslist',2,'p_sens_level','parser.py',1365),
-  ('senslist -> AT LPAREN levelsigs RPAREN','senslist',4,'p_sens_level_paren','parser.py',1370),
-  ('levelsig -> levelsig_base','levelsig',1,'p_levelsig','parser.py',1375),
-  ('levelsig_base -> identifier','levelsig_base',1,'p_levelsig_base_identifier','parser.py',1380),
-  ('levelsig_base -> pointer','levelsig_base',1,'p_levelsig_base_pointer','parser.py',1385),
-  ('levelsig_base -> partselect','levelsig_base',1,'p_levelsig_base_partselect','parser.py',1390),
-  ('levelsigs -> levelsigs SENS_OR levelsig','levelsigs',3,'p_levelsigs','parser.py',1395),
-  ('levelsigs -> levelsigs COMMA levelsig','levelsigs',3,'p_levelsigs_comma','parser.py',1400),
-  ('levelsigs -> levelsig','levelsigs',1,'p_levelsigs_one','parser.py',1405),
-  ('senslist -> AT TIMES','senslist',2,'p_sens_all','parser.py',1410),
-  ('senslist -> AT LPAREN TIMES RPAREN','senslist',4,'p_sens_all_paren','parser.py',1416),
-  ('basic_statement -> if_statement','basic_statement',1,'p_basic_statement','parser.py',1422),
-  ('basic_statement -> case_statement','basic_statement',1,'p_basic_statement','parser.py',1423),
-  ('basic_statement -> casex_statement','basic_statement',1,'p_basic_statement','parser.py',1424),
-  ('basic_statement -> casez_statement','basic_statement',1,'p_basic_statement','parser.py',1425),
-  ('basic_statement -> unique_case_statement','basic_statement',1,'p_basic_statement','parser.py',1426),
-  ('basic_statement -> for_statement','basic_statement',1,'p_basic_statement','parser.py',1427),
-  ('basic_statement -> while_statement','basic_statement',1,'p_basic_statement','parser.py',1428),
-  ('basic_statement -> event_statement','basic_statement',1,'p_basic_statement','parser.py',1429),
-  ('basic_statement -> wait_statement','basic_statement',1,'p_basic_statement','parser.py',1430),
-  ('basic_statement -> forever_statement','basic_statement',1,'p_basic_statement','parser.py',1431),
-  ('basic_statement -> block','basic_statement',1,'p_basic_statement','parser.py',1432),
-  ('basic_statement -> namedblock','basic_statement',1,'p_basic_statement','parser.py',1433),
-  ('basic_statement -> parallelblock','basic_statement',1,'p_basic_statement','parser.py',1434),
-  ('basic_statement -> blocking_substitution','basic_statement',1,'p_basic_statement','parser.py',1435),
-  ('basic_statement -> nonblocking_substitution','basic_statement',1,'p_basic_statement','parser.py',1436),
-  ('basic_statement -> single_statement','basic_statement',1,'p_basic_statement','parser.py',1437),
-  ('always_statement -> basic_statement','always_statement',1,'p_always_statement','parser.py',1443),
-  ('blocking_substitution -> delays lvalue EQUALS delays rvalue SEMICOLON','blocking_substitution',6,'p_blocking_substitution','parser.py',1449),
-  ('blocking_substitution_base -> delays lvalue EQUALS delays rvalue','blocking_substitution_base',5,'p_blocking_substitution_base','parser.py',1454),
-  ('nonblocking_substitution -> delays lvalue LE delays rvalue SEMICOLON','nonblocking_substitution',6,'p_nonblocking_substitution','parser.py',1459),
-  ('delays -> DELAY LPAREN expression RPAREN','delays',4,'p_delays','parser.py',1466),
-  ('delays -> DELAY identifier','delays',2,'p_delays_identifier','parser.py',1471),
-  ('delays -> DELAY intnumber','delays',2,'p_delays_intnumber','parser.py',1476),
-  ('delays -> DELAY floatnumber','delays',2,'p_delays_floatnumber','parser.py',1482),
-  ('delays -> empty','delays',1,'p_delays_empty','parser.py',1488),
-  ('block -> BEGIN block_statements END','block',3,'p_block','parser.py',1493),
-  ('block -> BEGIN END','block',2,'p_block_empty','parser.py',1498),
-  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','parser.py',1503),
-  ('block_statements -> block_statement','block_statements',1,'p_block_statements_one','parser.py',1508),
-  ('block_statement -> basic_statement','block_statement',1,'p_block_statement','parser.py',1513),
-  ('namedblock -> BEGIN COLON ID namedblock_statements END','namedblock',5,'p_namedblock','parser.py',1519),
-  ('namedblock -> BEGIN COLON ID END','namedblock',4,'p_namedblock_empty','parser.py',1524),
-  ('namedblock_statements -> namedblock_statements namedblock_statement','namedblock_statements',2,'p_namedblock_statements','parser.py',1529),
-  ('namedblock_statements -> namedblock_statement','namedblock_statements',1,'p_namedblock_statements_one','parser.py',1534),
-  ('namedblock_statement -> basic_statement','namedblock_statement',1,'p_namedblock_statement','parser.py',1539),
-  ('namedblock_statement -> decl','namedblock_statement',1,'p_namedblock_statement','parser.py',1540),
-  ('namedblock_statement -> integerdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1541),
-  ('namedblock_statement -> realdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1542),
-  ('namedblock_statement -> parameterdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1543),
-  ('namedblock_statement -> localparamdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1544),
-  ('parallelblock -> FORK block_statements JOIN','parallelblock',3,'p_parallelblock','parser.py',1557),
-  ('parallelblock -> FORK JOIN','parallelblock',2,'p_parallelblock_empty','parser.py',1562),
-  ('if_statement -> IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',7,'p_if_statement','parser.py',1568),
-  ('if_statement -> IF LPAREN cond RPAREN true_statement','if_statement',5,'p_if_statement_woelse','parser.py',1573),
-  ('if_statement -> delays IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',8,'p_if_statement_delay','parser.py',1578),
-  ('if_statement -> delays IF LPAREN cond RPAREN true_statement','if_statement',6,'p_if_statement_woelse_delay','parser.py',1583),
-  ('cond -> expression','cond',1,'p_cond','parser.py',1588),
-  ('ifcontent_statement -> basic_statement','ifcontent_statement',1,'p_ifcontent_statement','parser.py',1593),
-  ('true_statement -> ifcontent_statement','true_statement',1,'p_true_statement','parser.py',1598),
-  ('else_statement -> ifcontent_statement','else_statement',1,'p_else_statement','parser.py',1603),
-  ('for_statement -> FOR LPAREN forpre forcond forpost RPAREN forcontent_statement','for_statement',7,'p_for_statement','parser.py',1609),
-  ('forpre -> blocking_substitution','forpre',1,'p_forpre','parser.py',1614),
-  ('forpre -> SEMICOLON','forpre',1,'p_forpre_empty','parser.py',1619),
-  ('forcond -> cond SEMICOLON','forcond',2,'p_forcond','parser.py',1624),
-  ('forcond -> SEMICOLON','forcond',1,'p_forcond_empty','parser.py',1629),
-  ('forpost -> blocking_substitution_base','forpost',1,'p_forpost','parser.py',1634),
-  ('forpost -> empty','forpost',1,'p_forpost_empty','parser.py',1639),
-  ('forcontent_statement -> basic_statement','forcontent_statement',1,'p_forcontent_statement','parser.py',1643),
-  ('while_statement -> WHILE LPAREN cond RPAREN whilecontent_statement','while_statement',5,'p_while_statement','parser.py',1649),
-  ('whilecontent_statement -> basic_statement','whilecontent_statement',1,'p_whilecontent_statement','parser.py',1654),
-  ('case_statement -> CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','case_statement',6,'p_case_statement','parser.py',1660),
-  ('casex_statement -> CASEX LPAREN case_comp RPAREN casecontent_statements ENDCASE','casex_statement',6,'p_casex_statement','parser.py',1665),
-  ('casez_statement -> CASEZ LPAREN case_comp RPAREN casecontent_statements ENDCASE','casez_statement',6,'p_casez_statement','parser.py',1670),
-  ('unique_case_statement -> UNIQUE CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','unique_case_statement',7,'p_unique_case_statement','parser.py',1675),
-  ('case_comp -> expression','case_comp',1,'p_case_comp','parser.py',1680),
-  ('casecontent_statements -> casecontent_statements casecontent_statement','casecontent_statements',2,'p_casecontent_statements','parser.py',1685),
-  ('casecontent_statements -> casecontent_statement','casecontent_statements',1,'p_casecontent_statements_one','parser.py',1690),
-  ('casecontent_statement -> casecontent_condition COLON basic_statement','casecontent_statement',3,'p_casecontent_statement','parser.py',1695),
-  ('casecontent_condition -> casecontent_condition COMMA expression','casecontent_condition',3,'p_casecontent_condition_single','parser.py',1700),
-  ('casecontent_condition -> expression','casecontent_condition',1,'p_casecontent_condition_one','parser.py',1705),
-  ('casecontent_statement -> DEFAULT COLON basic_statement','casecontent_statement',3,'p_casecontent_statement_default','parser.py',1710),
-  ('initial -> INITIAL initial_statement','initial',2,'p_initial','parser.py',1716),
-  ('initial_statement -> basic_statement','initial_statement',1,'p_initial_statement','parser.py',1721),
-  ('event_statement -> senslist SEMICOLON','event_statement',2,'p_event_statement','parser.py',1727),
-  ('wait_statement -> WAIT LPAREN cond RPAREN waitcontent_statement','wait_statement',5,'p_wait_statement','parser.py',1733),
-  ('waitcontent_statement -> basic_statement','waitcontent_statement',1,'p_waitcontent_statement','parser.py',1738),
-  ('waitcontent_statement -> SEMICOLON','waitcontent_statement',1,'p_waitcontent_statement_empty','parser.py',1743),
-  ('forever_statement -> FOREVER basic_statement','forever_statement',2,'p_forever_statement','parser.py',1749),
-  ('instance -> ID parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance','parser.py',1755),
-  ('instance -> SENS_OR parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance_or','parser.py',1765),
-  ('instance_bodylist -> instance_bodylist COMMA instance_body','instance_bodylist',3,'p_instance_bodylist','parser.py',1775),
-  ('instance_bodylist -> instance_body','instance_bodylist',1,'p_instance_bodylist_one','parser.py',1780),
-  ('instance_body -> ID LPAREN instance_ports RPAREN','instance_body',4,'p_instance_body','parser.py',1785),
-  ('instance_body -> ID width LPAREN instance_ports RPAREN','instance_body',5,'p_instance_body_array','parser.py',1790),
-  ('instance -> ID instance_bodylist_noname SEMICOLON','instance',3,'p_instance_noname','parser.py',1795),
-  ('instance -> SENS_OR instance_bodylist_noname SEMICOLON','instance',3,'p_instance_or_noname','parser.py',1804),
-  ('instance_bodylist_noname -> instance_bodylist_noname COMMA instance_body_noname','instance_bodylist_noname',3,'p_instance_bodylist_noname','parser.py',1813),
-  ('instance_bodylist_noname -> instance_body_noname','instance_bodylist_noname',1,'p_instance_bodylist_one_noname','parser.py',1818),
-  ('instance_body_noname -> LPAREN instance_ports RPAREN','instance_body_noname',3,'p_instance_body_noname','parser.py',1823),
-  ('parameterlist -> DELAY LPAREN param_args RPAREN','parameterlist',4,'p_parameterlist','parser.py',1828),
-  ('parameterlist -> DELAY LPAREN param_args_noname RPAREN','parameterlist',4,'p_parameterlist_noname','parser.py',1833),
-  ('parameterlist -> empty','parameterlist',1,'p_parameterlist_empty','parser.py',1838),
-  ('param_args_noname -> param_args_noname COMMA param_arg_noname','param_args_noname',3,'p_param_args_noname','parser.py',1842),
-  ('param_args_noname -> param_arg_noname','param_args_noname',1,'p_param_args_noname_one','parser.py',1847),
-  ('param_args -> param_args COMMA param_arg','param_args',3,'p_param_args','parser.py',1852),
-  ('param_args -> param_arg','param_args',1,'p_param_args_one','parser.py',1857),
-  ('param_args -> empty','param_args',1,'p_param_args_empty','parser.py',1862),
-  ('param_arg_noname -> expression','param_arg_noname',1,'p_param_arg_noname_exp','parser.py',1866),
-  ('param_arg -> DOT ID LPAREN expression RPAREN','param_arg',5,'p_param_arg_exp','parser.py',1871),
-  ('instance_ports -> instance_ports_list','instance_ports',1,'p_instance_ports','parser.py',1876),
-  ('instance_ports -> instance_ports_arg','instance_ports',1,'p_instance_ports','parser.py',1877),
-  ('instance_ports_list -> instance_ports_list COMMA instance_port_list','instance_ports_list',3,'p_instance_ports_list','parser.py',1883),
-  ('instance_ports_list -> instance_port_list','instance_ports_list',1,'p_instance_ports_list_one','parser.py',1888),
-  ('instance_ports_list -> empty','instance_ports_list',1,'p_instance_ports_list_empty','parser.py',1893),
-  ('instance_port_list -> expression','instance_port_list',1,'p_instance_port_list','parser.py',1898),
-  ('instance_ports_arg -> instance_ports_arg COMMA instance_port_arg','instance_ports_arg',3,'p_instance_ports_arg','parser.py',1903),
-  ('instance_ports_arg -> instance_port_arg','instance_ports_arg',1,'p_instance_ports_arg_one','parser.py',1908),
-  ('instance_port_arg -> DOT ID LPAREN identifier RPAREN','instance_port_arg',5,'p_instance_port_arg','parser.py',1913),
-  ('instance_port_arg -> DOT ID LPAREN expression RPAREN','instance_port_arg',5,'p_instance_port_arg_exp','parser.py',1918),
-  ('instance_port_arg -> DOT ID LPAREN RPAREN','instance_port_arg',4,'p_instance_port_arg_none','parser.py',1923),
-  ('genvardecl -> GENVAR genvarlist SEMICOLON','genvardecl',3,'p_genvardecl','parser.py',1929),
-  ('genvarlist -> genvarlist COMMA genvar','genvarlist',3,'p_genvarlist','parser.py',1934),
-  ('genvarlist -> genvar','genvarlist',1,'p_genvarlist_one','parser.py',1939),
-  ('genvar -> ID','genvar',1,'p_genvar','parser.py',1944),
-  ('generate -> GENERATE generate_items ENDGENERATE','generate',3,'p_generate','parser.py',1953),
-  ('generate_items -> empty','generate_items',1,'p_generate_items_empty','parser.py',1958),
-  ('generate_items -> generate_items generate_item','generate_items',2,'p_generate_items','parser.py',1963),
-  ('generate_items -> generate_item','generate_items',1,'p_generate_items_one','parser.py',1968),
-  ('generate_item -> standard_item','generate_item',1,'p_generate_item','parser.py',1973),
-  ('generate_item -> generate_if','generate_item',1,'p_generate_item','parser.py',1974),
-  ('generate_item -> generate_for','generate_item',1,'p_generate_item','parser.py',1975),
-  ('generate_block -> BEGIN generate_items END','generate_block',3,'p_generate_block','parser.py',1981),
-  ('generate_block -> BEGIN COLON ID generate_items END','generate_block',5,'p_generate_named_block','parser.py',1986),
-  ('generate_if -> IF LPAREN cond RPAREN gif_true_item ELSE gif_false_item','generate_if',7,'p_generate_if','parser.py',1991),
-  ('generate_if -> IF LPAREN cond RPAREN gif_true_item','generate_if',5,'p_generate_if_woelse','parser.py',1996),
-  ('gif_true_item -> generate_item','gif_true_item',1,'p_generate_if_true_item','parser.py',2001),
-  ('gif_true_item -> generate_block','gif_true_item',1,'p_generate_if_true_item','parser.py',2002),
-  ('gif_false_item -> generate_item','gif_false_item',1,'p_generate_if_false_item','parser.py',2008),
-  ('gif_false_item -> generate_block','gif_false_item',1,'p_generate_if_false_item','parser.py',2009),
-  ('generate_for -> FOR LPAREN forpre forcond forpost RPAREN generate_forcontent','generate_for',7,'p_generate_for','parser.py',2015),
-  ('generate_forcontent -> generate_item','generate_forcontent',1,'p_generate_forcontent','parser.py',2020),
-  ('generate_forcontent -> generate_block','generate_forcontent',1,'p_generate_forcontent','parser.py',2021),
-  ('systemcall -> DOLLER ID','systemcall',2,'p_systemcall_noargs','parser.py',2028),
-  ('systemcall -> DOLLER ID LPAREN sysargs RPAREN','systemcall',5,'p_systemcall','parser.py',2033),
-  ('systemcall -> DOLLER SIGNED LPAREN sysargs RPAREN','systemcall',5,'p_systemcall_signed','parser.py',2038),
-  ('sysargs -> sysargs COMMA sysarg','sysargs',3,'p_sysargs','parser.py',2043),
-  ('sysargs -> sysarg','sysargs',1,'p_sysargs_one','parser.py',2048),
-  ('sysargs -> empty','sysargs',1,'p_sysargs_empty','parser.py',2053),
-  ('sysarg -> expression','sysarg',1,'p_sysarg','parser.py',2057),
-  ('function -> FUNCTION width ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function','parser.py',2063),
-  ('function -> FUNCTION ID SEMICOLON function_statement ENDFUNCTION','function',5,'p_function_nowidth','parser.py',2068),
-  ('function -> FUNCTION INTEGER ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function_integer','parser.py',2077),
-  ('function_statement -> funcvardecls function_calc','function_statement',2,'p_function_statement','parser.py',2086),
-  ('funcvardecls -> funcvardecls funcvardecl','funcvardecls',2,'p_funcvardecls','parser.py',2091),
-  ('funcvardecls -> funcvardecl','funcvardecls',1,'p_funcvardecls_one','parser.py',2096),
-  ('funcvardecl -> decl','funcvardecl',1,'p_funcvardecl','parser.py',2101),
-  ('funcvardecl -> integerdecl','funcvardecl',1,'p_funcvardecl','parser.py',2102),
-  ('function_calc -> blocking_substitution','function_calc',1,'p_function_calc','parser.py',2113),
-  ('function_calc -> if_statement','function_calc',1,'p_function_calc','parser.py',2114),
-  ('function_calc -> for_statement','function_calc',1,'p_function_calc','parser.py',2115),
-  ('function_calc -> while_statement','function_calc',1,'p_function_calc','parser.py',2116),
-  ('function_calc -> case_statement','function_calc',1,'p_function_calc','parser.py',2117),
-  ('function_calc -> casex_statement','function_calc',1,'p_function_calc','parser.py',2118),
-  ('function_calc -> casez_statement','function_calc',1,'p_function_calc','parser.py',2119),
-  ('function_calc -> block','function_calc',1,'p_function_calc','parser.py',2120),
-  ('function_calc -> namedblock','function_calc',1,'p_function_calc','parser.py',2121),
-  ('functioncall -> identifier LPAREN func_args RPAREN','functioncall',4,'p_functioncall','parser.py',2127),
-  ('func_args -> func_args COMMA expression','func_args',3,'p_func_args','parser.py',2132),
-  ('func_args -> expression','func_args',1,'p_func_args_one','parser.py',2137),
-  ('func_args -> empty','func_args',1,'p_func_args_empty','parser.py',2142),
-  ('task -> TASK ID SEMICOLON task_statement ENDTASK','task',5,'p_task','parser.py',2147),
-  ('task_statement -> taskvardecls task_calc','task_statement',2,'p_task_statement','parser.py',2152),
-  ('taskvardecls -> taskvardecls taskvardecl','taskvardecls',2,'p_taskvardecls','parser.py',2157),
-  ('taskvardecls -> taskvardecl','taskvardecls',1,'p_taskvardecls_one','parser.py',2162),
-  ('taskvardecls -> empty','taskvardecls',1,'p_taskvardecls_empty','parser.py',2167),
-  ('taskvardecl -> decl','taskvardecl',1,'p_taskvardecl','parser.py',2171),
-  ('taskvardecl -> integerdecl','taskvardecl',1,'p_taskvardecl','parser.py',2172),
-  ('task_calc -> blocking_substitution','task_calc',1,'p_task_calc','parser.py',2183),
-  ('task_calc -> if_statement','task_calc',1,'p_task_calc','parser.py',2184),
-  ('task_calc -> for_statement','task_calc',1,'p_task_calc','parser.py',2185),
-  ('task_calc -> while_statement','task_calc',1,'p_task_calc','parser.py',2186),
-  ('task_calc -> case_statement','task_calc',1,'p_task_calc','parser.py',2187),
-  ('task_calc -> casex_statement','task_calc',1,'p_task_calc','parser.py',2188),
-  ('task_calc -> casez_statement','task_calc',1,'p_task_calc','parser.py',2189),
-  ('task_calc -> block','task_calc',1,'p_task_calc','parser.py',2190),
-  ('task_calc -> namedblock','task_calc',1,'p_task_calc','parser.py',2191),
-  ('identifier -> ID','identifier',1,'p_identifier','parser.py',2198),
-  ('identifier -> scope ID','identifier',2,'p_scope_identifier','parser.py',2203),
-  ('scope -> identifier DOT','scope',2,'p_scope','parser.py',2209),
-  ('scope -> pointer DOT','scope',2,'p_scope_pointer','parser.py',2216),
-  ('disable -> DISABLE ID','disable',2,'p_disable','parser.py',2224),
-  ('single_statement -> DELAY expression SEMICOLON','single_statement',3,'p_single_statement_delays','parser.py',2230),
-  ('single_statement -> systemcall SEMICOLON','single_statement',2,'p_single_statement_systemcall','parser.py',2236),
-  ('single_statement -> disable SEMICOLON','single_statement',2,'p_single_statement_disable','parser.py',2241),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',2263),
+  ('source_text -> description','source_text',1,'p_source_text','parser.py',101),
+  ('description -> definitions','description',1,'p_description','parser.py',106),
+  ('definitions -> definitions definition','definitions',2,'p_definitions','parser.py',111),
+  ('definitions -> definition','definitions',1,'p_definitions_one','parser.py',117),
+  ('definition -> moduledef','definition',1,'p_definition','parser.py',122),
+  ('definition -> pragma','definition',1,'p_definition_pragma','parser.py',127),
+  ('pragma -> LPAREN TIMES ID EQUALS expression TIMES RPAREN','pragma',7,'p_pragma_assign','parser.py',133),
+  ('pragma -> LPAREN TIMES ID TIMES RPAREN','pragma',5,'p_pragma','parser.py',139),
+  ('moduledef -> MODULE modulename paramlist portlist items ENDMODULE','moduledef',6,'p_moduledef','parser.py',146),
+  ('modulename -> ID','modulename',1,'p_modulename','parser.py',153),
+  ('modulename -> SENS_OR','modulename',1,'p_modulename_or','parser.py',158),
+  ('paramlist -> DELAY LPAREN params RPAREN','paramlist',4,'p_paramlist','parser.py',163),
+  ('paramlist -> empty','paramlist',1,'p_paramlist_empty','parser.py',168),
+  ('params -> params_begin param_end','params',2,'p_params','parser.py',172),
+  ('params_begin -> params_begin param','params_begin',2,'p_params_begin','parser.py',177),
+  ('params_begin -> param','params_begin',1,'p_params_begin_one','parser.py',182),
+  ('params -> param_end','params',1,'p_params_one','parser.py',187),
+  ('param -> PARAMETER param_substitution_list COMMA','param',3,'p_param','parser.py',192),
+  ('param -> PARAMETER SIGNED param_substitution_list COMMA','param',4,'p_param_signed','parser.py',199),
+  ('param -> PARAMETER width param_substitution_list COMMA','param',4,'p_param_width','parser.py',206),
+  ('param -> PARAMETER SIGNED width param_substitution_list COMMA','param',5,'p_param_signed_width','parser.py',213),
+  ('param -> PARAMETER INTEGER param_substitution_list COMMA','param',4,'p_param_integer','parser.py',220),
+  ('param_end -> PARAMETER param_substitution_list','param_end',2,'p_param_end','parser.py',227),
+  ('param_end -> PARAMETER SIGNED param_substitution_list','param_end',3,'p_param_end_signed','parser.py',234),
+  ('param_end -> PARAMETER width param_substitution_list','param_end',3,'p_param_end_width','parser.py',241),
+  ('param_end -> PARAMETER SIGNED width param_substitution_list','param_end',4,'p_param_end_signed_width','parser.py',248),
+  ('param_end -> PARAMETER INTEGER param_substitution_list','param_end',3,'p_param_end_integer','parser.py',255),
+  ('portlist -> LPAREN ports RPAREN SEMICOLON','portlist',4,'p_portlist','parser.py',262),
+  ('portlist -> LPAREN ioports RPAREN SEMICOLON','portlist',4,'p_portlist_io','parser.py',267),
+  ('portlist -> LPAREN RPAREN SEMICOLON','portlist',3,'p_portlist_paren_empty','parser.py',272),
+  ('portlist -> SEMICOLON','portlist',1,'p_portlist_empty','parser.py',277),
+  ('ports -> ports COMMA portname','ports',3,'p_ports','parser.py',282),
+  ('ports -> portname','ports',1,'p_ports_one','parser.py',288),
+  ('portname -> ID','portname',1,'p_portname','parser.py',294),
+  ('sigtypes -> sigtypes sigtype','sigtypes',2,'p_sigtypes','parser.py',299),
+  ('sigtypes -> sigtype','sigtypes',1,'p_sigtypes_one','parser.py',304),
+  ('sigtype -> INPUT','sigtype',1,'p_sigtype_input','parser.py',309),
+  ('sigtype -> OUTPUT','sigtype',1,'p_sigtype_output','parser.py',314),
+  ('sigtype -> INOUT','sigtype',1,'p_sigtype_inout','parser.py',319),
+  ('sigtype -> TRI','sigtype',1,'p_sigtype_tri','parser.py',324),
+  ('sigtype -> REG','sigtype',1,'p_sigtype_reg','parser.py',329),
+  ('sigtype -> LOGIC','sigtype',1,'p_sigtype_logic','parser.py',334),
+  ('sigtype -> WIRE','sigtype',1,'p_sigtype_wire','parser.py',339),
+  ('sigtype -> SIGNED','sigtype',1,'p_sigtype_signed','parser.py',344),
+  ('sigtype -> SUPPLY0','sigtype',1,'p_sigtype_supply0','parser.py',349),
+  ('sigtype -> SUPPLY1','sigtype',1,'p_sigtype_supply1','parser.py',354),
+  ('ioports -> ioports COMMA ioport','ioports',3,'p_ioports','parser.py',359),
+  ('ioports -> ioport_head','ioports',1,'p_ioports_one','parser.py',387),
+  ('ioport -> sigtypes portname','ioport',2,'p_ioport','parser.py',437),
+  ('ioport -> sigtypes width portname','ioport',3,'p_ioport_width','parser.py',442),
+  ('ioport -> sigtypes width portname dimensions','ioport',4,'p_ioport_dimensions','parser.py',447),
+  ('ioport_head -> sigtypes portname','ioport_head',2,'p_ioport_head','parser.py',452),
+  ('ioport_head -> sigtypes width portname','ioport_head',3,'p_ioport_head_width','parser.py',457),
+  ('ioport_head -> sigtypes width portname dimensions','ioport_head',4,'p_ioport_head_dimensions','parser.py',462),
+  ('ioport -> portname','ioport',1,'p_ioport_portname','parser.py',467),
+  ('width -> LBRACKET expression COLON expression RBRACKET','width',5,'p_width','parser.py',472),
+  ('length -> LBRACKET expression COLON expression RBRACKET','length',5,'p_length','parser.py',477),
+  ('dimensions -> dimensions length','dimensions',2,'p_dimensions','parser.py',482),
+  ('dimensions -> length','dimensions',1,'p_dimensions_one','parser.py',488),
+  ('items -> items item','items',2,'p_items','parser.py',494),
+  ('items -> item','items',1,'p_items_one','parser.py',500),
+  ('items -> empty','items',1,'p_items_empty','parser.py',505),
+  ('item -> standard_item','item',1,'p_item','parser.py',509),
+  ('item -> generate','item',1,'p_item','parser.py',510),
+  ('standard_item -> decl','standard_item',1,'p_standard_item','parser.py',516),
+  ('standard_item -> integerdecl','standard_item',1,'p_standard_item','parser.py',517),
+  ('standard_item -> realdecl','standard_item',1,'p_standard_item','parser.py',518),
+  ('standard_item -> declassign','standard_item',1,'p_standard_item','parser.py',519),
+  ('standard_item -> parameterdecl','standard_item',1,'p_standard_item','parser.py',520),
+  ('standard_item -> localparamdecl','standard_item',1,'p_standard_item','parser.py',521),
+  ('standard_item -> genvardecl','standard_item',1,'p_standard_item','parser.py',522),
+  ('standard_item -> assignment','standard_item',1,'p_standard_item','parser.py',523),
+  ('standard_item -> always','standard_item',1,'p_standard_item','parser.py',524),
+  ('standard_item -> always_ff','standard_item',1,'p_standard_item','parser.py',525),
+  ('standard_item -> always_comb','standard_item',1,'p_standard_item','parser.py',526),
+  ('standard_item -> always_latch','standard_item',1,'p_standard_item','parser.py',527),
+  ('standard_item -> initial','standard_item',1,'p_standard_item','parser.py',528),
+  ('standard_item -> instance','standard_item',1,'p_standard_item','parser.py',529),
+  ('standard_item -> function','standard_item',1,'p_standard_item','parser.py',530),
+  ('standard_item -> task','standard_item',1,'p_standard_item','parser.py',531),
+  ('standard_item -> pragma','standard_item',1,'p_standard_item','parser.py',532),
+  ('decl -> sigtypes declnamelist SEMICOLON','decl',3,'p_decl','parser.py',592),
+  ('decl -> sigtypes width declnamelist SEMICOLON','decl',4,'p_decl_width','parser.py',601),
+  ('declnamelist -> declnamelist COMMA declname','declnamelist',3,'p_declnamelist','parser.py',610),
+  ('declnamelist -> declname','declnamelist',1,'p_declnamelist_one','parser.py',615),
+  ('declname -> ID','declname',1,'p_declname','parser.py',620),
+  ('declname -> ID dimensions','declname',2,'p_declarray','parser.py',625),
+  ('declassign -> sigtypes declassign_element SEMICOLON','declassign',3,'p_declassign','parser.py',675),
+  ('declassign -> sigtypes width declassign_element SEMICOLON','declassign',4,'p_declassign_width','parser.py',682),
+  ('declassign_element -> ID EQUALS rvalue','declassign_element',3,'p_declassign_element','parser.py',689),
+  ('declassign_element -> delays ID EQUALS delays rvalue','declassign_element',5,'p_declassign_element_delay','parser.py',696),
+  ('integerdecl -> INTEGER integernamelist SEMICOLON','integerdecl',3,'p_integerdecl','parser.py',704),
+  ('integerdecl -> INTEGER SIGNED integernamelist SEMICOLON','integerdecl',4,'p_integerdecl_signed','parser.py',716),
+  ('integernamelist -> integernamelist COMMA integername','integernamelist',3,'p_integernamelist','parser.py',728),
+  ('integernamelist -> integername','integernamelist',1,'p_integernamelist_one','parser.py',733),
+  ('integername -> ID EQUALS rvalue','integername',3,'p_integername_init','parser.py',738),
+  ('integername -> ID','integername',1,'p_integername','parser.py',743),
+  ('realdecl -> REAL realnamelist SEMICOLON','realdecl',3,'p_realdecl','parser.py',749),
+  ('realnamelist -> realnamelist COMMA realname','realnamelist',3,'p_realnamelist','parser.py',759),
+  ('realnamelist -> realname','realnamelist',1,'p_realnamelist_one','parser.py',764),
+  ('realname -> ID','realname',1,'p_realname','parser.py',769),
+  ('parameterdecl -> PARAMETER param_substitution_list SEMICOLON','parameterdecl',3,'p_parameterdecl','parser.py',775),
+  ('parameterdecl -> PARAMETER SIGNED param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_signed','parser.py',782),
+  ('parameterdecl -> PARAMETER width param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_width','parser.py',789),
+  ('parameterdecl -> PARAMETER SIGNED width param_substitution_list SEMICOLON','parameterdecl',5,'p_parameterdecl_signed_width','parser.py',796),
+  ('parameterdecl -> PARAMETER INTEGER param_substitution_list SEMICOLON','parameterdecl',4,'p_parameterdecl_integer','parser.py',803),
+  ('localparamdecl -> LOCALPARAM param_substitution_list SEMICOLON','localparamdecl',3,'p_localparamdecl','parser.py',810),
+  ('localparamdecl -> LOCALPARAM SIGNED param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_signed','parser.py',817),
+  ('localparamdecl -> LOCALPARAM width param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_width','parser.py',824),
+  ('localparamdecl -> LOCALPARAM SIGNED width param_substitution_list SEMICOLON','localparamdecl',5,'p_localparamdecl_signed_width','parser.py',831),
+  ('localparamdecl -> LOCALPARAM INTEGER param_substitution_list SEMICOLON','localparamdecl',4,'p_localparamdecl_integer','parser.py',838),
+  ('param_substitution_list -> param_substitution_list COMMA param_substitution','param_substitution_list',3,'p_param_substitution_list','parser.py',845),
+  ('param_substitution_list -> param_substitution','param_substitution_list',1,'p_param_substitution_list_one','parser.py',850),
+  ('param_substitution -> ID EQUALS rvalue','param_substitution',3,'p_param_substitution','parser.py',855),
+  ('assignment -> ASSIGN lvalue EQUALS rvalue SEMICOLON','assignment',5,'p_assignment','parser.py',860),
+  ('assignment -> ASSIGN delays lvalue EQUALS delays rvalue SEMICOLON','assignment',7,'p_assignment_delay','parser.py',865),
+  ('lpartselect -> pointer LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer','parser.py',871),
+  ('lpartselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_plus','parser.py',876),
+  ('lpartselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_lpointer_minus','parser.py',881),
+  ('lpartselect -> identifier LBRACKET expression COLON expression RBRACKET','lpartselect',6,'p_lpartselect','parser.py',886),
+  ('lpartselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_plus','parser.py',891),
+  ('lpartselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','lpartselect',6,'p_lpartselect_minus','parser.py',896),
+  ('lpointer -> pointer','lpointer',1,'p_lpointer','parser.py',901),
+  ('lconcat -> LBRACE lconcatlist RBRACE','lconcat',3,'p_lconcat','parser.py',906),
+  ('lconcatlist -> lconcatlist COMMA lconcat_one','lconcatlist',3,'p_lconcatlist','parser.py',911),
+  ('lconcatlist -> lconcat_one','lconcatlist',1,'p_lconcatlist_one','parser.py',916),
+  ('lconcat_one -> identifier','lconcat_one',1,'p_lconcat_one_identifier','parser.py',921),
+  ('lconcat_one -> lpartselect','lconcat_one',1,'p_lconcat_one_lpartselect','parser.py',926),
+  ('lconcat_one -> lpointer','lconcat_one',1,'p_lconcat_one_lpointer','parser.py',931),
+  ('lconcat_one -> lconcat','lconcat_one',1,'p_lconcat_one_lconcat','parser.py',936),
+  ('lvalue -> lpartselect','lvalue',1,'p_lvalue_partselect','parser.py',941),
+  ('lvalue -> lpointer','lvalue',1,'p_lvalue_pointer','parser.py',946),
+  ('lvalue -> lconcat','lvalue',1,'p_lvalue_concat','parser.py',951),
+  ('lvalue -> identifier','lvalue',1,'p_lvalue_one','parser.py',956),
+  ('rvalue -> expression','rvalue',1,'p_rvalue','parser.py',961),
+  ('expression -> MINUS expression','expression',2,'p_expression_uminus','parser.py',968),
+  ('expression -> PLUS expression','expression',2,'p_expression_uplus','parser.py',973),
+  ('expression -> LNOT expression','expression',2,'p_expression_ulnot','parser.py',978),
+  ('expression -> NOT expression','expression',2,'p_expression_unot','parser.py',983),
+  ('expression -> AND expression','expression',2,'p_expression_uand','parser.py',988),
+  ('expression -> NAND expression','expression',2,'p_expression_unand','parser.py',993),
+  ('expression -> NOR expression','expression',2,'p_expression_unor','parser.py',998),
+  ('expression -> OR expression','expression',2,'p_expression_uor','parser.py',1003),
+  ('expression -> XOR expression','expression',2,'p_expression_uxor','parser.py',1008),
+  ('expression -> XNOR expression','expression',2,'p_expression_uxnor','parser.py',1013),
+  ('expression -> expression POWER expression','expression',3,'p_expression_power','parser.py',1020),
+  ('expression -> expression TIMES expression','expression',3,'p_expression_times','parser.py',1027),
+  ('expression -> expression DIVIDE expression','expression',3,'p_expression_div','parser.py',1032),
+  ('expression -> expression MOD expression','expression',3,'p_expression_mod','parser.py',1037),
+  ('expression -> expression PLUS expression','expression',3,'p_expression_plus','parser.py',1044),
+  ('expression -> expression MINUS expression','expression',3,'p_expression_minus','parser.py',1049),
+  ('expression -> expression LSHIFT expression','expression',3,'p_expression_sll','parser.py',1056),
+  ('expression -> expression RSHIFT expression','expression',3,'p_expression_srl','parser.py',1061),
+  ('expression -> expression LSHIFTA expression','expression',3,'p_expression_sla','parser.py',1066),
+  ('expression -> expression RSHIFTA expression','expression',3,'p_expression_sra','parser.py',1071),
+  ('expression -> expression LT expression','expression',3,'p_expression_lessthan','parser.py',1078),
+  ('expression -> expression GT expression','expression',3,'p_expression_greaterthan','parser.py',1083),
+  ('expression -> expression LE expression','expression',3,'p_expression_lesseq','parser.py',1088),
+  ('expression -> expression GE expression','expression',3,'p_expression_greatereq','parser.py',1093),
+  ('expression -> expression EQ expression','expression',3,'p_expression_eq','parser.py',1100),
+  ('expression -> expression NE expression','expression',3,'p_expression_noteq','parser.py',1105),
+  ('expression -> expression EQL expression','expression',3,'p_expression_eql','parser.py',1110),
+  ('expression -> expression NEL expression','expression',3,'p_expression_noteql','parser.py',1115),
+  ('expression -> expression AND expression','expression',3,'p_expression_And','parser.py',1122),
+  ('expression -> expression XOR expression','expression',3,'p_expression_Xor','parser.py',1127),
+  ('expression -> expression XNOR expression','expression',3,'p_expression_Xnor','parser.py',1132),
+  ('expression -> expression OR expression','expression',3,'p_expression_Or','parser.py',1139),
+  ('expression -> expression LAND expression','expression',3,'p_expression_land','parser.py',1146),
+  ('expression -> expression LOR expression','expression',3,'p_expression_lor','parser.py',1153),
+  ('expression -> expression COND expression COLON expression','expression',5,'p_expression_cond','parser.py',1160),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression_expr','parser.py',1166),
+  ('expression -> concat','expression',1,'p_expression_concat','parser.py',1172),
+  ('expression -> repeat','expression',1,'p_expression_repeat','parser.py',1177),
+  ('expression -> partselect','expression',1,'p_expression_partselect','parser.py',1182),
+  ('expression -> pointer','expression',1,'p_expression_pointer','parser.py',1187),
+  ('expression -> functioncall','expression',1,'p_expression_functioncall','parser.py',1192),
+  ('expression -> systemcall','expression',1,'p_expression_systemcall','parser.py',1197),
+  ('expression -> identifier','expression',1,'p_expression_id','parser.py',1202),
+  ('expression -> const_expression','expression',1,'p_expression_const','parser.py',1207),
+  ('concat -> LBRACE concatlist RBRACE','concat',3,'p_concat','parser.py',1212),
+  ('concatlist -> concatlist COMMA expression','concatlist',3,'p_concatlist','parser.py',1217),
+  ('concatlist -> expression','concatlist',1,'p_concatlist_one','parser.py',1222),
+  ('repeat -> LBRACE expression concat RBRACE','repeat',4,'p_repeat','parser.py',1227),
+  ('partselect -> identifier LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect','parser.py',1232),
+  ('partselect -> identifier LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_plus','parser.py',1237),
+  ('partselect -> identifier LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_minus','parser.py',1243),
+  ('partselect -> pointer LBRACKET expression COLON expression RBRACKET','partselect',6,'p_partselect_pointer','parser.py',1249),
+  ('partselect -> pointer LBRACKET expression PLUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_plus','parser.py',1254),
+  ('partselect -> pointer LBRACKET expression MINUSCOLON expression RBRACKET','partselect',6,'p_partselect_pointer_minus','parser.py',1260),
+  ('pointer -> identifier LBRACKET expression RBRACKET','pointer',4,'p_pointer','parser.py',1266),
+  ('pointer -> pointer LBRACKET expression RBRACKET','pointer',4,'p_pointer_pointer','parser.py',1271),
+  ('const_expression -> intnumber','const_expression',1,'p_const_expression_intnum','parser.py',1277),
+  ('const_expression -> floatnumber','const_expression',1,'p_const_expression_floatnum','parser.py',1282),
+  ('const_expression -> stringliteral','const_expression',1,'p_const_expression_stringliteral','parser.py',1287),
+  ('floatnumber -> FLOATNUMBER','floatnumber',1,'p_floatnumber','parser.py',1292),
+  ('intnumber -> INTNUMBER_DEC','intnumber',1,'p_intnumber','parser.py',1297),
+  ('intnumber -> SIGNED_INTNUMBER_DEC','intnumber',1,'p_intnumber','parser.py',1298),
+  ('intnumber -> INTNUMBER_BIN','intnumber',1,'p_intnumber','parser.py',1299),
+  ('intnumber -> SIGNED_INTNUMBER_BIN','intnumber',1,'p_intnumber','parser.py',1300),
+  ('intnumber -> INTNUMBER_OCT','intnumber',1,'p_intnumber','parser.py',1301),
+  ('intnumber -> SIGNED_INTNUMBER_OCT','intnumber',1,'p_intnumber','parser.py',1302),
+  ('intnumber -> INTNUMBER_HEX','intnumber',1,'p_intnumber','parser.py',1303),
+  ('intnumber -> SIGNED_INTNUMBER_HEX','intnumber',1,'p_intnumber','parser.py',1304),
+  ('stringliteral -> STRING_LITERAL','stringliteral',1,'p_stringliteral','parser.py',1312),
+  ('always -> ALWAYS senslist always_statement','always',3,'p_always','parser.py',1319),
+  ('always_ff -> ALWAYS_FF senslist always_statement','always_ff',3,'p_always_ff','parser.py',1324),
+  ('always_comb -> ALWAYS_COMB senslist always_statement','always_comb',3,'p_always_comb','parser.py',1329),
+  ('always_latch -> ALWAYS_LATCH senslist always_statement','always_latch',3,'p_always_latch','parser.py',1334),
+  ('senslist -> AT LPAREN edgesigs RPAREN','senslist',4,'p_sens_egde_paren','parser.py',1339),
+  ('edgesig -> POSEDGE edgesig_base','edgesig',2,'p_posedgesig','parser.py',1344),
+  ('edgesig -> NEGEDGE edgesig_base','edgesig',2,'p_negedgesig','parser.py',1349),
+  ('edgesig_base -> identifier','edgesig_base',1,'p_edgesig_base_identifier','parser.py',1354),
+  ('edgesig_base -> pointer','edgesig_base',1,'p_edgesig_base_pointer','parser.py',1359),
+  ('edgesigs -> edgesigs SENS_OR edgesig','edgesigs',3,'p_edgesigs','parser.py',1364),
+  ('edgesigs -> edgesigs COMMA edgesig','edgesigs',3,'p_edgesigs_comma','parser.py',1369),
+  ('edgesigs -> edgesig','edgesigs',1,'p_edgesigs_one','parser.py',1374),
+  ('senslist -> empty','senslist',1,'p_sens_empty','parser.py',1379),
+  ('senslist -> AT levelsig','senslist',2,'p_sens_level','parser.py',1385),
+  ('senslist -> AT LPAREN levelsigs RPAREN','senslist',4,'p_sens_level_paren','parser.py',1390),
+  ('levelsig -> levelsig_base','levelsig',1,'p_levelsig','parser.py',1395),
+  ('levelsig_base -> identifier','levelsig_base',1,'p_levelsig_base_identifier','parser.py',1400),
+  ('levelsig_base -> pointer','levelsig_base',1,'p_levelsig_base_pointer','parser.py',1405),
+  ('levelsig_base -> partselect','levelsig_base',1,'p_levelsig_base_partselect','parser.py',1410),
+  ('levelsigs -> levelsigs SENS_OR levelsig','levelsigs',3,'p_levelsigs','parser.py',1415),
+  ('levelsigs -> levelsigs COMMA levelsig','levelsigs',3,'p_levelsigs_comma','parser.py',1420),
+  ('levelsigs -> levelsig','levelsigs',1,'p_levelsigs_one','parser.py',1425),
+  ('senslist -> AT TIMES','senslist',2,'p_sens_all','parser.py',1430),
+  ('senslist -> AT LPAREN TIMES RPAREN','senslist',4,'p_sens_all_paren','parser.py',1436),
+  ('basic_statement -> if_statement','basic_statement',1,'p_basic_statement','parser.py',1442),
+  ('basic_statement -> case_statement','basic_statement',1,'p_basic_statement','parser.py',1443),
+  ('basic_statement -> casex_statement','basic_statement',1,'p_basic_statement','parser.py',1444),
+  ('basic_statement -> casez_statement','basic_statement',1,'p_basic_statement','parser.py',1445),
+  ('basic_statement -> unique_case_statement','basic_statement',1,'p_basic_statement','parser.py',1446),
+  ('basic_statement -> for_statement','basic_statement',1,'p_basic_statement','parser.py',1447),
+  ('basic_statement -> while_statement','basic_statement',1,'p_basic_statement','parser.py',1448),
+  ('basic_statement -> event_statement','basic_statement',1,'p_basic_statement','parser.py',1449),
+  ('basic_statement -> wait_statement','basic_statement',1,'p_basic_statement','parser.py',1450),
+  ('basic_statement -> forever_statement','basic_statement',1,'p_basic_statement','parser.py',1451),
+  ('basic_statement -> block','basic_statement',1,'p_basic_statement','parser.py',1452),
+  ('basic_statement -> namedblock','basic_statement',1,'p_basic_statement','parser.py',1453),
+  ('basic_statement -> parallelblock','basic_statement',1,'p_basic_statement','parser.py',1454),
+  ('basic_statement -> blocking_substitution','basic_statement',1,'p_basic_statement','parser.py',1455),
+  ('basic_statement -> nonblocking_substitution','basic_statement',1,'p_basic_statement','parser.py',1456),
+  ('basic_statement -> single_statement','basic_statement',1,'p_basic_statement','parser.py',1457),
+  ('always_statement -> basic_statement','always_statement',1,'p_always_statement','parser.py',1463),
+  ('blocking_substitution -> delays lvalue EQUALS delays rvalue SEMICOLON','blocking_substitution',6,'p_blocking_substitution','parser.py',1469),
+  ('blocking_substitution_base -> delays lvalue EQUALS delays rvalue','blocking_substitution_base',5,'p_blocking_substitution_base','parser.py',1474),
+  ('nonblocking_substitution -> delays lvalue LE delays rvalue SEMICOLON','nonblocking_substitution',6,'p_nonblocking_substitution','parser.py',1479),
+  ('delays -> DELAY LPAREN expression RPAREN','delays',4,'p_delays','parser.py',1486),
+  ('delays -> DELAY identifier','delays',2,'p_delays_identifier','parser.py',1491),
+  ('delays -> DELAY intnumber','delays',2,'p_delays_intnumber','parser.py',1496),
+  ('delays -> DELAY floatnumber','delays',2,'p_delays_floatnumber','parser.py',1502),
+  ('delays -> empty','delays',1,'p_delays_empty','parser.py',1508),
+  ('block -> BEGIN block_statements END','block',3,'p_block','parser.py',1513),
+  ('block -> BEGIN END','block',2,'p_block_empty','parser.py',1518),
+  ('block_statements -> block_statements block_statement','block_statements',2,'p_block_statements','parser.py',1523),
+  ('block_statements -> block_statement','block_statements',1,'p_block_statements_one','parser.py',1528),
+  ('block_statement -> basic_statement','block_statement',1,'p_block_statement','parser.py',1533),
+  ('namedblock -> BEGIN COLON ID namedblock_statements END','namedblock',5,'p_namedblock','parser.py',1539),
+  ('namedblock -> BEGIN COLON ID END','namedblock',4,'p_namedblock_empty','parser.py',1544),
+  ('namedblock_statements -> namedblock_statements namedblock_statement','namedblock_statements',2,'p_namedblock_statements','parser.py',1549),
+  ('namedblock_statements -> namedblock_statement','namedblock_statements',1,'p_namedblock_statements_one','parser.py',1554),
+  ('namedblock_statement -> basic_statement','namedblock_statement',1,'p_namedblock_statement','parser.py',1559),
+  ('namedblock_statement -> decl','namedblock_statement',1,'p_namedblock_statement','parser.py',1560),
+  ('namedblock_statement -> integerdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1561),
+  ('namedblock_statement -> realdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1562),
+  ('namedblock_statement -> parameterdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1563),
+  ('namedblock_statement -> localparamdecl','namedblock_statement',1,'p_namedblock_statement','parser.py',1564),
+  ('parallelblock -> FORK block_statements JOIN','parallelblock',3,'p_parallelblock','parser.py',1577),
+  ('parallelblock -> FORK JOIN','parallelblock',2,'p_parallelblock_empty','parser.py',1582),
+  ('if_statement -> IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',7,'p_if_statement','parser.py',1588),
+  ('if_statement -> IF LPAREN cond RPAREN true_statement','if_statement',5,'p_if_statement_woelse','parser.py',1593),
+  ('if_statement -> delays IF LPAREN cond RPAREN true_statement ELSE else_statement','if_statement',8,'p_if_statement_delay','parser.py',1598),
+  ('if_statement -> delays IF LPAREN cond RPAREN true_statement','if_statement',6,'p_if_statement_woelse_delay','parser.py',1603),
+  ('cond -> expression','cond',1,'p_cond','parser.py',1608),
+  ('ifcontent_statement -> basic_statement','ifcontent_statement',1,'p_ifcontent_statement','parser.py',1613),
+  ('true_statement -> ifcontent_statement','true_statement',1,'p_true_statement','parser.py',1618),
+  ('else_statement -> ifcontent_statement','else_statement',1,'p_else_statement','parser.py',1623),
+  ('for_statement -> FOR LPAREN forpre forcond forpost RPAREN forcontent_statement','for_statement',7,'p_for_statement','parser.py',1629),
+  ('forpre -> blocking_substitution','forpre',1,'p_forpre','parser.py',1634),
+  ('forpre -> SEMICOLON','forpre',1,'p_forpre_empty','parser.py',1639),
+  ('forcond -> cond SEMICOLON','forcond',2,'p_forcond','parser.py',1644),
+  ('forcond -> SEMICOLON','forcond',1,'p_forcond_empty','parser.py',1649),
+  ('forpost -> blocking_substitution_base','forpost',1,'p_forpost','parser.py',1654),
+  ('forpost -> empty','forpost',1,'p_forpost_empty','parser.py',1659),
+  ('forcontent_statement -> basic_statement','forcontent_statement',1,'p_forcontent_statement','parser.py',1663),
+  ('while_statement -> WHILE LPAREN cond RPAREN whilecontent_statement','while_statement',5,'p_while_statement','parser.py',1669),
+  ('whilecontent_statement -> basic_statement','whilecontent_statement',1,'p_whilecontent_statement','parser.py',1674),
+  ('case_statement -> CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','case_statement',6,'p_case_statement','parser.py',1680),
+  ('casex_statement -> CASEX LPAREN case_comp RPAREN casecontent_statements ENDCASE','casex_statement',6,'p_casex_statement','parser.py',1685),
+  ('casez_statement -> CASEZ LPAREN case_comp RPAREN casecontent_statements ENDCASE','casez_statement',6,'p_casez_statement','parser.py',1690),
+  ('unique_case_statement -> UNIQUE CASE LPAREN case_comp RPAREN casecontent_statements ENDCASE','unique_case_statement',7,'p_unique_case_statement','parser.py',1695),
+  ('case_comp -> expression','case_comp',1,'p_case_comp','parser.py',1700),
+  ('casecontent_statements -> casecontent_statements casecontent_statement','casecontent_statements',2,'p_casecontent_statements','parser.py',1705),
+  ('casecontent_statements -> casecontent_statement','casecontent_statements',1,'p_casecontent_statements_one','parser.py',1710),
+  ('casecontent_statement -> casecontent_condition COLON basic_statement','casecontent_statement',3,'p_casecontent_statement','parser.py',1715),
+  ('casecontent_condition -> casecontent_condition COMMA expression','casecontent_condition',3,'p_casecontent_condition_single','parser.py',1720),
+  ('casecontent_condition -> expression','casecontent_condition',1,'p_casecontent_condition_one','parser.py',1725),
+  ('casecontent_statement -> DEFAULT COLON basic_statement','casecontent_statement',3,'p_casecontent_statement_default','parser.py',1730),
+  ('initial -> INITIAL initial_statement','initial',2,'p_initial','parser.py',1736),
+  ('initial_statement -> basic_statement','initial_statement',1,'p_initial_statement','parser.py',1741),
+  ('event_statement -> senslist SEMICOLON','event_statement',2,'p_event_statement','parser.py',1747),
+  ('wait_statement -> WAIT LPAREN cond RPAREN waitcontent_statement','wait_statement',5,'p_wait_statement','parser.py',1753),
+  ('waitcontent_statement -> basic_statement','waitcontent_statement',1,'p_waitcontent_statement','parser.py',1758),
+  ('waitcontent_statement -> SEMICOLON','waitcontent_statement',1,'p_waitcontent_statement_empty','parser.py',1763),
+  ('forever_statement -> FOREVER basic_statement','forever_statement',2,'p_forever_statement','parser.py',1769),
+  ('instance -> ID parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance','parser.py',1775),
+  ('instance -> SENS_OR parameterlist instance_bodylist SEMICOLON','instance',4,'p_instance_or','parser.py',1785),
+  ('instance_bodylist -> instance_bodylist COMMA instance_body','instance_bodylist',3,'p_instance_bodylist','parser.py',1795),
+  ('instance_bodylist -> instance_body','instance_bodylist',1,'p_instance_bodylist_one','parser.py',1800),
+  ('instance_body -> ID LPAREN instance_ports RPAREN','instance_body',4,'p_instance_body','parser.py',1805),
+  ('instance_body -> ID width LPAREN instance_ports RPAREN','instance_body',5,'p_instance_body_array','parser.py',1810),
+  ('instance -> ID instance_bodylist_noname SEMICOLON','instance',3,'p_instance_noname','parser.py',1815),
+  ('instance -> SENS_OR instance_bodylist_noname SEMICOLON','instance',3,'p_instance_or_noname','parser.py',1824),
+  ('instance_bodylist_noname -> instance_bodylist_noname COMMA instance_body_noname','instance_bodylist_noname',3,'p_instance_bodylist_noname','parser.py',1833),
+  ('instance_bodylist_noname -> instance_body_noname','instance_bodylist_noname',1,'p_instance_bodylist_one_noname','parser.py',1838),
+  ('instance_body_noname -> LPAREN instance_ports RPAREN','instance_body_noname',3,'p_instance_body_noname','parser.py',1843),
+  ('parameterlist -> DELAY LPAREN param_args RPAREN','parameterlist',4,'p_parameterlist','parser.py',1848),
+  ('parameterlist -> DELAY LPAREN param_args_noname RPAREN','parameterlist',4,'p_parameterlist_noname','parser.py',1853),
+  ('parameterlist -> empty','parameterlist',1,'p_parameterlist_empty','parser.py',1858),
+  ('param_args_noname -> param_args_noname COMMA param_arg_noname','param_args_noname',3,'p_param_args_noname','parser.py',1862),
+  ('param_args_noname -> param_arg_noname','param_args_noname',1,'p_param_args_noname_one','parser.py',1867),
+  ('param_args -> param_args COMMA param_arg','param_args',3,'p_param_args','parser.py',1872),
+  ('param_args -> param_arg','param_args',1,'p_param_args_one','parser.py',1877),
+  ('param_args -> empty','param_args',1,'p_param_args_empty','parser.py',1882),
+  ('param_arg_noname -> expression','param_arg_noname',1,'p_param_arg_noname_exp','parser.py',1886),
+  ('param_arg -> DOT ID LPAREN expression RPAREN','param_arg',5,'p_param_arg_exp','parser.py',1891),
+  ('instance_ports -> instance_ports_list','instance_ports',1,'p_instance_ports','parser.py',1896),
+  ('instance_ports -> instance_ports_arg','instance_ports',1,'p_instance_ports','parser.py',1897),
+  ('instance_ports_list -> instance_ports_list COMMA instance_port_list','instance_ports_list',3,'p_instance_ports_list','parser.py',1903),
+  ('instance_ports_list -> instance_port_list','instance_ports_list',1,'p_instance_ports_list_one','parser.py',1908),
+  ('instance_ports_list -> empty','instance_ports_list',1,'p_instance_ports_list_empty','parser.py',1913),
+  ('instance_port_list -> expression','instance_port_list',1,'p_instance_port_list','parser.py',1918),
+  ('instance_ports_arg -> instance_ports_arg COMMA instance_port_arg','instance_ports_arg',3,'p_instance_ports_arg','parser.py',1923),
+  ('instance_ports_arg -> instance_port_arg','instance_ports_arg',1,'p_instance_ports_arg_one','parser.py',1928),
+  ('instance_port_arg -> DOT ID LPAREN identifier RPAREN','instance_port_arg',5,'p_instance_port_arg','parser.py',1933),
+  ('instance_port_arg -> DOT ID LPAREN expression RPAREN','instance_port_arg',5,'p_instance_port_arg_exp','parser.py',1938),
+  ('instance_port_arg -> DOT ID LPAREN RPAREN','instance_port_arg',4,'p_instance_port_arg_none','parser.py',1943),
+  ('genvardecl -> GENVAR genvarlist SEMICOLON','genvardecl',3,'p_genvardecl','parser.py',1949),
+  ('genvarlist -> genvarlist COMMA genvar','genvarlist',3,'p_genvarlist','parser.py',1954),
+  ('genvarlist -> genvar','genvarlist',1,'p_genvarlist_one','parser.py',1959),
+  ('genvar -> ID','genvar',1,'p_genvar','parser.py',1964),
+  ('generate -> GENERATE generate_items ENDGENERATE','generate',3,'p_generate','parser.py',1973),
+  ('generate_items -> empty','generate_items',1,'p_generate_items_empty','parser.py',1978),
+  ('generate_items -> generate_items generate_item','generate_items',2,'p_generate_items','parser.py',1983),
+  ('generate_items -> generate_item','generate_items',1,'p_generate_items_one','parser.py',1988),
+  ('generate_item -> standard_item','generate_item',1,'p_generate_item','parser.py',1993),
+  ('generate_item -> generate_if','generate_item',1,'p_generate_item','parser.py',1994),
+  ('generate_item -> generate_for','generate_item',1,'p_generate_item','parser.py',1995),
+  ('generate_block -> BEGIN generate_items END','generate_block',3,'p_generate_block','parser.py',2001),
+  ('generate_block -> BEGIN COLON ID generate_items END','generate_block',5,'p_generate_named_block','parser.py',2006),
+  ('generate_if -> IF LPAREN cond RPAREN gif_true_item ELSE gif_false_item','generate_if',7,'p_generate_if','parser.py',2011),
+  ('generate_if -> IF LPAREN cond RPAREN gif_true_item','generate_if',5,'p_generate_if_woelse','parser.py',2016),
+  ('gif_true_item -> generate_item','gif_true_item',1,'p_generate_if_true_item','parser.py',2021),
+  ('gif_true_item -> generate_block','gif_true_item',1,'p_generate_if_true_item','parser.py',2022),
+  ('gif_false_item -> generate_item','gif_false_item',1,'p_generate_if_false_item','parser.py',2028),
+  ('gif_false_item -> generate_block','gif_false_item',1,'p_generate_if_false_item','parser.py',2029),
+  ('generate_for -> FOR LPAREN forpre forcond forpost RPAREN generate_forcontent','generate_for',7,'p_generate_for','parser.py',2035),
+  ('generate_forcontent -> generate_item','generate_forcontent',1,'p_generate_forcontent','parser.py',2040),
+  ('generate_forcontent -> generate_block','generate_forcontent',1,'p_generate_forcontent','parser.py',2041),
+  ('systemcall -> DOLLER ID','systemcall',2,'p_systemcall_noargs','parser.py',2048),
+  ('systemcall -> DOLLER ID LPAREN sysargs RPAREN','systemcall',5,'p_systemcall','parser.py',2053),
+  ('systemcall -> DOLLER SIGNED LPAREN sysargs RPAREN','systemcall',5,'p_systemcall_signed','parser.py',2058),
+  ('sysargs -> sysargs COMMA sysarg','sysargs',3,'p_sysargs','parser.py',2063),
+  ('sysargs -> sysarg','sysargs',1,'p_sysargs_one','parser.py',2068),
+  ('sysargs -> empty','sysargs',1,'p_sysargs_empty','parser.py',2073),
+  ('sysarg -> expression','sysarg',1,'p_sysarg','parser.py',2077),
+  ('function -> FUNCTION width ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function','parser.py',2083),
+  ('function -> FUNCTION ID SEMICOLON function_statement ENDFUNCTION','function',5,'p_function_nowidth','parser.py',2088),
+  ('function -> FUNCTION INTEGER ID SEMICOLON function_statement ENDFUNCTION','function',6,'p_function_integer','parser.py',2097),
+  ('function_statement -> funcvardecls function_calc','function_statement',2,'p_function_statement','parser.py',2106),
+  ('funcvardecls -> funcvardecls funcvardecl','funcvardecls',2,'p_funcvardecls','parser.py',2111),
+  ('funcvardecls -> funcvardecl','funcvardecls',1,'p_funcvardecls_one','parser.py',2116),
+  ('funcvardecl -> decl','funcvardecl',1,'p_funcvardecl','parser.py',2121),
+  ('funcvardecl -> integerdecl','funcvardecl',1,'p_funcvardecl','parser.py',2122),
+  ('function_calc -> blocking_substitution','function_calc',1,'p_function_calc','parser.py',2133),
+  ('function_calc -> if_statement','function_calc',1,'p_function_calc','parser.py',2134),
+  ('function_calc -> for_statement','function_calc',1,'p_function_calc','parser.py',2135),
+  ('function_calc -> while_statement','function_calc',1,'p_function_calc','parser.py',2136),
+  ('function_calc -> case_statement','function_calc',1,'p_function_calc','parser.py',2137),
+  ('function_calc -> casex_statement','function_calc',1,'p_function_calc','parser.py',2138),
+  ('function_calc -> casez_statement','function_calc',1,'p_function_calc','parser.py',2139),
+  ('function_calc -> block','function_calc',1,'p_function_calc','parser.py',2140),
+  ('function_calc -> namedblock','function_calc',1,'p_function_calc','parser.py',2141),
+  ('functioncall -> identifier LPAREN func_args RPAREN','functioncall',4,'p_functioncall','parser.py',2147),
+  ('func_args -> func_args COMMA expression','func_args',3,'p_func_args','parser.py',2152),
+  ('func_args -> expression','func_args',1,'p_func_args_one','parser.py',2157),
+  ('func_args -> empty','func_args',1,'p_func_args_empty','parser.py',2162),
+  ('task -> TASK ID SEMICOLON task_statement ENDTASK','task',5,'p_task','parser.py',2167),
+  ('task_statement -> taskvardecls task_calc','task_statement',2,'p_task_statement','parser.py',2172),
+  ('taskvardecls -> taskvardecls taskvardecl','taskvardecls',2,'p_taskvardecls','parser.py',2177),
+  ('taskvardecls -> taskvardecl','taskvardecls',1,'p_taskvardecls_one','parser.py',2182),
+  ('taskvardecls -> empty','taskvardecls',1,'p_taskvardecls_empty','parser.py',2187),
+  ('taskvardecl -> decl','taskvardecl',1,'p_taskvardecl','parser.py',2191),
+  ('taskvardecl -> integerdecl','taskvardecl',1,'p_taskvardecl','parser.py',2192),
+  ('task_calc -> blocking_substitution','task_calc',1,'p_task_calc','parser.py',2203),
+  ('task_calc -> if_statement','task_calc',1,'p_task_calc','parser.py',2204),
+  ('task_calc -> for_statement','task_calc',1,'p_task_calc','parser.py',2205),
+  ('task_calc -> while_statement','task_calc',1,'p_task_calc','parser.py',2206),
+  ('task_calc -> case_statement','task_calc',1,'p_task_calc','parser.py',2207),
+  ('task_calc -> casex_statement','task_calc',1,'p_task_calc','parser.py',2208),
+  ('task_calc -> casez_statement','task_calc',1,'p_task_calc','parser.py',2209),
+  ('task_calc -> block','task_calc',1,'p_task_calc','parser.py',2210),
+  ('task_calc -> namedblock','task_calc',1,'p_task_calc','parser.py',2211),
+  ('identifier -> ID','identifier',1,'p_identifier','parser.py',2218),
+  ('identifier -> scope ID','identifier',2,'p_scope_identifier','parser.py',2223),
+  ('scope -> identifier DOT','scope',2,'p_scope','parser.py',2229),
+  ('scope -> pointer DOT','scope',2,'p_scope_pointer','parser.py',2236),
+  ('disable -> DISABLE ID','disable',2,'p_disable','parser.py',2244),
+  ('single_statement -> DELAY expression SEMICOLON','single_statement',3,'p_single_statement_delays','parser.py',2250),
+  ('single_statement -> systemcall SEMICOLON','single_statement',2,'p_single_statement_systemcall','parser.py',2256),
+  ('single_statement -> disable SEMICOLON','single_statement',2,'p_single_statement_disable','parser.py',2261),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',2283),
 ]
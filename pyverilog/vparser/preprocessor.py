@@ -15,34 +15,342 @@
 
    ----
    Verilog Preprocessor
- 
-   Icarus Verilog is used as the internal preprocessor.
-   Please install Icarus Verilog on your environment.
+
+   Macros (`define/`undef/`ifdef/`ifndef/`elsif/`else/`endif/`include)
+   are expanded in-process. Icarus Verilog (iverilog -E) is used instead
+   when requested or when PYVERILOG_IVERILOG is set.
 """
 
 from __future__ import absolute_import
 from __future__ import print_function
 import sys
 import os
+import re
+import io
 import tempfile
 import subprocess
 
 
+class PreprocessError(Exception):
+    pass
+
+
+class VerilogMacroPreprocessor(object):
+    """ Line-preserving macro expansion: every input line of a file gives
+    exactly one output line, except where an `include is spliced in """
+
+    directive = re.compile(r'`([a-zA-Z_][a-zA-Z_0-9$]*)')
+    special = re.compile(r'[`/"\\]')
+    scan = re.compile(r'//|/\*|"|`|\\')
+    string = re.compile(r'"(?:\\.|[^"\\\n])*"?')
+    escaped = re.compile(r'\\\S*')
+    ident = re.compile(r'\s*([a-zA-Z_][a-zA-Z_0-9$]*)')
+    open_paren = re.compile(r'\s*\(')
+    quote_or_tick = re.compile(r'"|`')
+    word = re.compile(r'"(?:\\.|[^"\\])*"|`?[a-zA-Z_][a-zA-Z_0-9$]*')
+    include_file = re.compile(r'\s*(?:"([^"\n]+)"|<([^>\n]+)>)')
+    passthrough = ('timescale', 'default_nettype', 'resetall', 'celldefine', 'endcelldefine',
+                   'unconnected_drive', 'nounconnected_drive', 'line', 'pragma',
+                   'begin_keywords', 'end_keywords')
+    max_depth = 64
+
+    def __init__(self, include=None, define=None):
+        self.include = list(include) if include else []
+        self.macros = {}
+        for dfn in define or ():
+            name, eq, value = dfn.partition('=')
+            self.macros[name] = (None, value if eq else '1')
+        self.cond = []
+        self.active = True
+        self.in_comment = False
+
+    def process_text(self, text, filename='<string>'):
+        text = ''.join(self.process_lines(io.StringIO(text), filename))
+        self.finish()
+        return text
+
+    def finish(self):
+        if self.cond:
+            raise PreprocessError('missing `endif')
+
+    def process_file(self, filename):
+        with open(filename) as f:
+            for line in self.process_lines(f, filename):
+                yield line
+
+    def process_lines(self, lines, filename='<string>', depth=0):
+        if depth > self.max_depth:
+            raise PreprocessError('%s: `include nested too deeply' % filename)
+        lines = iter(lines)
+        for line in lines:
+            if self.active and not self.in_comment and not self.special.search(line):
+                yield line
+                continue
+            out = []
+            nlines = 1
+            pos = 0
+            while pos < len(line):
+                if self.in_comment:
+                    end = line.find('*/', pos)
+                    if end < 0:
+                        self.emit(out, line[pos:])
+                        break
+                    self.emit(out, line[pos:end + 2])
+                    pos = end + 2
+                    self.in_comment = False
+                    continue
+                m = self.scan.search(line, pos)
+                if m is None:
+                    self.emit(out, line[pos:])
+                    break
+                self.emit(out, line[pos:m.start()])
+                pos = m.start()
+                tok = m.group()
+                if tok == '//':
+                    self.emit(out, line[pos:])
+                    break
+                if tok == '/*':
+                    self.in_comment = True
+                    self.emit(out, '/*')
+                    pos += 2
+                    continue
+                if tok == '"':
+                    end = self.string.match(line, pos).end()
+                    self.emit(out, line[pos:end])
+                    pos = end
+                    continue
+                if tok == '\\':
+                    end = self.escaped.match(line, pos).end()
+                    self.emit(out, line[pos:end])
+                    pos = end
+                    continue
+                d = self.directive.match(line, pos)
+                if d is None:
+                    self.emit(out, '`')
+                    pos += 1
+                    continue
+                name = d.group(1)
+                pos = d.end()
+                if name in ('ifdef', 'ifndef', 'elsif', 'else', 'endif'):
+                    pos = self.conditional(name, line, pos, filename)
+                elif not self.active:
+                    pass
+                elif name == 'define':
+                    while line.rstrip().endswith('\\'):
+                        line += next(lines, '')
+                        nlines += 1
+                    self.define(line[pos:], filename)
+                    pos = len(line)
+                elif name == 'undef':
+                    m = self.ident.match(line, pos)
+                    if m is None:
+                        raise PreprocessError('%s: `undef without a macro name' % filename)
+                    self.macros.pop(m.group(1), None)
+                    pos = m.end()
+                elif name == 'include':
+                    m = self.include_file.match(line, pos)
+                    if m is None:
+                        raise PreprocessError('%s: malformed `include' % filename)
+                    if ''.join(out).strip():
+                        yield ''.join(out) + '\n'
+                    out = []
+                    path = self.find_include(m.group(1) or m.group(2), filename)
+                    with open(path) as f:
+                        for l in self.process_lines(f, path, depth + 1):
+                            yield l
+                    pos = m.end()
+                elif name in self.passthrough:
+                    out.append(line[d.start():])
+                    break
+                elif name in self.macros:
+                    formals, body = self.macros[name]
+                    if formals is not None:
+                        args = self.arguments(line, pos)
+                        while args is None:
+                            more = next(lines, None)
+                            if more is None:
+                                raise PreprocessError('%s: unterminated arguments of `%s' % (filename, name))
+                            line += more
+                            nlines += 1
+                            args = self.arguments(line, pos)
+                        args, pos = args
+                        body = self.substitute(name, formals, args, filename)
+                    out.append(self.expand(body, filename))
+                else:
+                    raise PreprocessError('%s: undefined macro `%s' % (filename, name))
+            text = ''.join(out)
+            yield text + '\n' * max(nlines - text.count('\n'), 0)
+
+    def emit(self, out, text):
+        if self.active:
+            out.append(text)
+
+    def conditional(self, name, line, pos, filename):
+        if name in ('ifdef', 'ifndef', 'elsif'):
+            m = self.ident.match(line, pos)
+            if m is None:
+                raise PreprocessError('%s: `%s without a macro name' % (filename, name))
+            defined = m.group(1) in self.macros
+            pos = m.end()
+        if name in ('elsif', 'else', 'endif') and not self.cond:
+            raise PreprocessError('%s: `%s without `ifdef' % (filename, name))
+        if name == 'ifdef' or name == 'ifndef':
+            taken = defined if name == 'ifdef' else not defined
+            self.cond.append([self.active, taken])
+            self.active = self.active and taken
+        elif name == 'elsif':
+            parent, done = self.cond[-1]
+            taken = not done and defined
+            self.cond[-1][1] = done or taken
+            self.active = parent and taken
+        elif name == 'else':
+            parent, done = self.cond[-1]
+            self.cond[-1][1] = True
+            self.active = parent and not done
+        else:
+            self.active = self.cond.pop()[0]
+        return pos
+
+    def define(self, text, filename):
+        m = self.ident.match(text)
+        if m is None:
+            raise PreprocessError('%s: `define without a macro name' % filename)
+        name = m.group(1)
+        pos = m.end()
+        formals = None
+        if text.startswith('(', pos):
+            end = text.find(')', pos)
+            if end < 0:
+                raise PreprocessError('%s: malformed parameter list of `%s' % (filename, name))
+            formals = [f.strip() for f in text[pos + 1:end].split(',')]
+            formals = [] if formals == [''] else formals
+            pos = end + 1
+        body = []
+        for part in text[pos:].split('\n'):
+            part = part.rstrip()
+            if part.endswith('\\'):
+                part = part[:-1]
+            body.append(self.strip_comment(part))
+        self.macros[name] = (formals, ' '.join(body).strip())
+
+    def strip_comment(self, text):
+        pos = 0
+        while True:
+            m = self.scan.search(text, pos)
+            if m is None:
+                return text
+            if m.group() == '//':
+                return text[:m.start()]
+            if m.group() == '"':
+                pos = self.string.match(text, m.start()).end()
+            else:
+                pos = m.end()
+
+    def arguments(self, text, pos):
+        # (args, end) for a parenthesised actual list at pos, None if unterminated
+        m = self.open_paren.match(text, pos)
+        if m is None:
+            return [], pos
+        args = []
+        level = 0
+        start = pos = m.end()
+        while pos < len(text):
+            c = text[pos]
+            if c == '"':
+                pos = self.string.match(text, pos).end()
+                continue
+            if c in '([{':
+                level += 1
+            elif c in ')]}' and level:
+                level -= 1
+            elif c == ')':
+                args.append(text[start:pos].strip())
+                return args, pos + 1
+            elif c == ',' and not level:
+                args.append(text[start:pos].strip())
+                start = pos + 1
+            pos += 1
+        return None
+
+    def substitute(self, name, formals, args, filename):
+        if args == [''] and not formals:
+            args = []
+        if len(args) != len(formals):
+            raise PreprocessError('%s: `%s expects %d arguments, got %d'
+                                  % (filename, name, len(formals), len(args)))
+        actual = dict(zip(formals, args))
+        body = self.macros[name][1]
+        return self.word.sub(lambda m: actual.get(m.group(), m.group()), body)
+
+    def expand(self, text, filename, depth=0):
+        if '`' not in text:
+            return text
+        if depth > self.max_depth:
+            raise PreprocessError('%s: recursive macro expansion' % filename)
+        out = []
+        pos = 0
+        while True:
+            m = self.quote_or_tick.search(text, pos)
+            if m is None:
+                out.append(text[pos:])
+                return ''.join(out)
+            out.append(text[pos:m.start()])
+            if m.group() == '"':
+                pos = self.string.match(text, m.start()).end()
+                out.append(text[m.start():pos])
+                continue
+            d = self.directive.match(text, m.start())
+            if d is None or d.group(1) not in self.macros:
+                out.append(text[m.start():m.end()])
+                pos = m.end()
+                continue
+            name = d.group(1)
+            formals, body = self.macros[name]
+            pos = d.end()
+            if formals is not None:
+                args = self.arguments(text, pos)
+                if args is None:
+                    raise PreprocessError('%s: unterminated arguments of `%s' % (filename, name))
+                args, pos = args
+                body = self.substitute(name, formals, args, filename)
+            out.append(self.expand(body, filename, depth + 1))
+
+    def find_include(self, name, filename):
+        dirs = [os.path.dirname(filename)] if filename else []
+        for d in dirs + self.include + ['.']:
+            path = os.path.join(d, name)
+            if os.path.isfile(path):
+                return path
+        raise PreprocessError('%s: cannot find `include file %s' % (filename, name))
+
+
 class VerilogPreprocessor(object):
-    def __init__(self, filelist, outputfile='pp.out', include=None, define=None):
+    def __init__(self, filelist, outputfile='pp.out', include=None, define=None, iverilog=None):
 
         if not isinstance(filelist, (tuple, list)):
             filelist = list(filelist)
 
+        if iverilog is None:
+            iverilog = 'PYVERILOG_IVERILOG' in os.environ
+        self.iverilog = iverilog
+        self.outputfile = outputfile
+        self.include = include
+        self.define = define
+
         # Elements in `filelist` can either be raw Verilog files, or Verilog code
         # in python string. The following loop iterates through these `sources`,
         # and normalizes all of them into files.
         #
         # For Verilog code in python string, the contents of the string is stored
-        # in a temporary file for further use with `iverilog`.
+        # in a temporary file for further use with `iverilog`; the in-process
+        # preprocessor reads them directly.
+        self.sources = list(filelist)
         self.temp_files_paths = []
         self.filelist = []
 
+        if not iverilog:
+            return
+
         for source in filelist:
             # If `source` is verilog code in python strings
             if not os.path.isfile(source):
@@ -82,6 +390,11 @@ class VerilogPreprocessor(object):
         self.iv.append(outputfile)
 
     def preprocess(self):
+        if not self.iverilog:
+            with open(self.outputfile, 'w') as f:
+                f.writelines(self.preprocess_lines())
+            return
+
         cmd = self.iv + list(self.filelist)
         subprocess.call(cmd)
 
@@ -89,6 +402,32 @@ class VerilogPreprocessor(object):
         for temp_file_path in self.temp_files_paths:
             os.remove(temp_file_path)
 
+    def preprocess_lines(self):
+        # preprocessed source as a stream of lines, without touching the CWD
+        # unless iverilog is used
+        if self.iverilog:
+            self.preprocess()
+            try:
+                with open(self.outputfile) as f:
+                    for line in f:
+                        yield line
+            finally:
+                os.remove(self.outputfile)
+            return
+
+        pp = VerilogMacroPreprocessor(self.include, self.define)
+        for source in self.sources:
+            if os.path.isfile(source):
+                lines = pp.process_file(source)
+            else:
+                lines = pp.process_lines(io.StringIO(source))
+            for line in lines:
+                yield line
+        pp.finish()
+
+    def preprocess_text(self):
+        return ''.join(self.preprocess_lines())
+
 
 def preprocess(
     filelist,
@@ -97,7 +436,4 @@ def preprocess(
     define=None
 ):
     pre = VerilogPreprocessor(filelist, output, include, define)
-    pre.preprocess()
-    text = open(output).read()
-    os.remove(output)
-    return text
+    return pre.preprocess_text()
@@ -2,22 +2,52 @@ import copy, sys, time, json
 from DG import *
 
 
+def run_frames(frame):
+    ### drive generator frames with an explicit stack instead of the call
+    ### stack: a frame yields the frame it descends into and is resumed with
+    ### that frame's return value
+    stack = [frame]
+    value = None
+    while stack:
+        try:
+            sub = stack[-1].send(value)
+        except StopIteration as e:
+            stack.pop()
+            value = e.value
+        else:
+            stack.append(sub)
+            value = None
+    return value
+
+
 class AST_analyzer(object):
-    def __init__(self, ast):
+    def __init__(self, ast, share=False):
         self.__ast = ast
         self.graph = Graph()
         self.oper_label = 0
         self.const_label = 0
+        ### share mode: structurally identical operators and constants become one node
+        self.share = share
+        self.shared = {}
         self.wire_set = set()
 
         self.wire_dict = {}
-        self.temp_dict = {}
+        self.unresolved_wires = set()
 
         self.func_set = set()
         self.func_dict = {}
 
     def AST2Graph(self, ast):
         self.traverse_AST(ast)
+        self.build_graph()
+
+    def AST2Graph_stream(self, modules):
+        ### consume module definitions one at a time, each can be freed after use
+        for module in modules:
+            self.traverse_AST(module)
+        self.build_graph()
+
+    def build_graph(self):
         self.graph.cal_node_width()
         self.eliminate_wires(self.graph)
         self.add_parent_edge()
@@ -25,16 +55,19 @@ class AST_analyzer(object):
 
        
     def traverse_AST(self, ast):
-        node_type = ast.get_type()
-        if node_type == 'Function':
-            self.func_set.add(ast)
-            self.analyze_function()
-            return
-        self.add_decl_node(ast, node_type)
-        self.add_assign_edge(ast, node_type)
-        
-        for c in ast.children():
-            self.traverse_AST(c)
+        ### preorder with an explicit stack, no recursion limit on deep trees
+        stack = [ast]
+        while stack:
+            ast = stack.pop()
+            node_type = ast.get_type()
+            if node_type == 'Function':
+                self.func_set.add(ast)
+                self.analyze_function()
+                continue
+            self.add_decl_node(ast, node_type)
+            self.add_assign_edge(ast, node_type)
+
+            stack.extend(reversed(ast.children()))
     
     def add_parent_edge(self):
         for name, node in self.graph.node_dict.items():
@@ -43,11 +76,13 @@ class AST_analyzer(object):
                     self.graph.add_edge(node.father, name)
 
     def func2graph(self, ast, input_list):
-        nodetype = ast.get_type()
-        if nodetype in ['Input']:
-            input_list.append(str(ast.name))
-        for c in ast.children():
-            self.func2graph(c, input_list)
+        stack = [ast]
+        while stack:
+            ast = stack.pop()
+            nodetype = ast.get_type()
+            if nodetype in ['Input']:
+                input_list.append(str(ast.name))
+            stack.extend(reversed(ast.children()))
 
     def analyze_function(self):
         for f in self.func_set.copy():
@@ -76,8 +111,11 @@ class AST_analyzer(object):
             
 
     def cal_width(self, ast):
-        msb = int(ast.msb.value)
-        lsb = int(ast.lsb.value)
+        return self.cal_width_num(ast.msb.value, ast.lsb.value)
+
+    def cal_width_num(self, msb, lsb):
+        msb = int(msb)
+        lsb = int(lsb)
         LHS = max(msb, lsb)
         RHS = min(msb, lsb)
         width = LHS - RHS + 1
@@ -98,69 +136,82 @@ class AST_analyzer(object):
         return width*length
 
     def add_assign_edge(self, ast, node_type=None, sub_dict=None):
-        node_type = ast.get_type()
-        if sub_dict:
-            if str(ast) in sub_dict.keys():
-                ast = sub_dict[str(ast)]
-        ### directly assign
-        if node_type in ['Assign',  'NonblockingSubstitution', 'BlockingSubstitution']:
-            self.add_assign(ast)
-        # elif node_type == 'EventStatement':
-        #     return
-        elif node_type == 'Block':
-            ast_tuple = ast.statements
-            for ast in ast_tuple:
-                self.add_assign_edge(ast)
-        ### nested if statement
-        elif node_type == 'IfStatement':
-            cond = ast.cond
-            ts = ast.true_statement
-            fs = ast.false_statement
-            mux_name = 'Mux' + str(self.oper_label)
-            self.oper_label += 1
-            cond_width = self.get_node_width(cond)
-            if not cond_width:
-                if cond.get_type() == 'Concat':
-                    cond_width = 2
-            self.graph.add_decl_node(mux_name, 'Operator', cond_width, None)
-            # add mux
-            # 1. if without else -> no mux
-            if not fs:
-                self.add_assign(ts)
-            elif fs.get_type() != 'NonblockingSubstitution':
-                self.assign(cond, mux_name)
-                LHS1 = self.add_assign(ts, mux_name)
-                self.graph.add_edge(LHS1, mux_name)
+        run_frames(self.assign_edge_frame(ast, sub_dict))
 
-            # 2. if with else -> one mux
-            elif (ts != fs) and (ts.get_type() == fs.get_type()):
-                self.assign(cond, mux_name)
-                LHS0 = self.add_assign(fs, mux_name)
-                LHS1 = self.add_assign(ts, mux_name)
-                assert LHS0 == LHS1
-                self.graph.add_edge(LHS1, mux_name)
+    def add_assign(self, ast, L=None):
+        return run_frames(self.assign_frame(ast, L))
 
+    def assign_edge_frame(self, ast, sub_dict=None):
+        ### a frame of the statement walk: nested statements are yielded to
+        ### run_frames, which resumes the frame with their LHS; else-if chains
+        ### are followed in this loop
+        while ast is not None:
+            next_ast = None
+            node_type = ast.get_type()
+            if sub_dict:
+                if str(ast) in sub_dict.keys():
+                    ast = sub_dict[str(ast)]
+            ### directly assign
+            if node_type in ['Assign',  'NonblockingSubstitution', 'BlockingSubstitution']:
+                yield self.assign_frame(ast)
+            # elif node_type == 'EventStatement':
+            #     return
+            elif node_type == 'Block':
+                ast_tuple = ast.statements
+                for ast in ast_tuple:
+                    yield self.assign_edge_frame(ast)
+            ### nested if statement
+            elif node_type == 'IfStatement':
+                cond = ast.cond
+                ts = ast.true_statement
+                fs = ast.false_statement
+                mux_name = 'Mux' + str(self.oper_label)
+                self.oper_label += 1
+                cond_width = self.get_node_width(cond)
+                if not cond_width:
+                    if cond.get_type() == 'Concat':
+                        cond_width = 2
+                self.graph.add_decl_node(mux_name, 'Operator', cond_width, None, OP_ID['Mux'])
+                # add mux
+                # 1. if without else -> no mux
+                if not fs:
+                    yield self.assign_frame(ts)
+                elif fs.get_type() != 'NonblockingSubstitution':
+                    self.assign(cond, mux_name)
+                    LHS1 = yield self.assign_frame(ts, mux_name)
+                    self.graph.add_edge(LHS1, mux_name)
+
+                # 2. if with else -> one mux
+                elif (ts != fs) and (ts.get_type() == fs.get_type()):
+                    self.assign(cond, mux_name)
+                    LHS0 = yield self.assign_frame(fs, mux_name)
+                    LHS1 = yield self.assign_frame(ts, mux_name)
+                    assert LHS0 == LHS1
+                    self.graph.add_edge(LHS1, mux_name)
 
-            # 3. if else if -> multiple mux
-            else:
-                self.add_assign_edge(fs)
-        ### nested case statement
-        elif node_type in ['CaseStatement', 'CasezStatement', 'CasexStatement', 'UniqueCaseStatement']:
-            cond = ast.comp
-            mux_name = 'Mux' + str(self.oper_label)
-            self.oper_label += 1
-            self.assign(cond, mux_name)
-            cond_width = self.get_node_width(cond)
-            if not cond_width:
-                if cond.get_type() == 'Concat':
-                    cond_width = 2
-            self.graph.add_decl_node(mux_name, 'Operator', cond_width, None)
-            caselist = ast.caselist
-            for case_assign in caselist:
-                self.add_case_assign(case_assign, cond_width)
+
+                # 3. if else if -> multiple mux
+                else:
+                    next_ast = fs
+            ### nested case statement
+            elif node_type in ['CaseStatement', 'CasezStatement', 'CasexStatement', 'UniqueCaseStatement']:
+                cond = ast.comp
+                mux_name = 'Mux' + str(self.oper_label)
+                self.oper_label += 1
+                self.assign(cond, mux_name)
+                cond_width = self.get_node_width(cond)
+                if not cond_width:
+                    if cond.get_type() == 'Concat':
+                        cond_width = 2
+                self.graph.add_decl_node(mux_name, 'Operator', cond_width, None, OP_ID['Mux'])
+                caselist = ast.caselist
+                for case_assign in caselist:
+                    yield from self.case_assign_frame(case_assign, cond_width)
+            ast = next_ast
+            sub_dict = None
 
     
-    def add_case_assign(self, ast, width):
+    def case_assign_frame(self, ast, width):
         child = ast.children()
         ll = len(child)
         if ll >= 2:
@@ -170,8 +221,8 @@ class AST_analyzer(object):
             self.oper_label += 1
             self.assign(cond, mux_name)
     
-            self.graph.add_decl_node(mux_name, 'Operator', width, None)
-            LHS1 = self.add_assign(sta, mux_name)
+            self.graph.add_decl_node(mux_name, 'Operator', width, None, OP_ID['Mux'])
+            LHS1 = yield self.assign_frame(sta, mux_name)
             self.graph.add_edge(LHS1, mux_name)
         elif ll == 1:
             pass
@@ -184,8 +235,11 @@ class AST_analyzer(object):
 
 
     def get_node_width(self, ast):
+        ### a unary operator takes the width of its operand
+        leaf = ['Identifier', 'Pointer', 'Partselect', 'IntConst', 'Concat']
+        while ast.get_type() not in leaf and ast.get_parent_type() == 'UnaryOperator':
+            ast = ast.right
         node_type = ast.get_type()
-        parent_type = ast.get_parent_type()
         
         if node_type == 'Identifier':
             width = self.graph.node_dict[ast.name].width
@@ -199,25 +253,24 @@ class AST_analyzer(object):
             width = self.get_width_num(ast.value)
         elif node_type in ['Concat']:
             width = None
-        elif parent_type == 'UnaryOperator':
-            width = self.get_node_width(ast.right)
         else:
             print(node_type)
             assert False
 
         return width
-    def add_assign(self, ast, L=None):
+
+    def assign_frame(self, ast, L=None):
         node_type = ast.get_type()
         if node_type == 'IfStatement':
-            self.add_assign_edge(ast)
+            yield self.assign_edge_frame(ast)
             return
         elif node_type == 'Block':
             ast_tuple = ast.statements
             for ast in ast_tuple:
-                self.add_assign_edge(ast)
+                yield self.assign_edge_frame(ast)
             return
         elif node_type in ['CaseStatement', 'CasezStatement', 'CasexStatement', 'UniqueCaseStatement']:
-            self.add_assign_edge(ast)
+            yield self.assign_edge_frame(ast)
             return
         elif node_type == 'EventStatement':
             return
@@ -281,47 +334,106 @@ class AST_analyzer(object):
         return ast
 
     def assign(self, ast, parent_name):
-        self.rt_flag = 0
-        node_type = ast.get_type()
-        parent_type = ast.get_parent_type()
-
-        if parent_type == 'Constant':
-            node_name = 'Constant' + str(self.const_label)
-            self.const_label += 1
-            width = self.get_width_num(ast.value)          
-            self.graph.add_decl_node(node_name, parent_type, width)
-        elif parent_type in ['Operator', 'UnaryOperator']:
-            node_name = str(node_type) + str(self.oper_label)
-            self.oper_label += 1
-            self.graph.add_decl_node(node_name, parent_type)
-        elif parent_type in ['Concat', 'Repeat']:
-            node_name = str(parent_type) + str(self.oper_label)
-            self.oper_label += 1
-            self.graph.add_decl_node(node_name, parent_type, 0)
-        elif parent_type in ['Identifier', 'Pointer', 'Partselect']: 
-            node_name = self.add_new_node(ast)
-            self.rt_flag = 1
-        elif parent_type == 'SystemCall':
-            ast = self.unroll_syscall(ast)
-            self.assign(ast, parent_name)
-            return
-        
-        elif parent_type == 'FunctionCall':
-            self.func_call(ast, parent_name)
+        if self.share:
+            node_name = self.assign_shared(ast, parent_name)
+            if node_name:
+                self.graph.add_edge(parent_name, node_name)
             return
-        else:
-            print('ERROR, future work')
-            print(ast)
-            print(node_type)
-            print(ast.var)
-            assert False
-        
-        self.graph.add_edge(parent_name, node_name)
-        if self.rt_flag == 1:
-            return
-        for c in ast.children():
-            self.assign(c, node_name)
+        ### explicit stack, nodes are labelled in the same preorder as recursion
+        stack = [(ast, parent_name)]
+        while stack:
+            ast, parent_name = stack.pop()
+            self.rt_flag = 0
+            node_type = ast.get_type()
+            parent_type = ast.get_parent_type()
+
+            if parent_type == 'Constant':
+                node_name = 'Constant' + str(self.const_label)
+                self.const_label += 1
+                width = self.get_width_num(ast.value)
+                self.graph.add_decl_node(node_name, parent_type, width)
+            elif parent_type in ['Operator', 'UnaryOperator']:
+                node_name = str(node_type) + str(self.oper_label)
+                self.oper_label += 1
+                self.graph.add_decl_node(node_name, parent_type, op=op_id(node_type))
+            elif parent_type in ['Concat', 'Repeat']:
+                node_name = str(parent_type) + str(self.oper_label)
+                self.oper_label += 1
+                self.graph.add_decl_node(node_name, parent_type, 0, op=OP_ID[parent_type])
+            elif parent_type in ['Identifier', 'Pointer', 'Partselect']:
+                node_name = self.add_new_node(ast)
+                self.rt_flag = 1
+            elif parent_type == 'SystemCall':
+                ast = self.unroll_syscall(ast)
+                stack.append((ast, parent_name))
+                continue
+
+            elif parent_type == 'FunctionCall':
+                self.func_call(ast, parent_name)
+                continue
+            else:
+                print('ERROR, future work')
+                print(ast)
+                print(node_type)
+                print(ast.var)
+                assert False
+
+            self.graph.add_edge(parent_name, node_name)
+            if self.rt_flag == 1:
+                continue
+            stack.extend((c, node_name) for c in reversed(ast.children()))
     
+    def assign_shared(self, ast, parent_name):
+        ### postorder, so an operator is keyed by its kind and the nodes its
+        ### operands resolved to, and a constant by its value
+        out = []
+        stack = [(ast, None)]
+        while stack:
+            ast, num = stack.pop()
+            node_type = ast.get_type()
+            parent_type = ast.get_parent_type()
+            if num is not None:
+                operands = tuple(n for n in out[len(out) - num:] if n)
+                del out[len(out) - num:]
+                if parent_type in ['Concat', 'Repeat']:
+                    out.append(self.share_node((parent_type, operands), parent_type, 0, OP_ID[parent_type], operands))
+                else:
+                    out.append(self.share_node((node_type, operands), parent_type, None, op_id(node_type), operands))
+            elif parent_type == 'Constant':
+                out.append(self.share_node(('Constant', ast.value), 'Constant', self.get_width_num(ast.value)))
+            elif parent_type in ['Operator', 'UnaryOperator', 'Concat', 'Repeat']:
+                children = ast.children()
+                stack.append((ast, len(children)))
+                stack.extend((c, None) for c in reversed(children))
+            elif parent_type in ['Identifier', 'Pointer', 'Partselect']:
+                out.append(self.add_new_node(ast))
+            elif parent_type == 'SystemCall':
+                stack.append((self.unroll_syscall(ast), None))
+            elif parent_type == 'FunctionCall':
+                self.func_call(ast, parent_name)
+                out.append(None)
+            else:
+                print('ERROR, future work')
+                print(ast)
+                print(node_type)
+                assert False
+        return out[0]
+
+    def share_node(self, key, node_type, width=None, op=None, operands=()):
+        node_name = self.shared.get(key)
+        if node_name is None:
+            if node_type == 'Constant':
+                node_name = 'Constant' + str(self.const_label)
+                self.const_label += 1
+            else:
+                node_name = key[0] + str(self.oper_label)
+                self.oper_label += 1
+            self.graph.add_decl_node(node_name, node_type, width, op=op)
+            for n in operands:
+                self.graph.add_edge(node_name, n)
+            self.shared[key] = node_name
+        return node_name
+
     def func_call(self, ast, parent_name):
         node_type = ast.get_type()
         c = list(ast.children())
@@ -359,49 +471,54 @@ class AST_analyzer(object):
         print('----- Eliminating Wires in Graph -----')
         for name, node in self.graph.node_dict.items():
             if node.father in self.wire_set:
-                # print(name)
-                # input()
                 self.wire_set.add(name)
-        g_node = g.get_all_nodes2()
-        interset = g_node & self.wire_set
-        ll = len(interset)
-        while(len(interset)!=0):
-            pre_len = len(interset)
-            g = self.eliminate_wire(g)
-            g_node = g.get_all_nodes2()
-            interset = g_node & self.wire_set
-            post_len = len(interset)
-            if pre_len == post_len:
-                break
-        if len(interset) != 0:
-            # print('Warning: uneliminated wire: ', len(interset))
-            for n in interset.copy():
-                neighbor = self.graph.get_neighbors(n)
-                if len(neighbor) == 0:
-                    self.graph.remove_node(n)
-                    interset.remove(n)
-
-            # print('Final uneliminated wire: ', len(interset))
+        for node, node_list in g.graph.items():
+            if node in self.wire_set:
+                self.wire_dict[node] = node_list
+        if self.wire_dict:
+            ### every wire is expanded into its non-wire drivers once; undriven
+            ### wires and wires on a loop are kept and reported
+            resolved = {}
+            g_new = Graph()
+            for node, node_list in g.graph.items():
+                if node in self.wire_set:
+                    continue
+                for n in node_list:
+                    if n in self.wire_dict:
+                        for w in self.resolve_wire(n, resolved):
+                            g_new.add_edge(node, w)
+                    else:
+                        g_new.add_edge(node, n)
+            g = g_new
+        self.unresolved_wires = g.get_all_nodes2() & self.wire_set
+        if len(self.unresolved_wires) != 0:
+            print('Warning: uneliminated wire: ', len(self.unresolved_wires))
         node_dict = self.graph.node_dict.copy()
         self.graph = g
         self.graph.load_node_dict(node_dict)
 
-    def eliminate_wire(self, g:Graph):
-        node_set = g.get_all_nodes()
-        for node in node_set:
-            node_list = g.get_neighbors(node)
-            if node in self.wire_set:
-                self.wire_dict[node] = node_list
-            else:
-                self.temp_dict[node] = node_list
-        g_new = Graph()
-        for node, node_list in self.temp_dict.items():
-            for n in node_list:
-                if n in self.wire_dict.keys():
-                    wire_assign = self.wire_dict[n]
-                    for w in wire_assign:
-                        if w:
-                            g_new.add_edge(node, w)
+    def resolve_wire(self, wire, resolved):
+        if wire in resolved:
+            return resolved[wire]
+        stack = [(wire, iter(self.wire_dict[wire]), [])]
+        on_stack = {wire}
+        while stack:
+            w, it, out = stack[-1]
+            for n in it:
+                if not n:
+                    continue
+                if n in resolved:
+                    out.extend(resolved[n])
+                elif n in self.wire_dict and n not in on_stack:
+                    stack.append((n, iter(self.wire_dict[n]), []))
+                    on_stack.add(n)
+                    break
                 else:
-                    g_new.add_edge(node, n)
-        return g_new
+                    out.append(n)
+            else:
+                stack.pop()
+                on_stack.discard(w)
+                resolved[w] = out
+                if stack:
+                    stack[-1][2].extend(out)
+        return resolved[wire]
@@ -1,20 +1,75 @@
 
-from collections import defaultdict
+from collections import defaultdict, deque
 from multiprocessing import Pool
-import sys, re, os
+import sys, re, os, json
 import numpy as np
 import pickle
-sys.setrecursionlimit(10000)
+
+### operator kinds, named by the key std_PPA.json and the feature scripts use
+### (the first capitalised word followed by the label, e.g. LessThan12 -> Than)
+OP_NAMES = ('And', 'Or', 'Xor', 'Xnor', 'Land', 'Lor', 'Unot', 'Ulnot', 'Uand', 'Unand',
+            'Uor', 'Unor', 'Uxor', 'Uxnor', 'Uplus', 'Uminus', 'Plus', 'Minus', 'Times',
+            'Divide', 'Mod', 'Power', 'Sll', 'Srl', 'Sla', 'Sra', 'Than', 'Eq', 'Eql',
+            'Cond', 'Mux', 'Concat', 'Repeat', 'Case')
+OP_ID = {op: i for i, op in enumerate(OP_NAMES)}
+_op_prefix = {}
+
+def op_id(name):
+    prefix = name.rstrip('0123456789')
+    op = _op_prefix.get(prefix)
+    if op is None:
+        op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', prefix + '0')
+        op = OP_ID.get(op_temp[0][0], -1) if op_temp else -1
+        _op_prefix[prefix] = op
+    return op
+
+def get_op_id(node):
+    op = getattr(node, 'op', None)
+    if op is None:
+        ### graphs pickled before the operator kind was recorded
+        op = op_id(node.name)
+    return op
+
+def get_op(node):
+    op = get_op_id(node)
+    return OP_NAMES[op] if op >= 0 else None
 
 class Node:
-    def __init__(self, name, type, width:None, father:None):
+    ### delay, fanout, AT, path and feat stay unset until a stage fills them in
+    __slots__ = ('name', 'type', 'width', 'father', 'op', 'tr', 't1',
+                 'delay', 'fanout', 'AT', 'path', 'feat')
+
+    def __init__(self, name, type, width:None, father:None, op=None):
         self.name = name
         self.type = type
         self.width = width
         self.father = father
-        self.path = []
+        self.op = op
         self.tr = None
         self.t1 = 0.5
+
+    def __reduce__(self):
+        state = {}
+        if self.tr is not None:
+            state['tr'] = self.tr
+        if self.t1 != 0.5:
+            state['t1'] = self.t1
+        for k in ('delay', 'fanout', 'AT', 'path', 'feat'):
+            if hasattr(self, k):
+                state[k] = getattr(self, k)
+        return Node, (self.name, self.type, self.width, self.father, self.op), state or None
+
+    def __setstate__(self, state):
+        ### node_dict pickles written before __slots__ hold a plain __dict__
+        if isinstance(state, tuple):
+            state = state[1]
+        for k, v in state.items():
+            if k == 'path' and not v:
+                continue
+            setattr(self, k, v)
+        for k, v in (('op', None), ('tr', None), ('t1', 0.5)):
+            if not hasattr(self, k):
+                setattr(self, k, v)
     
     def update_width(self, width):
         self.width = width
@@ -87,8 +142,8 @@ class Graph:
         self.graph = graph
         self.node_dict = node_dict
 
-    def add_decl_node(self, name, type, width=None, father=None):
-        node = Node(name, type, width, father)
+    def add_decl_node(self, name, type, width=None, father=None, op=None):
+        node = Node(name, type, width, father, op)
         self.node_dict[name] = node
 
     def graph2pkl(self, design_name, cmd, folder_dir):
@@ -102,6 +157,9 @@ class Graph:
 
         
 
+    def graph2csr(self, design_name, cmd, folder_dir):
+        CSRGraph.from_graph(self).save(folder_dir + f'{design_name}_{cmd}.csr')
+
     def add_edge(self, u, v):
         if u not in self.graph:
             self.graph[u] = []
@@ -131,27 +189,52 @@ class Graph:
     def cal_node_width(self):
         print('----- Calculating Operator Width -----')
         self.nowidth_set = set()
-        
+        users = defaultdict(list)
+        waiting = {}
+        ready = deque()
         for name, node in self.node_dict.items():
             if not node.width:
                 self.nowidth_set.add(name)
-
-        while(len(self.nowidth_set) != 0):
-            ll_pre = len(self.nowidth_set)
-            for n in self.nowidth_set.copy():
-                # print(n)
-                # assert n in self.graph.keys()
-                if n in self.graph.keys():
-                    neighbor = self.graph[n]
-                    width = self.get_max_neighbor_wdith(neighbor)
-                    self.node_dict[n].update_width(width)
-                    if width:
-                        self.nowidth_set.remove(n)
-            ll_post = len(self.nowidth_set)
-        #     if ll_pre == ll_post:
-        #         break
-        # print(ll_post)
-        # print(self.nowidth_set)
+        ### a node takes the max width of its drivers once all of them are known
+        for name in self.node_dict:
+            if name not in self.nowidth_set or name not in self.graph:
+                continue
+            deps = {n for n in self.graph[name] if n in self.nowidth_set}
+            for n in deps:
+                users[n].append(name)
+            waiting[name] = len(deps)
+            if not deps:
+                ready.append(name)
+        relaxed = None
+        while True:
+            if ready:
+                n = ready.popleft()
+                if n not in self.nowidth_set:
+                    continue
+                width = self.get_max_neighbor_wdith(self.graph[n])
+            elif relaxed is None:
+                ### stalled by a loop or an unknown driver: fall back to the known drivers
+                relaxed = deque(n for n in waiting if n in self.nowidth_set)
+                continue
+            elif relaxed:
+                n = relaxed.popleft()
+                if n not in self.nowidth_set:
+                    continue
+                width = self.get_max_known_width(self.graph[n])
+            else:
+                break
+            if not width:
+                continue
+            self.node_dict[n].update_width(width)
+            self.nowidth_set.remove(n)
+            for u in users[n]:
+                waiting[u] -= 1
+                if waiting[u] == 0:
+                    ready.append(u)
+                elif relaxed is not None:
+                    relaxed.append(u)
+        if len(self.nowidth_set) != 0:
+            print('Warning: unresolved width: ', len(self.nowidth_set))
 
     def get_max_neighbor_wdith(self, neighbor):
         width_list = []
@@ -165,6 +248,14 @@ class Graph:
         assert len(neighbor) == len(width_list)
         width = max(width_list)
         return width
+
+    def get_max_known_width(self, neighbor):
+        width_list = []
+        for n in neighbor:
+            width_node = self.node_dict.get(n)
+            if width_node and width_node.width:
+                width_list.append(width_node.width)
+        return max(width_list, default=None)
     
     def get_stat(self):
         all_node = self.get_all_nodes2()
@@ -260,3 +351,443 @@ class Graph:
 
                 
 
+
+
+NODE_TYPES = ('Input', 'Output', 'Inout', 'Tri', 'Wire', 'Reg', 'Integer', 'Real', 'Genvar',
+              'Parameter', 'Localparam', 'Supply', 'Constant', 'Operator', 'UnaryOperator',
+              'Concat', 'Repeat', 'Mux', 'Pointer', 'Partselect')
+TYPE_ID = {t: i for i, t in enumerate(NODE_TYPES)}
+OP_TYPES = ('Operator', 'UnaryOperator', 'Concat', 'Repeat', 'Mux')
+
+
+CSR_VERSION = 1
+CSR_DTYPES = {
+    'names': np.uint8, 'name_offsets': np.int64,
+    'succ_ptr': np.int64, 'succ_idx': np.int32, 'pred_ptr': np.int64, 'pred_idx': np.int32,
+    'type': np.int8, 'width': np.int32, 'father': np.int32, 'op': np.int8,
+    'delay': np.float64, 'tr': np.float64, 't1': np.float64, 'fanout': np.int32,
+    'in_graph': np.bool_,
+}
+CSR_COLUMNS = ('type', 'width', 'father', 'op', 'delay', 'tr', 't1', 'fanout', 'in_graph')
+
+
+class GraphLoopError(ValueError):
+    ### raised by CSRGraph.topological_order; loops holds the node names of every
+    ### strongly connected component that closes a loop
+    def __init__(self, loops):
+        self.loops = loops
+        shown = []
+        for loop in loops[:5]:
+            names = ', '.join(loop[:8])
+            if len(loop) > 8:
+                names += ', ... %d nodes' % len(loop)
+            shown.append('{' + names + '}')
+        if len(loops) > 5:
+            shown.append('...')
+        super().__init__('graph contains %d loop(s): %s' % (len(loops), '; '.join(shown)))
+
+
+class CSRGraph:
+    ### integer node ids with CSR (drivers) / CSC (users) arrays and one column per
+    ### node attribute; edge u -> v means v drives u, as in Graph.
+    ### type is -1 for a name without a Node, width/father/op/fanout are -1 and
+    ### delay/tr are nan when unset
+    def __init__(self, names, succ_ptr, succ_idx, columns, pred=None):
+        ### names is a list, or a (utf-8 blob, offsets) pair decoded on first use
+        self._names = names
+        self._name2id = None
+        self._cache = {}
+        self.num_nodes = len(succ_ptr) - 1
+        self.succ_ptr = succ_ptr
+        self.succ_idx = succ_idx
+        if pred is None:
+            pred = self.transpose(succ_ptr, succ_idx, self.num_nodes)
+        self.pred_ptr, self.pred_idx = pred
+        for k in CSR_COLUMNS:
+            setattr(self, k, columns[k])
+
+    @property
+    def names(self):
+        if isinstance(self._names, tuple):
+            blob, offsets = self._names
+            data = blob.tobytes()
+            offsets = offsets.tolist()
+            self._names = [data[a:b].decode('utf-8') for a, b in zip(offsets[:-1], offsets[1:])]
+        return self._names
+
+    @property
+    def name2id(self):
+        if self._name2id is None:
+            self._name2id = {n: i for i, n in enumerate(self.names)}
+        return self._name2id
+
+    def save(self, path):
+        ### one .npy per array plus meta.json, written last
+        os.makedirs(path, exist_ok=True)
+        encoded = []
+        for n in self.names:
+            if not isinstance(n, str):
+                raise ValueError('node name %r is not a string' % (n,))
+            encoded.append(n.encode('utf-8'))
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        arrays = {
+            'names': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            'name_offsets': offsets,
+            'succ_ptr': self.succ_ptr, 'succ_idx': self.succ_idx,
+            'pred_ptr': self.pred_ptr, 'pred_idx': self.pred_idx,
+        }
+        for k in CSR_COLUMNS:
+            arrays[k] = getattr(self, k)
+        for k, a in arrays.items():
+            np.save(os.path.join(path, k + '.npy'), np.ascontiguousarray(a, dtype=CSR_DTYPES[k]),
+                    allow_pickle=False)
+        meta = {'format': 'csr_graph', 'version': CSR_VERSION,
+                'num_nodes': self.num_nodes, 'num_edges': len(self.succ_idx),
+                'node_types': list(NODE_TYPES), 'op_names': list(OP_NAMES)}
+        ### a topological order computed before saving is kept with the graph
+        if 'topo' in self._cache:
+            np.save(os.path.join(path, 'topo.npy'), np.ascontiguousarray(self._cache['topo'], dtype=np.int64),
+                    allow_pickle=False)
+            meta['topo'] = True
+        elif os.path.exists(os.path.join(path, 'topo.npy')):
+            os.remove(os.path.join(path, 'topo.npy'))
+        with open(os.path.join(path, 'meta.json'), 'w') as f:
+            json.dump(meta, f)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        ### arrays are memory mapped copy-on-write; nothing is unpickled and every
+        ### index is checked against the node and edge counts before use. A bad or
+        ### incomplete directory raises ValueError naming the missing or bad item.
+        def load_array(k):
+            f = os.path.join(path, k + '.npy')
+            if not os.path.isfile(f):
+                raise ValueError('%s: missing %s.npy' % (path, k))
+            return np.load(f, mmap_mode='c' if mmap else None, allow_pickle=False)
+
+        if not os.path.isfile(os.path.join(path, 'meta.json')):
+            raise ValueError('%s: missing meta.json' % path)
+        with open(os.path.join(path, 'meta.json'), 'r') as f:
+            try:
+                meta = json.load(f)
+            except ValueError:
+                meta = None
+        if not isinstance(meta, dict):
+            raise ValueError('%s: bad meta.json' % path)
+        if meta.get('format') != 'csr_graph' or meta.get('version') != CSR_VERSION:
+            raise ValueError('%s: unsupported graph format %s %s' % (path, meta.get('format'), meta.get('version')))
+        for k in ('num_nodes', 'num_edges', 'node_types', 'op_names'):
+            if k not in meta:
+                raise ValueError('%s: meta.json has no %s' % (path, k))
+        num, num_edges = meta['num_nodes'], meta['num_edges']
+        if not isinstance(num, int) or not isinstance(num_edges, int) or num < 0 or num_edges < 0:
+            raise ValueError('%s: bad node or edge count' % path)
+        arrays = {}
+        for k, dtype in CSR_DTYPES.items():
+            a = load_array(k)
+            if a.dtype != dtype or a.ndim != 1:
+                raise ValueError('%s: bad array %s' % (path, k))
+            arrays[k] = a
+
+        def check(ok, what):
+            if not ok:
+                raise ValueError('%s: bad %s' % (path, what))
+
+        def check_range(a, lo, hi, what):
+            check(len(a) == 0 or (a.min() >= lo and a.max() < hi), what)
+
+        def check_ptr(ptr, end, what):
+            check(len(ptr) == num + 1 and ptr[0] == 0 and ptr[-1] == end
+                  and not np.any(np.diff(ptr) < 0), what)
+
+        check_ptr(arrays['name_offsets'], len(arrays['names']), 'name_offsets')
+        check_ptr(arrays['succ_ptr'], num_edges, 'succ_ptr')
+        check_ptr(arrays['pred_ptr'], num_edges, 'pred_ptr')
+        check(len(arrays['succ_idx']) == num_edges and len(arrays['pred_idx']) == num_edges, 'edge count')
+        check_range(arrays['succ_idx'], 0, num, 'succ_idx')
+        check_range(arrays['pred_idx'], 0, num, 'pred_idx')
+        for k in CSR_COLUMNS:
+            check(len(arrays[k]) == num, k)
+        check_range(arrays['father'], -1, num, 'father')
+        for k, table, current in (('type', meta['node_types'], NODE_TYPES), ('op', meta['op_names'], OP_NAMES)):
+            check_range(arrays[k], -1, len(table), k)
+            if list(table) != list(current):
+                ids = {t: i for i, t in enumerate(current)}
+                check(all(t in ids for t in table), k + ' table')
+                lut = np.array([ids[t] for t in table] + [-1], dtype=arrays[k].dtype)
+                arrays[k] = lut[arrays[k]]
+
+        columns = {k: arrays[k] for k in CSR_COLUMNS}
+        g = cls((arrays['names'], arrays['name_offsets']), arrays['succ_ptr'], arrays['succ_idx'],
+                columns, pred=(arrays['pred_ptr'], arrays['pred_idx']))
+        if meta.get('topo'):
+            topo = load_array('topo')
+            check(topo.dtype == np.int64 and topo.ndim == 1, 'topo')
+            check(len(topo) == np.count_nonzero(columns['in_graph']), 'topo')
+            check_range(topo, 0, num, 'topo')
+            seen = np.zeros(num, dtype=np.bool_)
+            seen[topo] = True
+            check(np.array_equal(seen, columns['in_graph']), 'topo')
+            pos = np.zeros(num, dtype=np.int64)
+            pos[topo] = np.arange(len(topo))
+            src = np.repeat(np.arange(num), np.diff(arrays['succ_ptr']))
+            check(np.all(pos[src] < pos[arrays['succ_idx']]), 'topo')
+            g._cache['topo'] = topo
+        return g
+
+    @staticmethod
+    def transpose(ptr, idx, num):
+        src = np.repeat(np.arange(num, dtype=np.int32), np.diff(ptr))
+        order = np.argsort(idx, kind='stable')
+        t_ptr = np.zeros(num + 1, dtype=np.int64)
+        np.cumsum(np.bincount(idx, minlength=num), out=t_ptr[1:])
+        return t_ptr, src[order]
+
+    @classmethod
+    def from_graph(cls, graph, node_dict=None):
+        ### accepts a Graph, a dict of lists or a networkx DiGraph; parallel edges
+        ### are merged and nodes are numbered in networkx order
+        if isinstance(graph, Graph):
+            if node_dict is None:
+                node_dict = graph.node_dict
+            graph = graph.graph
+        adj = graph.adj if hasattr(graph, 'adj') else graph
+        name2id = {}
+        names = []
+        for n in adj:
+            if n not in name2id:
+                name2id[n] = len(names)
+                names.append(n)
+        counts = []
+        succ = []
+        for u, nbrs in adj.items():
+            i = name2id[u]
+            nbrs = dict.fromkeys(nbrs)
+            for v in nbrs:
+                if v not in name2id:
+                    name2id[v] = len(names)
+                    names.append(v)
+                succ.append(name2id[v])
+            counts.append((i, len(nbrs)))
+        deg = np.zeros(len(names), dtype=np.int64)
+        for i, c in counts:
+            deg[i] = c
+        succ_ptr = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(deg, out=succ_ptr[1:])
+        succ_idx = np.array(succ, dtype=np.int32)
+        return cls.from_arrays(names, succ_ptr, succ_idx, node_dict, name2id)
+
+    @classmethod
+    def from_arrays(cls, names, succ_ptr, succ_idx, node_dict=None, name2id=None):
+        ### names are the graph nodes in id order; names that are only in node_dict,
+        ### or only a father, are appended after them without edges
+        if node_dict is None:
+            node_dict = {}
+        if name2id is None:
+            name2id = {n: i for i, n in enumerate(names)}
+        num_graph = len(names)
+        for n in node_dict:
+            if n not in name2id:
+                name2id[n] = len(names)
+                names.append(n)
+        for node in list(node_dict.values()):
+            if node.father is not None and node.father not in name2id:
+                name2id[node.father] = len(names)
+                names.append(node.father)
+
+        num = len(names)
+        succ_ptr = np.concatenate([succ_ptr, np.full(num - num_graph, succ_ptr[-1], dtype=np.int64)])
+
+        columns = {
+            'type': np.full(num, -1, dtype=np.int8),
+            'width': np.full(num, -1, dtype=np.int32),
+            'father': np.full(num, -1, dtype=np.int32),
+            'op': np.full(num, -1, dtype=np.int8),
+            'delay': np.full(num, np.nan),
+            'tr': np.full(num, np.nan),
+            't1': np.full(num, np.nan),
+            'fanout': np.full(num, -1, dtype=np.int32),
+            'in_graph': np.arange(num) < num_graph,
+        }
+        for name, node in node_dict.items():
+            i = name2id[name]
+            if node.type not in TYPE_ID:
+                raise ValueError('unknown node type %s of %s' % (node.type, name))
+            columns['type'][i] = TYPE_ID[node.type]
+            if node.width is not None:
+                columns['width'][i] = node.width
+            if node.father is not None:
+                columns['father'][i] = name2id[node.father]
+            if node.type in OP_TYPES:
+                columns['op'][i] = get_op_id(node)
+            delay = getattr(node, 'delay', None)
+            if delay is not None:
+                columns['delay'][i] = delay
+            tr = getattr(node, 'tr', None)
+            if tr is not None:
+                columns['tr'][i] = tr
+            t1 = getattr(node, 't1', None)
+            if t1 is not None:
+                columns['t1'][i] = t1
+            fanout = getattr(node, 'fanout', None)
+            if fanout is not None:
+                columns['fanout'][i] = fanout
+        return cls(names, succ_ptr, succ_idx, columns)
+
+    def __len__(self):
+        return self.num_nodes
+
+    def successors(self, i):
+        return self.succ_idx[self.succ_ptr[i]:self.succ_ptr[i + 1]]
+
+    def predecessors(self, i):
+        return self.pred_idx[self.pred_ptr[i]:self.pred_ptr[i + 1]]
+
+    def has_node(self, name):
+        i = self.name2id.get(name)
+        return i is not None and bool(self.in_graph[i])
+
+    def out_degree(self):
+        if 'out_degree' not in self._cache:
+            self._cache['out_degree'] = np.diff(self.succ_ptr)
+        return self._cache['out_degree']
+
+    def in_degree(self):
+        if 'in_degree' not in self._cache:
+            self._cache['in_degree'] = np.diff(self.pred_ptr)
+        return self._cache['in_degree']
+
+    @staticmethod
+    def gather(ptr, idx, nodes):
+        ### concatenated neighbour lists of nodes, in order
+        start = ptr[nodes]
+        count = ptr[nodes + 1] - start
+        offset = np.repeat(start - np.cumsum(count) + count, count)
+        return idx[offset + np.arange(len(offset))]
+
+    def levels(self):
+        ### Kahn's algorithm one generation at a time, children in the order they
+        ### become ready: every user of a node is in an earlier generation, and
+        ### the generations joined are the same order as nx.topological_sort
+        if 'levels' not in self._cache:
+            indeg = self.in_degree().copy()
+            last = np.full(self.num_nodes, -1, dtype=np.int64)
+            frontier = np.flatnonzero((indeg == 0) & self.in_graph)
+            levels = []
+            while len(frontier):
+                levels.append(frontier)
+                child = self.gather(self.succ_ptr, self.succ_idx, frontier)
+                np.subtract.at(indeg, child, 1)
+                last[child] = -1
+                np.maximum.at(last, child, np.arange(len(child)))
+                ready = np.unique(child)
+                ready = ready[indeg[ready] == 0]
+                frontier = ready[np.argsort(last[ready], kind='stable')]
+            if sum(len(level) for level in levels) != np.count_nonzero(self.in_graph):
+                rest = self.in_graph.copy()
+                for level in levels:
+                    rest[level] = False
+                raise GraphLoopError([[self.names[i] for i in loop] for loop in self.loops(rest)])
+            self._cache['levels'] = levels
+        return self._cache['levels']
+
+    def topological_order(self):
+        if 'topo' not in self._cache:
+            levels = self.levels()
+            self._cache['topo'] = np.concatenate(levels) if levels else np.zeros(0, dtype=np.int64)
+        return self._cache['topo']
+
+    def loops(self, nodes=None):
+        ### strongly connected components (Tarjan, iterative) among the given node
+        ### mask, keeping the ones that form a loop: more than one node or a self loop
+        if nodes is None:
+            nodes = self.in_graph
+        ptr = self.succ_ptr
+        inside = set(np.flatnonzero(nodes).tolist())
+        def drivers(v):
+            return [w for w in self.succ_idx[ptr[v]:ptr[v + 1]].tolist() if w in inside]
+        index, low = {}, {}
+        stack, on_stack = [], set()
+        loops = []
+        for root in sorted(inside):
+            if root in index:
+                continue
+            index[root] = low[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(drivers(root)))]
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in index:
+                        index[w] = low[w] = len(index)
+                        stack.append(w)
+                        on_stack.add(w)
+                        work.append((w, iter(drivers(w))))
+                        break
+                    elif w in on_stack:
+                        low[v] = min(low[v], index[w])
+                else:
+                    work.pop()
+                    if work:
+                        u = work[-1][0]
+                        low[u] = min(low[u], low[v])
+                    if low[v] == index[v]:
+                        comp = []
+                        while True:
+                            w = stack.pop()
+                            on_stack.discard(w)
+                            comp.append(w)
+                            if w == v:
+                                break
+                        if len(comp) > 1 or v in drivers(v):
+                            loops.append(comp[::-1])
+        return loops
+
+    def type_mask(self, *types):
+        return np.isin(self.type, [TYPE_ID[t] for t in types])
+
+    def op_mask(self, *ops):
+        return np.isin(self.op, [OP_ID[op] for op in ops])
+
+    def to_node_dict(self):
+        node_dict = {}
+        for i in np.flatnonzero(self.type >= 0):
+            name = self.names[i]
+            width = int(self.width[i]) if self.width[i] >= 0 else None
+            father = self.names[self.father[i]] if self.father[i] >= 0 else None
+            op = int(self.op[i]) if self.op[i] >= 0 else None
+            node = Node(name, NODE_TYPES[self.type[i]], width, father, op)
+            if not np.isnan(self.tr[i]):
+                node.tr = float(self.tr[i])
+            if not np.isnan(self.t1[i]):
+                node.t1 = float(self.t1[i])
+            if not np.isnan(self.delay[i]):
+                node.delay = float(self.delay[i])
+            if self.fanout[i] >= 0:
+                node.fanout = int(self.fanout[i])
+            node_dict[name] = node
+        return node_dict
+
+    def to_dict_of_lists(self):
+        ### every node of the graph gets a key, as in nx.to_dict_of_lists
+        graph = defaultdict(list)
+        names = self.names
+        ptr = self.succ_ptr.tolist()
+        idx = self.succ_idx.tolist()
+        for i in np.flatnonzero(self.in_graph).tolist():
+            graph[names[i]] = [names[j] for j in idx[ptr[i]:ptr[i + 1]]]
+        return graph
+
+    def to_graph(self):
+        g = Graph()
+        g.init_graph(self.to_dict_of_lists(), self.to_node_dict())
+        return g
+
+
+def graph_handle(g, node_dict=None):
+    ### the CSRGraph and node_dict a stage works on, from a Graph or a CSRGraph
+    if isinstance(g, CSRGraph):
+        return g, g.to_node_dict() if node_dict is None else node_dict
+    return CSRGraph.from_graph(g), g.node_dict if node_dict is None else node_dict
@@ -8,8 +8,10 @@ from optparse import OptionParser
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import pyverilog
-from pyverilog.vparser.parser import parse
+from pyverilog.vparser.parser import parse, parse_modules
 from AST_analyzer import *
+from sog_reader import SOG_reader, SOGUnsupported
+from incremental import Incremental_builder, stale_outputs
 
 
 def main(design_name=None, cmd=None, out_path=None):
@@ -37,6 +39,20 @@ def main(design_name=None, cmd=None, out_path=None):
                          default=[], help="Design command")
     optparser.add_option("-O", dest="out_path", action="append",
                          default=[], help="Output path")
+    optparser.add_option("--cache", dest="cache_dir",
+                         default=None, help="AST cache directory")
+    optparser.add_option("--stream", action="store_true", dest="stream",
+                         default=False, help="Parse and convert one module at a time")
+    optparser.add_option("-j", "--jobs", dest="jobs", type="int",
+                         default=1, help="Parse modules in parallel with N processes")
+    optparser.add_option("--fast", action="store_true", dest="fast",
+                         default=False, help="Read Yosys SOG netlists without building the AST")
+    optparser.add_option("--format", dest="format", choices=["pkl", "csr", "both"],
+                         default="pkl", help="Output format: pkl (default), csr or both")
+    optparser.add_option("--incremental", action="store_true", dest="incremental",
+                         default=False, help="Rebuild only the modules changed since the last run")
+    optparser.add_option("--share", action="store_true", dest="share",
+                         default=False, help="Merge structurally identical operators and constants into one node")
     (options, args) = optparser.parse_args()
 
     if options.Name:
@@ -57,21 +73,67 @@ def main(design_name=None, cmd=None, out_path=None):
     if len(filelist) == 0:
         showVersion()
 
-
-    ast, directives = parse(filelist,
-                            preprocess_include=options.include,
-                            preprocess_define=options.define)
-    
-    print('Verilog2AST Finish!')
-    ast_analysis = AST_analyzer(ast)
-    
-    ast_analysis.AST2Graph(ast)
+    if options.share and options.incremental:
+        optparser.error("--share cannot be combined with --incremental")
+
+    if options.incremental:
+        inc = Incremental_builder(out_path + f'{design_name}_{cmd}.inc', options.include,
+                                  options.define, options.fast)
+        modules = inc.update(filelist)
+        outputs = {'pkl': [f'{design_name}_{cmd}.pkl'], 'csr': [f'{design_name}_{cmd}.csr'],
+                   'both': [f'{design_name}_{cmd}.pkl', f'{design_name}_{cmd}.csr']}[options.format]
+        if not inc.changed and not inc.removed and all(os.path.exists(out_path + o) for o in outputs):
+            print('No module changed, graph is up to date')
+            return
+        ast_analysis = inc.splice(modules)
+        print('Splice Finish!')
+        if not inc.first_run:
+            stale_outputs(os.path.dirname(os.path.normpath(out_path)), design_name, cmd,
+                          inc.changed + inc.removed)
+
+    fast = options.fast and not options.include and not options.define and not options.incremental
+    if fast:
+        ast_analysis = AST_analyzer(None, options.share)
+        try:
+            SOG_reader(ast_analysis).SOG2Graph(filelist)
+            print('SOG2Graph Finish!')
+        except SOGUnsupported as e:
+            print(e)
+            fast = False
+
+    if not fast and not options.incremental and options.stream:
+        modules = parse_modules(filelist,
+                                preprocess_include=options.include,
+                                preprocess_define=options.define)
+        ast_analysis = AST_analyzer(None, options.share)
+        ast_analysis.AST2Graph_stream(modules)
+        print('Verilog2AST Finish!')
+    elif not fast and not options.incremental:
+        ast, directives = parse(filelist,
+                                preprocess_include=options.include,
+                                preprocess_define=options.define,
+                                cache_dir=options.cache_dir,
+                                jobs=options.jobs)
+        
+        print('Verilog2AST Finish!')
+        ast_analysis = AST_analyzer(ast, options.share)
+        
+        ast_analysis.AST2Graph(ast)
 
     g = ast_analysis.graph
 
     # g.show_graph()
 
-    g.graph2pkl(design_name, cmd, out_path)
+    if options.format in ('pkl', 'both'):
+        g.graph2pkl(design_name, cmd, out_path)
+    if options.format == 'csr':
+        g.graph2csr(design_name, cmd, out_path)
+    elif options.format == 'both':
+        ### the pkl is written, a graph the csr format cannot hold only costs the csr
+        try:
+            g.graph2csr(design_name, cmd, out_path)
+        except ValueError as e:
+            print('Warning: no csr output:', e)
 
 
 if __name__ == '__main__':
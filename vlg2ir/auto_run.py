@@ -2,12 +2,16 @@ import os, time, json
 from multiprocessing import Pool
 
 
-def convert_one_design(design, cmd, output_dir):
+def convert_one_design(design, cmd, output_dir, incremental=False, fmt='pkl'):
     bench_path = f"../example/verilog/"
     design_dir = bench_path + design + '_' + cmd + '.v'
     print('Current Design: ', design)
     print('Current CMD: ', cmd)
-    os.system(f'python3 analyze.py {design_dir} -N {design} -C {cmd} -O {output_dir}')
+    ### --incremental re-parses only the modules edited since the last run
+    opt = ' --incremental' if incremental else ''
+    ### fmt='both' also writes the .csr directory the feature scripts map directly
+    opt += f' --format {fmt}' if fmt != 'pkl' else ''
+    os.system(f'python3 analyze.py {design_dir} -N {design} -C {cmd} -O {output_dir}{opt}')
 
     
 
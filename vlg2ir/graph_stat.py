@@ -1,4 +1,4 @@
-from DG import Graph
+from DG import Graph, CSRGraph, NODE_TYPES, OP_NAMES, OP_ID
 import json, re, os
 import numpy as np
 import networkx as nx
@@ -6,70 +6,59 @@ import networkx as nx
 cwd = os.getcwd()
 
 
-def cal_oper(g:Graph):
-        g_nx = nx.DiGraph(g.graph)
+def cal_oper(g):
+        if not isinstance(g, CSRGraph):
+            g = CSRGraph.from_graph(g)
         area_dict = "../../std_PPA.json"
         with open(area_dict, 'r') as f:
             std_data = json.load(f)
 
-        all_node = g.get_all_nodes2()
-        seq_set = set()
-        comb_set = set()
-        type_set = set()
-        seq_num, comb_num, io_num, fanout_sum = 0, 0, 0, 0
-        and_num, or_num, not_num, xor_num, mux_num= 0, 0, 0, 0, 0
-        seq_area, comb_area, stat_pwr, dyn_pwr = 0, 0, 0, 0
-        for name, node in g.node_dict.items():
-            if not g_nx.has_node(name):
-                continue
-            type = node.type
-            width = node.width
-            type_set.add(type)
-            # if type in ['Reg', 'Pointer', 'Partselect']:
-            if type in ['Reg']:
-                seq_set.add(name)
-                fanout_sum += g_nx.in_degree(name)
-                seq_num += width
-                seq_area += std_data['area_seq']['DFF']*width
-                stat_pwr += std_data['stat_pwr']['DFF']*width
-                dyn_pwr += std_data['dyn_pwr']['DFF']*width
-            elif type in ['Operator', 'UnaryOperator', 'Concat', 'Repeat']:
-                comb_set.add(name)
-                comb_num += width
-                op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', name)
-                op = op_temp[0][0]
-                if op in std_data['area_comb'].keys():
-                    comb_area += std_data['area_comb'][op]*width
-                    stat_pwr += std_data['stat_pwr'][op]*width
-                    dyn_pwr += std_data['dyn_pwr'][op]*width
-                else:
-                    print(op)
-                    assert False
-                
-                if op in ['And']:
-                      and_num += 1
-                elif op in ['Or']:
-                      or_num += 1
-                elif op in ['Ulnot', 'Unot']:
-                      not_num += 1
-                elif op in ['Xor']:
-                      xor_num += 1
-                elif op in ['Cond', 'Mux']:
-                      mux_num += 1
-
-            elif type in ['Output', 'Input', 'Inout']:
-                  io_num += width
-            elif type in ['Constant', 'Wire', 'Partselect', 'Pointer', 'Inout']:
-                pass
+        in_g = g.in_graph & (g.type >= 0)
+        width = g.width.astype(np.int64)
+        seq = in_g & g.type_mask('Reg')
+        comb = in_g & g.type_mask('Operator', 'UnaryOperator', 'Concat', 'Repeat')
+        io = in_g & g.type_mask('Output', 'Input', 'Inout')
+        other = in_g & ~(seq | comb | io | g.type_mask('Constant', 'Wire', 'Partselect', 'Pointer'))
+        if other.any():
+            print(NODE_TYPES[g.type[np.flatnonzero(other)[0]]])
+            assert False
+        assert (width[seq | comb | io] >= 0).all()
+
+        seq_num = int(width[seq].sum())
+        fanout_sum = int(g.in_degree()[seq].sum())
+        io_num = int(width[io].sum())
+        seq_area = std_data['area_seq']['DFF']*seq_num
+        stat_pwr = std_data['stat_pwr']['DFF']*seq_num
+        dyn_pwr = std_data['dyn_pwr']['DFF']*seq_num
+
+        op = g.op[comb]
+        if (op < 0).any():
+            print(None)
+            assert False
+        op_num = np.bincount(op, minlength=len(OP_NAMES))
+        op_width = np.bincount(op, weights=width[comb], minlength=len(OP_NAMES))
+        comb_area = 0
+        for i in np.flatnonzero(op_num):
+            op = OP_NAMES[i]
+            if op in std_data['area_comb'].keys():
+                comb_area += std_data['area_comb'][op]*op_width[i]
+                stat_pwr += std_data['stat_pwr'][op]*op_width[i]
+                dyn_pwr += std_data['dyn_pwr'][op]*op_width[i]
             else:
-                print(type)
+                print(op)
                 assert False
+        and_num = int(op_num[OP_ID['And']])
+        or_num = int(op_num[OP_ID['Or']])
+        not_num = int(op_num[OP_ID['Ulnot']] + op_num[OP_ID['Unot']])
+        xor_num = int(op_num[OP_ID['Xor']])
+        mux_num = int(op_num[OP_ID['Cond']] + op_num[OP_ID['Mux']])
+
         #----- comb area -------
-        seq_area = round(seq_area, 0)
-        comb_area = round(comb_area, 0)
+        seq_area = round(float(seq_area), 0)
+        comb_area = round(float(comb_area), 0)
         total_area = seq_area+comb_area
-        stat_pwr = round(stat_pwr, 0)
-        dyn_pwr = round(dyn_pwr, 0)
+        stat_pwr = round(float(stat_pwr), 0)
+        dyn_pwr = round(float(dyn_pwr), 0)
         total_pwr = stat_pwr + dyn_pwr
         print('f0: #. DFF bits: %d\nf1: #. fanout: %d\nf2: #. IO bits: %d\nf3: #. AND: %d' %(seq_num, fanout_sum, io_num, and_num))
         print('f4: #. OR: %d\nf5: #. NOT: %d\nf6: #. XOR: %d\nf7: #. MUX: %d' %(or_num, not_num, xor_num, mux_num))
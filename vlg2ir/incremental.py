@@ -0,0 +1,160 @@
+import os, re, json, glob, pickle, hashlib
+from pyverilog.vparser.parser import VerilogParser, split_modules
+from pyverilog.vparser.preprocessor import VerilogPreprocessor
+from AST_analyzer import *
+from sog_reader import SOG_reader
+
+### Incremental AST2Graph: every module is traversed on its own into a raw
+### (pre build_graph) record, cached under the fingerprint of its source text.
+### On a rerun only modules whose fingerprint changed are parsed and traversed
+### again. The graph itself is still built in full: the cached records of all
+### modules are concatenated in source order ("spliced"), shifting the
+### Operator/Constant labels of each module by the labels used before it, and
+### build_graph (widths, wire elimination, parent edges) runs over the whole
+### design, so the result is the graph a full run over the same files builds.
+### Records of the SOG reader (--fast) and of the full parser are kept under
+### different keys.
+
+INC_VERSION = 1
+
+_noise = re.compile(r'/\*.*?\*/|//[^\n]*', re.S)
+_module_name = re.compile(r'\b(?:module|macromodule)\s+([a-zA-Z_][a-zA-Z_0-9$]*|\\\S+)')
+_label = re.compile(r'(.*?)([0-9]+)$')
+
+
+def fingerprint(text):
+    ### comments and layout do not change the graph
+    text = ' '.join(_noise.sub(' ', text).split())
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+class Incremental_builder(object):
+    def __init__(self, cache_dir, include=None, define=None, fast=False):
+        self.cache_dir = cache_dir
+        self.include = include
+        self.define = define
+        self.fast = fast
+        self.parser = None
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self.changed = []
+        self.removed = []
+        self.first_run = True
+
+    def load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get('version') != INC_VERSION:
+            return {}
+        return manifest
+
+    def save_manifest(self, modules):
+        manifest = {'version': INC_VERSION, 'fast': self.fast, 'modules': modules}
+        with open(self.manifest_path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(self.manifest_path + '.tmp', self.manifest_path)
+
+    def split(self, filelist):
+        pp = VerilogPreprocessor(filelist, include=self.include, define=self.define)
+        for lineno, chunk in split_modules(pp.preprocess_lines()):
+            m = _module_name.search(_noise.sub(' ', chunk))
+            name = m.group(1) if m else 'module_%d' % lineno
+            yield name, chunk
+
+    def record_key(self, chunk):
+        return fingerprint(chunk) + ('.sog' if self.fast else '.ast')
+
+    def record_path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def build_module(self, chunk):
+        ### raw graph of one module, before widths, wire elimination and parent edges
+        analyzer = AST_analyzer(None)
+        if self.fast:
+            reader = SOG_reader(analyzer)
+            reader.read_module(chunk)
+            reader.flush()
+        else:
+            if not self.parser:
+                self.parser = VerilogParser(debug=False)
+            ast = self.parser.parse(chunk)
+            for definition in ast.description.definitions:
+                analyzer.traverse_AST(definition)
+        g = analyzer.graph
+        return {'graph': dict(g.graph), 'node_dict': g.node_dict, 'wire_set': analyzer.wire_set,
+                'oper_label': analyzer.oper_label, 'const_label': analyzer.const_label}
+
+    def update(self, filelist):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        manifest = self.load_manifest()
+        ### without an earlier manifest there is no earlier graph to compare with
+        self.first_run = not manifest
+        old = {m['name']: m['key'] for m in manifest.get('modules', [])}
+        modules = []
+        for name, chunk in self.split(filelist):
+            key = self.record_key(chunk)
+            if not os.path.exists(self.record_path(key)):
+                with open(self.record_path(key), 'wb') as f:
+                    pickle.dump(self.build_module(chunk), f)
+            if old.get(name) != key:
+                self.changed.append(name)
+            modules.append({'name': name, 'key': key})
+        names = {m['name'] for m in modules}
+        self.removed = [name for name in old if name not in names]
+        keys = {m['key'] for m in modules}
+        for path in glob.glob(os.path.join(self.cache_dir, '*.pkl')):
+            if os.path.basename(path)[:-4] not in keys:
+                os.remove(path)
+        self.save_manifest(modules)
+        print('Incremental: %d modules, %d rebuilt, %d removed'
+              % (len(modules), len(self.changed), len(self.removed)))
+        return modules
+
+    def splice(self, modules):
+        analyzer = AST_analyzer(None)
+        g = analyzer.graph
+        for m in modules:
+            with open(self.record_path(m['key']), 'rb') as f:
+                rec = pickle.load(f)
+            rename = {}
+            if analyzer.oper_label or analyzer.const_label:
+                for name, node in rec['node_dict'].items():
+                    if node.op is not None:
+                        offset = analyzer.oper_label
+                    elif node.type == 'Constant':
+                        offset = analyzer.const_label
+                    else:
+                        continue
+                    kind, num = _label.match(name).groups()
+                    rename[name] = kind + str(int(num) + offset)
+            for name, node in rec['node_dict'].items():
+                if name in rename:
+                    node.name = name = rename[name]
+                if node.father in rename:
+                    node.father = rename[node.father]
+                g.node_dict[name] = node
+            for u, node_list in rec['graph'].items():
+                g.graph[rename.get(u, u)].extend(rename.get(v, v) for v in node_list)
+            analyzer.wire_set |= {rename.get(w, w) for w in rec['wire_set']}
+            analyzer.oper_label += rec['oper_label']
+            analyzer.const_label += rec['const_label']
+        analyzer.build_graph()
+        return analyzer
+
+
+def stale_outputs(example_dir, design_name, cmd, modules):
+    ### list the cached stages computed from the old graph: the design level
+    ### timing DAG and feature vectors, and the power DAGs of the given modules.
+    ### Nothing is deleted, these may be shipped results the downstream
+    ### pipeline has to regenerate.
+    patterns = [f'timing_dag/{design_name}_{cmd}*', f'feature/{design_name}_{cmd}_vec_*.json']
+    patterns += [f'power_dag/{module}_{cmd}_*' for module in modules]
+    stale = []
+    for pattern in patterns:
+        stale += sorted(glob.glob(os.path.join(example_dir, pattern)))
+    if stale:
+        print('Built from the old graph, regenerate or delete:')
+        for path in stale:
+            print('  ' + path)
+    return stale
@@ -1,4 +1,4 @@
-from DG import Graph
+from DG import Graph, get_op, graph_handle
 import re, json
 from multiprocessing import Pool
 from collections import defaultdict
@@ -7,6 +7,8 @@ import numpy as np
 from graph_stat import cal_timing_type
 
 class subNode:
+    __slots__ = ('name', 'type', 'width', 'delay')
+
     def __init__(self, name, type, width:None, delay:None):
         self.name = name
         self.type = type
@@ -48,8 +50,7 @@ def get_path_feature(path, path_delay, node_dict):
         node = node_dict[node_name]
         node_type = node.type
         if node_type in ['Operator', 'Mux', 'UnaryOperator']:
-            op_temp = re.findall(r'([A-Z][a-z]*)(\d+)', node.name)
-            op = op_temp[0][0]
+            op = get_op(node)
             if op in ['Mux', 'Cond']:
                 num_mux += 1
             elif op in ['And']:
@@ -67,15 +68,60 @@ def get_path_feature(path, path_delay, node_dict):
 
     return path_arr
 
+def strip_pin(name):
+    name = re.sub(r'_CK_$', '', name)
+    return re.sub(r'_Q_$', '', name)
+
 class ProcessGraph:
-    def __init__(self, g:Graph):
+    def __init__(self, g, node_dict=None):
         self.g = g
-
-    def Graph_STA(self, rfr, design_name):
-        g_nx = nx.DiGraph(self.g.graph)
-        topo_sort = list(nx.topological_sort(g_nx))
-        for idx, n in enumerate(topo_sort):
-            if '_CK_' in n:
+        self.csr, self.node_dict = graph_handle(g, node_dict)
+
+    def arrival_times(self, start):
+        ### longest path arrival times from the start nodes, one Kahn generation
+        ### at a time: a node gets its own delay plus the latest arrival among
+        ### its users, and a back-pointer to that user (the earliest one in
+        ### topological order on a tie, -1 at a start). Nodes no start reaches
+        ### keep AT = -inf.
+        csr = self.csr
+        delay = np.nan_to_num(csr.delay)
+        AT = np.full(csr.num_nodes, -np.inf)
+        back = np.full(csr.num_nodes, -1, dtype=np.int64)
+        pos = np.zeros(csr.num_nodes, dtype=np.int64)
+        topo = csr.topological_order()
+        pos[topo] = np.arange(len(topo))
+        for level in csr.levels():
+            count = csr.pred_ptr[level + 1] - csr.pred_ptr[level]
+            users = csr.gather(csr.pred_ptr, csr.pred_idx, level)
+            if len(users):
+                has = count > 0
+                seg = np.repeat(np.arange(len(level)), count)
+                at = AT[users]
+                best = np.full(len(level), -np.inf)
+                best[has] = np.maximum.reduceat(at, (np.cumsum(count) - count)[has])
+                cand = np.flatnonzero((at == best[seg]) & np.isfinite(at))
+                cand = cand[np.lexsort((pos[users[cand]], seg[cand]))]
+                first_seg, first = np.unique(seg[cand], return_index=True)
+                back[level[first_seg]] = users[cand[first]]
+                reached = level[np.isfinite(best)]
+                AT[reached] = best[np.isfinite(best)] + delay[reached]
+            s = level[start[level]]
+            AT[s] = delay[s]
+            back[s] = -1
+        return AT, back
+
+    def legacy_paths(self):
+        ### the original path propagation through Node.update_AT, which the
+        ### shipped timing features and models were computed with: every node
+        ### not yet reached is a start, and a later user with a later arrival
+        ### replaces the path without adding the node's own delay
+        node_dict = self.node_dict
+        names = self.csr.names
+        succ_ptr = self.csr.succ_ptr.tolist()
+        succ_idx = self.csr.succ_idx.tolist()
+        topo_sort = self.csr.topological_order().tolist()
+        for idx, i in enumerate(topo_sort):
+            if '_CK_' in names[i]:
                 starti = idx
                 break
         topo_sort = topo_sort[starti:]
@@ -83,30 +129,64 @@ class ProcessGraph:
         start_set, end_set = set(), set()
 
         visited_set = set()
-        for node in topo_sort:
+        for i in topo_sort:
+            node = names[i]
             if '_CK_' in node:
                 start_set.add(node)
-                self.g.node_dict[node].AT = self.g.node_dict[node].delay
-                self.g.node_dict[node].path = [node]
+                node_dict[node].AT = node_dict[node].delay
+                node_dict[node].path = [node]
             elif '_Q_' in node:
                 end_set.add(node)
             
-            if not hasattr(self.g.node_dict[node], 'AT'):
-                self.g.node_dict[node].AT = self.g.node_dict[node].delay
-                self.g.node_dict[node].path = [node]
+            if not hasattr(node_dict[node], 'AT'):
+                node_dict[node].AT = node_dict[node].delay
+                node_dict[node].path = [node]
                 
 
-            for successor in g_nx.successors(node):
+            for j in succ_idx[succ_ptr[i]:succ_ptr[i + 1]]:
+                successor = names[j]
                 visited = False if successor not in visited_set else True
-                self.g.node_dict[successor].update_AT(self.g.node_dict[node].AT, self.g.node_dict[node].path, visited)
+                node_dict[successor].update_AT(node_dict[node].AT, node_dict[node].path, visited)
                 visited_set.add(successor)
-        path_dict, AT_dict, feat_vec_dict = {}, {}, {}
+        feat_vec_dict = {}
 
         for n in end_set:
-            pair, path, AT = self.g.node_dict[n].finish_AT()
-            path_dict[pair] = path
-            feat_vec_dict[pair] = get_path_feature(path, AT, self.g.node_dict)
-
+            pair, path, AT = node_dict[n].finish_AT()
+            feat_vec_dict[pair] = get_path_feature(path, AT, node_dict)
+        return feat_vec_dict
+
+    def critical_paths(self):
+        ### timing paths run from a register D side (_CK_) to a register Q side
+        ### (_Q_); only the latest arrival and its predecessor are propagated, and
+        ### the critical path is rebuilt for the endpoints alone
+        node_dict = self.node_dict
+        names = self.csr.names
+        is_start = np.array(['_CK_' in n for n in names], dtype=bool)
+        is_end = np.array(['_Q_' in n for n in names], dtype=bool) & ~is_start
+        is_start &= self.csr.in_graph
+        is_end &= self.csr.in_graph
+        AT, back = self.arrival_times(is_start)
+        back = back.tolist()
+
+        feat_vec_dict = {}
+        for i in np.flatnonzero(is_end & np.isfinite(AT)).tolist():
+            path = []
+            j = i
+            while j >= 0:
+                path.append(names[j])
+                j = back[j]
+            path.reverse()
+            pair = (strip_pin(path[-1]), strip_pin(path[0]))
+            feat_vec_dict[pair] = get_path_feature(path, float(AT[i]), node_dict)
+        return feat_vec_dict
+
+    def Graph_STA(self, rfr, design_name, exact=False, suffix=''):
+        ### the default is the legacy path copying propagation the shipped models
+        ### expect, at its old speed; only exact=True runs the level-wise engine
+        ### (critical_paths), with true longest paths from the _CK_ nodes.
+        ### suffix tells the slack list of another delay model or mode apart
+        feat_vec_dict = self.critical_paths() if exact else self.legacy_paths()
+        AT_dict = {}
 
         if len(feat_vec_dict) == 0:
             return
@@ -124,7 +204,7 @@ class ProcessGraph:
         pred_slack_lst = list(pred_slack_lst)
         # print(len(pred_slack_lst))
 
-        with open(f'./pred_slack_lst/{design_name}_rf.json', 'w') as f:
+        with open(f'./pred_slack_lst/{design_name}_rf{suffix}.json', 'w') as f:
             json.dump(pred_slack_lst, f)
  
         L_PATH_NUM = 100
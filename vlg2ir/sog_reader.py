@@ -0,0 +1,570 @@
+import io, re
+from pyverilog.vparser.parser import VerilogParser, split_modules
+from pyverilog.vparser.lexer import VerilogLexer
+from AST_analyzer import *
+
+### Fast reader for the Verilog subset written by Yosys write_verilog after
+### bit-blasting (SOG): one declaration, `assign` or `always @(edge clk)`
+### per item, single operator per expression. Recognised items are turned
+### into graph edges directly, exactly as AST_analyzer would do it from the
+### AST (same node names, same label order). Anything else is handed to the
+### full pyverilog parser, in order, so the result is always the same graph.
+
+L = VerilogLexer
+_const = '|'.join([L.signed_bin_number, L.bin_number, L.signed_octal_number, L.octal_number,
+                   L.signed_hex_number, L.hex_number, L.signed_decimal_number, L.decimal_number])
+_token = re.compile(r'\s*(?:(?P<const>%s)|(?P<id>[a-zA-Z_][a-zA-Z_0-9$]*|\\\S+)|(?P<op><=|[\[\]:;?~!&|^{},=()@]))' % _const)
+_space = re.compile(r'\s*')
+_dec = re.compile(r'[0-9]+$')
+_header = re.compile(r'(?:\s|/\*.*?\*/|//[^\n]*|\(\*.*?\*\))*module\s+([a-zA-Z_][a-zA-Z_0-9$]*|\\\S+)\s*'
+                     r'(?:\(\s*(?:(?:[a-zA-Z_][a-zA-Z_0-9$]*|\\\S+)\s*,\s*)*(?:[a-zA-Z_][a-zA-Z_0-9$]*|\\\S+)?\s*\))?\s*;', re.S)
+_item_start = re.compile(r'\s*(?:\(\*|(?:input|output|inout|wire|reg|assign|always|initial|function|task|generate|'
+                         r'localparam|parameter|integer|genvar|real|tri|supply0|supply1|specify)\b)')
+_block_start = re.compile(r'\s*(function|task|generate|specify)\b')
+_reserved = L.reserved
+
+### whole-item patterns for the common one-line forms, tried before tokenizing
+_id = r'(?:[a-zA-Z_][a-zA-Z_0-9$]*|\\\S+(?=\s|$))'
+_opnd = r'(?:%s(?:\s*\[\s*[0-9]+\s*(?::\s*[0-9]+\s*)?\])?|%s)' % (_id, _const)
+_expr = (r'(?P<un>[~!])?\s*(?P<a>%s)(?:\s*(?P<bin>[&|^])\s*(?P<b>%s)|\s*\?\s*(?P<t>%s)\s*:\s*(?P<f>%s))?\s*;\s*$'
+         % (_opnd, _opnd, _opnd, _opnd))
+_operand = re.compile(r'(?:(?P<id>%s)(?:\s*\[\s*(?P<msb>[0-9]+)\s*(?::\s*(?P<lsb>[0-9]+)\s*)?\])?|(?P<const>%s))$'
+                      % (_id, _const))
+_fast_decl = re.compile(r'\s*(?P<type>input|output|inout|wire|reg)\s+(?:signed\b\s*)?'
+                        r'(?:\[\s*(?P<msb>[0-9]+)\s*:\s*(?P<lsb>[0-9]+)\s*\]\s*)?(?P<name>%s)\s*;\s*$' % _id)
+_fast_assign = re.compile(r'\s*assign\s+(?P<lhs>%s)\s*=\s*%s' % (_opnd, _expr))
+_fast_always = re.compile(r'\s*always\s*@\s*\(\s*(?:posedge|negedge)\s+(?P<clk>%s)\s*\)\s*(?P<lhs>%s)\s*<=\s*%s'
+                          % (_id, _opnd, _expr))
+
+_decl_type = {'input': 'Input', 'output': 'Output', 'inout': 'Inout', 'wire': 'Wire', 'reg': 'Reg'}
+_binop = {'&': 'And', '|': 'Or', '^': 'Xor'}
+_unop = {'~': 'Unot', '!': 'Ulnot'}
+
+
+class SOGUnsupported(Exception):
+    pass
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    end = len(text)
+    while True:
+        m = _token.match(text, pos)
+        if m is None:
+            if _space.match(text, pos).end() == end:
+                return tokens
+            return None
+        kind = m.lastgroup
+        value = m.group(kind)
+        if kind == 'id' and value in _reserved:
+            kind = 'kw'
+        tokens.append((kind, value))
+        pos = m.end()
+
+
+class _Items:
+    ### recursive-descent recogniser over one item's tokens, None if not in the subset
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def take(self, value):
+        if self.peek()[1] == value and self.peek()[0] in ('op', 'kw'):
+            self.pos += 1
+            return True
+        return False
+
+    def done(self):
+        return self.pos == len(self.tokens)
+
+    def dec(self):
+        kind, value = self.peek()
+        if kind == 'const' and _dec.match(value):
+            self.pos += 1
+            return value
+        return None
+
+    def ident(self):
+        kind, value = self.peek()
+        if kind == 'id':
+            self.pos += 1
+            return value
+        return None
+
+    def operand(self):
+        kind, value = self.peek()
+        if kind == 'const':
+            self.pos += 1
+            return ('const', value)
+        name = self.ident()
+        if name is None:
+            return None
+        if not self.take('['):
+            return ('id', name)
+        msb = self.dec()
+        if msb is None:
+            return None
+        if self.take(']'):
+            return ('ptr', name, msb)
+        if not self.take(':'):
+            return None
+        lsb = self.dec()
+        if lsb is None or not self.take(']'):
+            return None
+        return ('ps', name, msb, lsb)
+
+    def lvalue(self):
+        lhs = self.operand()
+        if lhs is None or lhs[0] == 'const':
+            return None
+        return lhs
+
+    def expr(self):
+        kind, value = self.peek()
+        if kind == 'op' and value in _unop:
+            self.pos += 1
+            right = self.operand()
+            return None if right is None else (_unop[value], [right])
+        if self.take('{'):
+            elems = []
+            while True:
+                elem = self.operand()
+                if elem is None:
+                    return None
+                elems.append(elem)
+                if self.take('}'):
+                    return ('Concat', elems)
+                if not self.take(','):
+                    return None
+        left = self.operand()
+        if left is None:
+            return None
+        kind, value = self.peek()
+        if kind == 'op' and value in _binop:
+            self.pos += 1
+            right = self.operand()
+            return None if right is None else (_binop[value], [left, right])
+        if self.take('?'):
+            true_value = self.operand()
+            if true_value is None or not self.take(':'):
+                return None
+            false_value = self.operand()
+            return None if false_value is None else ('Cond', [left, true_value, false_value])
+        return left
+
+    def substitution(self, op):
+        lhs = self.lvalue()
+        if lhs is None or not self.take(op):
+            return None
+        rhs = self.expr()
+        if rhs is None or not self.take(';'):
+            return None
+        return (lhs, rhs)
+
+    def statement(self):
+        if not self.take('if'):
+            sub = self.substitution('<=')
+            return None if sub is None else ('nbs',) + sub
+        if not self.take('('):
+            return None
+        kind, value = self.peek()
+        if kind == 'op' and value in _unop:
+            self.pos += 1
+            right = self.operand()
+            cond = None if right is None else (_unop[value], [right])
+        else:
+            cond = self.operand()
+        if cond is None or not self.take(')'):
+            return None
+        ts = self.statement()
+        if ts is None:
+            return None
+        fs = None
+        if self.take('else'):
+            fs = self.statement()
+            if fs is None:
+                return None
+        return ('if', cond, ts, fs)
+
+    def item(self):
+        kind, value = self.peek()
+        if kind != 'kw':
+            return None
+        self.pos += 1
+        if value in _decl_type:
+            self.take('signed')
+            width = None
+            if self.take('['):
+                msb = self.dec()
+                if msb is None or not self.take(':'):
+                    return None
+                lsb = self.dec()
+                if lsb is None or not self.take(']'):
+                    return None
+                width = (msb, lsb)
+            name = self.ident()
+            if name is None or not self.take(';'):
+                return None
+            return ('decl', _decl_type[value], name, width)
+        if value == 'assign':
+            sub = self.substitution('=')
+            return None if sub is None else ('assign', sub)
+        if value == 'always':
+            if not (self.take('@') and self.take('(')):
+                return None
+            if not (self.take('posedge') or self.take('negedge')):
+                return None
+            if self.ident() is None or not self.take(')'):
+                return None
+            stmt = self.statement()
+            return None if stmt is None else ('always', stmt)
+        return None
+
+
+_operand_memo = {}
+
+def _fast_operand(text):
+    if text in _operand_memo:
+        return _operand_memo[text]
+    m = _operand.match(text)
+    if m.group('const') is not None:
+        expr = ('const', text)
+    elif m.group('id') in _reserved:
+        expr = None
+    elif m.group('msb') is None:
+        expr = ('id', m.group('id'))
+    elif m.group('lsb') is None:
+        expr = ('ptr', m.group('id'), m.group('msb'))
+    else:
+        expr = ('ps', m.group('id'), m.group('msb'), m.group('lsb'))
+    _operand_memo[text] = expr
+    return expr
+
+
+def _fast_sub(m):
+    lhs = _fast_operand(m.group('lhs'))
+    a = _fast_operand(m.group('a'))
+    if lhs is None or lhs[0] == 'const' or a is None:
+        return None
+    if m.group('bin'):
+        b = _fast_operand(m.group('b'))
+        rhs = None if b is None else (_binop[m.group('bin')], [a, b])
+    elif m.group('t'):
+        t = _fast_operand(m.group('t'))
+        f = _fast_operand(m.group('f'))
+        rhs = None if t is None or f is None else ('Cond', [a, t, f])
+    else:
+        rhs = a
+    if m.group('un'):
+        rhs = None if rhs is not a else (_unop[m.group('un')], [a])
+    return None if rhs is None else (lhs, rhs)
+
+
+def recognise_fast(text):
+    m = _fast_decl.match(text)
+    if m:
+        name = m.group('name')
+        if name in _reserved:
+            return None
+        width = (m.group('msb'), m.group('lsb')) if m.group('msb') else None
+        return ('decl', _decl_type[m.group('type')], name, width)
+    m = _fast_assign.match(text)
+    if m:
+        sub = _fast_sub(m)
+        return None if sub is None else ('assign', sub)
+    m = _fast_always.match(text)
+    if m:
+        sub = _fast_sub(m)
+        if sub is None or m.group('clk') in _reserved:
+            return None
+        return ('always', ('nbs',) + sub)
+    return None
+
+
+def recognise(text):
+    item = recognise_fast(text)
+    if item is not None:
+        return item
+    tokens = tokenize(text)
+    if not tokens:
+        return None
+    items = _Items(tokens)
+    try:
+        item = items.item()
+    except RecursionError:
+        ### nested too deep for the recursive descent, the full parser takes it
+        return None
+    if item is None or not items.done():
+        return None
+    return item
+
+
+def no_directives(lines, f):
+    for line in lines:
+        if '`' in line:
+            raise SOGUnsupported(f + ': compiler directives need the full parser')
+        yield line
+
+
+class SOG_reader(object):
+    def __init__(self, analyzer=None):
+        self.analyzer = analyzer if analyzer else AST_analyzer(None)
+        self.graph = self.analyzer.graph
+        self.parser = None
+        self.pending = []
+        self.fast_num = 0
+        self.fallback_num = 0
+
+    def SOG2Graph(self, filelist):
+        ### a compiler directive stops the read half way, the caller starts over
+        ### with the full parser on a new analyzer
+        for f in filelist:
+            with open(f) as fp:
+                for lineno, chunk in split_modules(no_directives(fp, f)):
+                    self.read_module(chunk)
+        print('SOG fast path: %d items, fallback: %d items' % (self.fast_num, self.fallback_num))
+        self.analyzer.build_graph()
+        return self.analyzer.graph
+
+    def get_parser(self):
+        if not self.parser:
+            self.parser = VerilogParser(debug=False)
+        return self.parser
+
+    def read_module(self, chunk):
+        m = _header.match(chunk)
+        if not m:
+            ast = self.get_parser().parse(chunk)
+            for definition in ast.description.definitions:
+                self.analyzer.traverse_AST(definition)
+            return
+        body = chunk[m.end():chunk.rindex('endmodule')]
+        for text in self.split_items(body):
+            item = recognise(text)
+            if item is not None:
+                self.flush()
+                if self.declared(item):
+                    self.emit(item)
+                    self.fast_num += 1
+                    continue
+            self.pending.append(text)
+        self.flush()
+
+    def split_items(self, body):
+        item = []
+        block = None
+        for line in io.StringIO(body):
+            if block:
+                item.append(line)
+                if re.match(r'\s*end' + block + r'\b', line):
+                    block = None
+                continue
+            if _item_start.match(line) and item:
+                text = ''.join(item)
+                if text.strip():
+                    yield text
+                item = []
+            m = _block_start.match(line)
+            if m:
+                block = m.group(1)
+            item.append(line)
+        if item and ''.join(item).strip():
+            yield ''.join(item)
+
+    def flush(self):
+        ### hand unrecognised items to the full parser, keeping the original order
+        if not self.pending:
+            return
+        text = 'module __sog_fallback__;\n' + ''.join(self.pending) + '\nendmodule\n'
+        ast = self.get_parser().parse(text)
+        for module in ast.description.definitions:
+            for item in module.items:
+                self.analyzer.traverse_AST(item)
+        self.fallback_num += len(self.pending)
+        self.pending = []
+
+    def declared(self, item):
+        ### items the AST path would reject (undeclared names, LHS mismatch) go to the full parser
+        node_dict = self.graph.node_dict
+        def ok(expr):
+            if expr[0] == 'id':
+                return expr[1] in node_dict
+            if expr[0] in ('ptr', 'ps', 'const'):
+                return True
+            return all(ok(c) for c in expr[1])
+        def stmt_ok(stmt):
+            if stmt[0] == 'nbs':
+                return ok(stmt[1]) and ok(stmt[2])
+            cond, ts, fs = stmt[1:]
+            if cond[0] == 'ps' and cond[1] not in node_dict:
+                return False
+            if cond[0] in _unop.values() and cond[1][0][0] == 'ps' and cond[1][0][1] not in node_dict:
+                return False
+            if not (ok(cond) and stmt_ok(ts)):
+                return False
+            if not fs:
+                return True
+            if not stmt_ok(fs):
+                return False
+            if fs[0] == 'nbs' and ts[0] == 'nbs' and ts != fs and ts[1] != fs[1]:
+                return False
+            return True
+        if item[0] == 'decl':
+            return True
+        if item[0] == 'assign':
+            return ok(item[1][0]) and ok(item[1][1])
+        try:
+            return stmt_ok(item[1])
+        except RecursionError:
+            return False
+
+    def emit(self, item):
+        a = self.analyzer
+        if item[0] == 'decl':
+            ntype, name, width = item[1:]
+            width = a.cal_width_num(*width) if width else 1
+            self.graph.add_decl_node(name, ntype, width, None)
+            if ntype == 'Wire':
+                a.wire_set.add(name)
+        elif item[0] == 'assign':
+            self.add_assign(item[1])
+        else:
+            self.traverse(item[1])
+
+    def traverse(self, stmt):
+        ### traverse_AST over a statement: the statement itself, then its branches
+        stack = [stmt]
+        while stack:
+            stmt = stack.pop()
+            self.add_assign_edge(stmt)
+            if stmt[0] == 'if':
+                if stmt[3]:
+                    stack.append(stmt[3])
+                stack.append(stmt[2])
+
+    def add_assign_edge(self, stmt):
+        run_frames(self.assign_edge_frame(stmt))
+
+    def assign_edge_frame(self, stmt):
+        a = self.analyzer
+        while stmt is not None:
+            if stmt[0] == 'nbs':
+                self.add_assign(stmt[1:])
+                return
+            cond, ts, fs = stmt[1:]
+            stmt = None
+            mux_name = 'Mux' + str(a.oper_label)
+            a.oper_label += 1
+            cond_width = self.get_node_width(cond)
+            self.graph.add_decl_node(mux_name, 'Operator', cond_width, None, OP_ID['Mux'])
+            if not fs:
+                yield self.stmt_frame(ts)
+            elif fs[0] != 'nbs':
+                self.assign(cond, mux_name)
+                LHS1 = yield self.stmt_frame(ts, mux_name)
+                self.graph.add_edge(LHS1, mux_name)
+            elif ts != fs and ts[0] == fs[0]:
+                self.assign(cond, mux_name)
+                yield self.stmt_frame(fs, mux_name)
+                LHS1 = yield self.stmt_frame(ts, mux_name)
+                self.graph.add_edge(LHS1, mux_name)
+            else:
+                stmt = fs
+
+    def stmt_frame(self, stmt, L=None):
+        if stmt[0] == 'if':
+            yield self.assign_edge_frame(stmt)
+            return None
+        return self.add_assign(stmt[1:], L)
+
+    def add_assign(self, sub, L=None):
+        LHS = self.add_new_node(sub[0])
+        self.assign(sub[1], L if L else LHS)
+        return LHS
+
+    def add_new_node(self, expr):
+        node_dict = self.graph.node_dict
+        if expr[0] == 'id':
+            return expr[1]
+        if expr[0] == 'ptr':
+            name, ptr = expr[1:]
+            node_name = name + '.PTR' + ptr
+            if node_name not in node_dict:
+                self.graph.add_decl_node(node_name, 'Pointer', 1, name)
+        else:
+            name, msb, lsb = expr[1:]
+            node_name = name + '.PS' + msb + '_' + lsb
+            if node_name not in node_dict:
+                self.graph.add_decl_node(node_name, 'Partselect', self.analyzer.cal_width_num(msb, lsb), name)
+        return node_name
+
+    def get_node_width(self, expr):
+        if expr[0] == 'id':
+            return self.graph.node_dict[expr[1]].width
+        if expr[0] == 'ptr':
+            return 1
+        if expr[0] == 'ps':
+            self.add_new_node(expr)
+            return self.graph.node_dict[expr[1]].width
+        if expr[0] == 'const':
+            return self.analyzer.get_width_num(expr[1])
+        return self.get_node_width(expr[1][0])
+
+    def assign(self, expr, parent_name):
+        a = self.analyzer
+        if a.share:
+            self.graph.add_edge(parent_name, self.assign_shared(expr))
+            return
+        kind = expr[0]
+        if kind == 'const':
+            node_name = 'Constant' + str(a.const_label)
+            a.const_label += 1
+            self.graph.add_decl_node(node_name, 'Constant', a.get_width_num(expr[1]))
+            self.graph.add_edge(parent_name, node_name)
+        elif kind in ('id', 'ptr', 'ps'):
+            self.graph.add_edge(parent_name, self.add_new_node(expr))
+        else:
+            node_name = kind + str(a.oper_label)
+            a.oper_label += 1
+            if kind == 'Concat':
+                self.graph.add_decl_node(node_name, 'Concat', 0, op=OP_ID['Concat'])
+            elif kind in _unop.values():
+                self.graph.add_decl_node(node_name, 'UnaryOperator', op=op_id(kind))
+            else:
+                self.graph.add_decl_node(node_name, 'Operator', op=op_id(kind))
+            self.graph.add_edge(parent_name, node_name)
+            for c in expr[1]:
+                self.assign(c, node_name)
+
+    def assign_shared(self, expr):
+        ### AST_analyzer.assign_shared over the reader's expression tuples
+        a = self.analyzer
+        out = []
+        stack = [(expr, False)]
+        while stack:
+            expr, done = stack.pop()
+            kind = expr[0]
+            if kind == 'const':
+                out.append(a.share_node(('Constant', expr[1]), 'Constant', a.get_width_num(expr[1])))
+            elif kind in ('id', 'ptr', 'ps'):
+                out.append(self.add_new_node(expr))
+            elif not done:
+                stack.append((expr, True))
+                stack.extend((c, False) for c in reversed(expr[1]))
+            else:
+                num = len(expr[1])
+                operands = tuple(out[len(out) - num:])
+                del out[len(out) - num:]
+                if kind == 'Concat':
+                    out.append(a.share_node((kind, operands), 'Concat', 0, OP_ID['Concat'], operands))
+                elif kind in _unop.values():
+                    out.append(a.share_node((kind, operands), 'UnaryOperator', None, op_id(kind), operands))
+                else:
+                    out.append(a.share_node((kind, operands), 'Operator', None, op_id(kind), operands))
+        return out[0]